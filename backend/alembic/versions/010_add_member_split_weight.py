@@ -0,0 +1,28 @@
+"""Add split_weight to household_members
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Relative share of shared expenses; 1 for everyone keeps the equal split
+    op.add_column(
+        'household_members',
+        sa.Column('split_weight', sa.Integer(), nullable=False, server_default='1')
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('household_members', 'split_weight')
@@ -0,0 +1,28 @@
+"""Add (household_id, month) index on monthly_settlements
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Covering index: cumulative balance queries are index-only scans
+    op.create_index(
+        'ix_monthly_settlements_household_month',
+        'monthly_settlements',
+        ['household_id', 'month', 'user_id', 'settlement_amount'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_monthly_settlements_household_month', table_name='monthly_settlements')
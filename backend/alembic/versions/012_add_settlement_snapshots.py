@@ -0,0 +1,35 @@
+"""Add settlement_snapshots table for finalized months
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'settlement_snapshots',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('household_id', sa.UUID(), nullable=False),
+        sa.Column('month', sa.String(7), nullable=False),
+        sa.Column('settlement', sa.JSON(), nullable=False),
+        sa.Column('summaries', sa.JSON(), nullable=False, server_default='{}'),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['household_id'], ['households.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('household_id', 'month', name='uq_settlement_snapshot_household_month'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('settlement_snapshots')
@@ -0,0 +1,29 @@
+"""Add sheet_checksum to external_data_sources
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Sheet version seen at the last import; already-synced rows are only
+    # re-scanned when it changes
+    op.add_column(
+        'external_data_sources',
+        sa.Column('sheet_checksum', sa.String(255), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('external_data_sources', 'sheet_checksum')
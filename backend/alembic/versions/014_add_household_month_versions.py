@@ -0,0 +1,36 @@
+"""Add households.base_version and household_month_versions
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Response cache keys: base_version covers writes that affect every month,
+    # household_month_versions the entry writes of a single month
+    op.add_column(
+        'households',
+        sa.Column('base_version', sa.Integer(), nullable=False, server_default='0')
+    )
+    op.create_table(
+        'household_month_versions',
+        sa.Column('household_id', sa.UUID(), sa.ForeignKey('households.id'), primary_key=True),
+        sa.Column('month', sa.String(7), primary_key=True),
+        sa.Column('version', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('household_month_versions')
+    op.drop_column('households', 'base_version')
@@ -1,8 +1,9 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.etag import check_not_modified
 from app.schemas.account import AccountCreate, AccountUpdate, AccountResponse
 from app.services.auth import get_current_user
 from app.services.household import get_user_household
@@ -14,6 +15,7 @@ from app.services.account import (
     update_account,
     delete_account,
 )
+from app.services.data_version import get_data_version
 from app.models import User
 
 router = APIRouter(prefix="/api/accounts", tags=["accounts"])
@@ -37,6 +39,8 @@ def get_account_response(account) -> AccountResponse:
 
 @router.get("", response_model=list[AccountResponse])
 def list_accounts(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -44,6 +48,18 @@ def list_accounts(
     household = get_user_household(db, current_user.id)
     household_id = household.id if household else None
 
+    if household_id:
+        not_modified = check_not_modified(
+            request,
+            response,
+            "accounts",
+            household_id,
+            get_data_version(db, household_id),
+            current_user.id,
+        )
+        if not_modified:
+            return not_modified
+
     accounts = get_accessible_accounts(db, current_user.id, household_id)
     return [get_account_response(a) for a in accounts]
 
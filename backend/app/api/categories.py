@@ -1,8 +1,9 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.etag import check_not_modified
 from app.schemas.category import (
     CategoryCreate,
     CategoryUpdate,
@@ -13,6 +14,7 @@ from app.schemas.category import (
 )
 from app.services.auth import get_current_user
 from app.services.household import get_user_household
+from app.services.data_version import get_data_version
 from app.models import User, Category, Subcategory
 
 router = APIRouter(prefix="/api/categories", tags=["categories"])
@@ -20,6 +22,8 @@ router = APIRouter(prefix="/api/categories", tags=["categories"])
 
 @router.get("", response_model=list[CategoryResponse])
 def list_categories(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -27,6 +31,17 @@ def list_categories(
     household = get_user_household(db, current_user.id)
     household_id = household.id if household else None
 
+    if household_id:
+        not_modified = check_not_modified(
+            request,
+            response,
+            "categories",
+            household_id,
+            get_data_version(db, household_id),
+        )
+        if not_modified:
+            return not_modified
+
     categories = (
         db.query(Category)
         .filter(
@@ -1,16 +1,28 @@
 from uuid import UUID
+from dataclasses import dataclass, asdict
 from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Body, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
 import math
 
-from app.core.database import get_db
-from app.schemas.entry import EntryCreate, EntryUpdate, EntryResponse, EntryListResponse
+from app.core.database import SessionLocal, get_db, get_async_db
+from app.core.etag import check_not_modified
+from app.schemas.entry import (
+    EntryCreate,
+    EntryUpdate,
+    EntryResponse,
+    EntryListResponse,
+    EntrySuggestion,
+)
 from app.schemas.category import CategoryResponse
-from app.services.auth import get_current_user
-from app.services.household import get_user_household
+from app.services.auth import get_current_user, get_current_user_async
+from app.services.household import get_user_household, get_user_household_async
 from app.services.entry import (
+    filter_entries,
+    order_entries,
     get_entries,
     get_entry_by_id,
     create_entry,
@@ -18,11 +30,27 @@ from app.services.entry import (
     delete_entry,
     get_categories,
 )
+from app.services.search import ensure_memo_index_async
+from app.services.suggest import suggest
+from app.services.export import EXPORT_FORMATS, check_export_format, export_entries
+from app.services.snapshot import get_finalized_months_for_dates
+from app.services.data_version import get_data_version
+from app.services.read_routing import route_reads_to_replica
 from app.models import User, Entry
 
 router = APIRouter(prefix="/api/entries", tags=["entries"])
 
 
+def ensure_months_open(db: Session, household_id: UUID, *dates: date | None) -> None:
+    """Reject writes to entries dated in a finalized settlement month"""
+    finalized = get_finalized_months_for_dates(db, household_id, dates)
+    if finalized:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Settlement for {', '.join(sorted(finalized))} is finalized. Reopen the month to edit its entries",
+        )
+
+
 def get_entry_response(entry, balance_after: int | None = None) -> EntryResponse:
     return EntryResponse(
         id=entry.id,
@@ -57,8 +85,35 @@ def get_entry_response(entry, balance_after: int | None = None) -> EntryResponse
     )
 
 
-@router.get("", response_model=EntryListResponse)
-def list_entries(
+@dataclass
+class EntryFilters:
+    """Validated list filters, named as filter_entries() arguments"""
+    month: str | None
+    date_from: date | None
+    date_to: date | None
+    date_preset: str | None
+    category_id: UUID | None
+    category_ids: list[UUID] | None
+    include_uncategorized: bool
+    payer_member_id: UUID | None
+    shared: bool | None
+    entry_type: str | None
+    entry_types: list[str] | None
+    transfer_type: str | None
+    account_ids: list[UUID] | None
+    amount_min: int | None
+    amount_max: int | None
+    memo_search: str | None
+    sort_by: str
+    sort_order: str
+
+    def filter_kwargs(self) -> dict:
+        kwargs = asdict(self)
+        del kwargs["sort_by"], kwargs["sort_order"]
+        return kwargs
+
+
+def entry_filters(
     month: str | None = Query(None, description="YYYY-MM format"),
     date_from: date | None = Query(None, description="Start date (YYYY-MM-DD)"),
     date_to: date | None = Query(None, description="End date (YYYY-MM-DD)"),
@@ -74,20 +129,10 @@ def list_entries(
     amount_min: int | None = Query(None, description="Minimum amount"),
     amount_max: int | None = Query(None, description="Maximum amount"),
     memo_search: str | None = Query(None, description="Search memo text"),
-    sort_by: str = Query("occurred_at", description="occurred_at | amount"),
+    sort_by: str = Query("occurred_at", description="occurred_at | amount | relevance (with memo_search)"),
     sort_order: str = Query("desc", description="asc | desc"),
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    household = get_user_household(db, current_user.id)
-    if not household:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="You don't belong to any household",
-        )
-
+) -> EntryFilters:
+    """Query parameters shared by the entry list and export"""
     # Parse account_ids
     parsed_account_ids = None
     if account_ids:
@@ -153,10 +198,10 @@ def list_entries(
         )
 
     # Validate sort_by
-    if sort_by not in ("occurred_at", "amount"):
+    if sort_by not in ("occurred_at", "amount", "relevance"):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="sort_by must be 'occurred_at' or 'amount'",
+            detail="sort_by must be 'occurred_at', 'amount', or 'relevance'",
         )
 
     # Validate sort_order
@@ -166,10 +211,7 @@ def list_entries(
             detail="sort_order must be 'asc' or 'desc'",
         )
 
-    entries, total_count, summary, balance_map = get_entries(
-        db,
-        household.id,
-        current_user_id=current_user.id,
+    return EntryFilters(
         month=month,
         date_from=date_from,
         date_to=date_to,
@@ -188,22 +230,74 @@ def list_entries(
         memo_search=memo_search,
         sort_by=sort_by,
         sort_order=sort_order,
-        page=page,
-        page_size=page_size,
     )
 
-    total_pages = math.ceil(total_count / page_size) if total_count > 0 else 1
-
-    return EntryListResponse(
-        entries=[get_entry_response(e, balance_map.get(e.id)) for e in entries],
-        total_count=total_count,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_prev=page > 1,
-        summary=summary,
+
+@router.get("", response_model=EntryListResponse)
+async def list_entries(
+    request: Request,
+    response: Response,
+    filters: EntryFilters = Depends(entry_filters),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    household = await get_user_household_async(db, current_user.id)
+    if not household:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="You don't belong to any household",
+        )
+
+    route_reads_to_replica(db, household.id)
+
+    # Presets are relative to today, so the date is part of the cache key
+    not_modified = check_not_modified(
+        request,
+        response,
+        "entries",
+        household.id,
+        await db.run_sync(get_data_version, household.id),
+        current_user.id,
+        date.today() if filters.date_preset else "",
+        sorted(request.query_params.multi_items()),
     )
+    if not_modified:
+        return not_modified
+
+    if filters.memo_search:
+        # Index building is CPU work; keep it out of run_sync below
+        await ensure_memo_index_async(db, household.id)
+
+    # Query and response building are sync ORM code (relationships are lazy
+    # loaded), so both run inside run_sync on the async connection
+    def load(sync_db: Session) -> EntryListResponse:
+        entries, total_count, summary, balance_map = get_entries(
+            sync_db,
+            household.id,
+            current_user_id=current_user.id,
+            **filters.filter_kwargs(),
+            sort_by=filters.sort_by,
+            sort_order=filters.sort_order,
+            page=page,
+            page_size=page_size,
+        )
+
+        total_pages = math.ceil(total_count / page_size) if total_count > 0 else 1
+
+        return EntryListResponse(
+            entries=[get_entry_response(e, balance_map.get(e.id)) for e in entries],
+            total_count=total_count,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+            has_next=page < total_pages,
+            has_prev=page > 1,
+            summary=summary,
+        )
+
+    return await db.run_sync(load)
 
 
 @router.post("", response_model=EntryResponse, status_code=status.HTTP_201_CREATED)
@@ -226,21 +320,99 @@ def create_new_entry(
             detail="Type must be 'expense', 'income', or 'transfer'",
         )
 
+    ensure_months_open(db, household.id, entry_data.date)
+
     entry = create_entry(db, entry_data, household.id, current_user.id)
     return get_entry_response(entry)
 
 
 @router.get("/categories", response_model=list[CategoryResponse])
 def list_categories(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     household = get_user_household(db, current_user.id)
     household_id = household.id if household else None
+    if household_id:
+        not_modified = check_not_modified(
+            request,
+            response,
+            "entry-categories",
+            household_id,
+            get_data_version(db, household_id),
+        )
+        if not_modified:
+            return not_modified
     categories = get_categories(db, household_id)
     return categories
 
 
+@router.get("/suggest", response_model=list[EntrySuggestion])
+def suggest_entries(
+    q: str = Query(..., min_length=1, max_length=100, description="Typed prefix"),
+    limit: int = Query(10, ge=1, le=20),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """메모/카테고리 자동완성 (빈도 + 최근 사용 순)"""
+    household = get_user_household(db, current_user.id)
+    if not household:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="You don't belong to any household",
+        )
+
+    return suggest(db, household.id, q, limit)
+
+
+@router.get("/export")
+def export_entries_file(
+    format: str = Query("csv", description="csv | xlsx | parquet"),
+    filters: EntryFilters = Depends(entry_filters),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """필터 조건의 거래 전체를 파일로 내려받기 (목록과 같은 필터/정렬)"""
+    household = get_user_household(db, current_user.id)
+    if not household:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="You don't belong to any household",
+        )
+
+    try:
+        check_export_format(format)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    household_id = household.id
+    user_id = current_user.id
+
+    # The request session is closed before the body is sent, so the stream
+    # opens its own and holds it (and the server-side cursor) until done
+    def stream():
+        export_db = SessionLocal()
+        try:
+            route_reads_to_replica(export_db, household_id)
+            query = filter_entries(export_db, household_id, current_user_id=user_id, **filters.filter_kwargs())
+            query = order_entries(export_db, query, filters.sort_by, filters.sort_order, filters.memo_search)
+            yield from export_entries(query, format)
+        finally:
+            export_db.close()
+
+    filename = f"entries-{date.today():%Y%m%d}.{format}"
+    return StreamingResponse(
+        stream(),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/{entry_id}", response_model=EntryResponse)
 def get_single_entry(
     entry_id: UUID,
@@ -292,6 +464,8 @@ def update_existing_entry(
             detail="Type must be 'expense', 'income', or 'transfer'",
         )
 
+    ensure_months_open(db, household.id, entry.date, entry_data.date)
+
     entry = update_entry(db, entry, entry_data)
     return get_entry_response(entry)
 
@@ -316,6 +490,8 @@ def bulk_delete_entries(
         Entry.household_id == household.id,
     ).all()
 
+    ensure_months_open(db, household.id, *(entry.date for entry in entries))
+
     deleted_count = 0
     for entry in entries:
         db.delete(entry)
@@ -345,5 +521,7 @@ def delete_existing_entry(
             detail="Entry not found",
         )
 
+    ensure_months_open(db, household.id, entry.date)
+
     delete_entry(db, entry)
     return {"message": "Entry deleted"}
@@ -1,8 +1,15 @@
+from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.schemas import HouseholdCreate, HouseholdJoin, HouseholdResponse, MemberResponse
+from app.schemas import (
+    HouseholdCreate,
+    HouseholdJoin,
+    HouseholdResponse,
+    MemberResponse,
+    MemberUpdate,
+)
 from app.services.auth import get_current_user
 from app.services.household import (
     get_user_household,
@@ -11,8 +18,9 @@ from app.services.household import (
     join_household,
     get_household_members,
     get_member_by_user_and_household,
+    update_member_split_weight,
 )
-from app.models import User
+from app.models import User, HouseholdMember
 
 router = APIRouter(prefix="/api/household", tags=["household"])
 
@@ -87,7 +95,52 @@ def get_members(
             user_name=m.user.name,
             user_email=m.user.email,
             role=m.role,
+            split_weight=m.split_weight,
             joined_at=m.joined_at,
         )
         for m in members
     ]
+
+
+@router.patch("/members/{member_id}", response_model=MemberResponse)
+def update_member(
+    member_id: UUID,
+    member_data: MemberUpdate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """멤버 분담 비율 수정 (owner만 가능)"""
+    household = get_user_household(db, current_user.id)
+    if not household:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="You don't belong to any household",
+        )
+
+    current_member = get_member_by_user_and_household(db, current_user.id, household.id)
+    if not current_member or current_member.role != "owner":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only the household owner can change split weights",
+        )
+
+    member = db.query(HouseholdMember).filter(
+        HouseholdMember.id == member_id,
+        HouseholdMember.household_id == household.id,
+    ).first()
+    if not member:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Member not found",
+        )
+
+    member = update_member_split_weight(db, member, member_data.split_weight)
+    return MemberResponse(
+        id=member.id,
+        user_id=member.user_id,
+        user_name=member.user.name,
+        user_email=member.user.email,
+        role=member.role,
+        split_weight=member.split_weight,
+        joined_at=member.joined_at,
+    )
@@ -1,22 +1,38 @@
+import re
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import datetime
 from pydantic import BaseModel
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
+from app.core.etag import check_not_modified
 from app.schemas.summary import SettlementResponse, MonthlySettlementRecord
-from app.services.auth import get_current_user
-from app.services.household import get_user_household
+from app.services.auth import get_current_user, get_current_user_async, get_user_names
+from app.services.household import (
+    get_member_by_user_and_household,
+    get_user_household,
+    get_user_household_async,
+)
 from app.services.summary import (
-    calculate_settlement,
+    calculate_settlement_async,
+    calculate_settlement_range_async,
     save_monthly_settlement,
     finalize_monthly_settlement,
+    finalize_settlement_range,
+    iter_months,
 )
+from app.services.data_version import get_data_version
+from app.services.read_routing import route_reads_to_replica
+from app.services.snapshot import get_finalized_months, reopen_month
 from app.models import User
 
 router = APIRouter(prefix="/api/settlement", tags=["settlement"])
 
+MONTH_PATTERN = re.compile(r"^\d{4}-(0[1-9]|1[0-2])$")
+MAX_RANGE_MONTHS = 36
+
 
 class SaveSettlementRequest(BaseModel):
     user_id: UUID
@@ -27,27 +43,110 @@ class FinalizeSettlementRequest(BaseModel):
     month: str
 
 
+class FinalizeRangeRequest(BaseModel):
+    from_month: str
+    to_month: str
+
+
+def _validate_month_range(from_month: str, to_month: str) -> None:
+    for value in (from_month, to_month):
+        if not MONTH_PATTERN.match(value):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid month '{value}'. Use YYYY-MM format",
+            )
+    if from_month > to_month:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'from' must not be after 'to'",
+        )
+    if len(iter_months(from_month, to_month)) > MAX_RANGE_MONTHS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range must not exceed {MAX_RANGE_MONTHS} months",
+        )
+
+
+def _require_owner(db: Session, household_id: UUID, user_id: UUID, action: str) -> None:
+    member = get_member_by_user_and_household(db, user_id, household_id)
+    if not member or member.role != "owner":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Only the household owner can {action}",
+        )
+
+
 @router.get("", response_model=SettlementResponse)
-def get_settlement(
+async def get_settlement(
+    request: Request,
+    response: Response,
     month: str = Query(
         default=None,
         description="YYYY-MM format. Defaults to current month",
     ),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    household = get_user_household(db, current_user.id)
+    household = await get_user_household_async(db, current_user.id)
     if not household:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="You don't belong to any household",
         )
 
+    route_reads_to_replica(db, household.id)
+
     if not month:
         month = datetime.now().strftime("%Y-%m")
 
-    settlement = calculate_settlement(db, household.id, month)
-    return settlement
+    not_modified = check_not_modified(
+        request,
+        response,
+        "settlement",
+        household.id,
+        await db.run_sync(get_data_version, household.id),
+        month,
+    )
+    if not_modified:
+        return not_modified
+
+    return await calculate_settlement_async(db, household.id, month)
+
+
+@router.get("/range", response_model=list[SettlementResponse])
+async def get_settlement_range(
+    request: Request,
+    response: Response,
+    from_month: str = Query(..., alias="from", description="YYYY-MM format"),
+    to_month: str = Query(..., alias="to", description="YYYY-MM format"),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Settlement for every month in a range (e.g. a year-end review)"""
+    household = await get_user_household_async(db, current_user.id)
+    if not household:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="You don't belong to any household",
+        )
+
+    route_reads_to_replica(db, household.id)
+
+    _validate_month_range(from_month, to_month)
+
+    not_modified = check_not_modified(
+        request,
+        response,
+        "settlement-range",
+        household.id,
+        await db.run_sync(get_data_version, household.id),
+        from_month,
+        to_month,
+    )
+    if not_modified:
+        return not_modified
+
+    return await calculate_settlement_range_async(db, household.id, from_month, to_month)
 
 
 @router.post("/save", response_model=MonthlySettlementRecord)
@@ -65,6 +164,12 @@ def save_settlement(
             detail="You don't belong to any household",
         )
 
+    if get_finalized_months(db, household.id, [month]):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Settlement for {month} is finalized. Reopen the month to change it",
+        )
+
     record = save_monthly_settlement(
         db,
         household.id,
@@ -73,12 +178,12 @@ def save_settlement(
         request.settlement_amount,
     )
 
-    user = db.query(User).filter(User.id == record.user_id).first()
+    user_names = get_user_names(db, [record.user_id])
 
     return MonthlySettlementRecord(
         id=record.id,
         user_id=record.user_id,
-        user_name=user.name if user else "Unknown",
+        user_name=user_names.get(record.user_id, "Unknown"),
         month=record.month,
         settlement_amount=record.settlement_amount,
         is_finalized=record.is_finalized,
@@ -99,5 +204,50 @@ def finalize_settlement(
             detail="You don't belong to any household",
         )
 
+    _require_owner(db, household.id, current_user.id, "finalize settlements")
+
     records = finalize_monthly_settlement(db, household.id, request.month)
     return {"message": f"Finalized {len(records)} settlement records for {request.month}"}
+
+
+@router.post("/reopen")
+def reopen_settlement(
+    request: FinalizeSettlementRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Reopen a finalized month so its entries and records can be edited again"""
+    household = get_user_household(db, current_user.id)
+    if not household:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="You don't belong to any household",
+        )
+
+    _require_owner(db, household.id, current_user.id, "reopen months")
+
+    count = reopen_month(db, household.id, request.month)
+    return {"message": f"Reopened {count} settlement records for {request.month}"}
+
+
+@router.post("/finalize-range")
+def finalize_range(
+    request: FinalizeRangeRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Finalize all settlement records from from_month to to_month"""
+    household = get_user_household(db, current_user.id)
+    if not household:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="You don't belong to any household",
+        )
+
+    _require_owner(db, household.id, current_user.id, "finalize settlements")
+    _validate_month_range(request.from_month, request.to_month)
+
+    count = finalize_settlement_range(db, household.id, request.from_month, request.to_month)
+    return {
+        "message": f"Finalized {count} settlement records for {request.from_month} ~ {request.to_month}"
+    }
@@ -1,20 +1,25 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
-from app.core.database import get_db
+from app.core.database import get_async_db
+from app.core.etag import check_not_modified
 from app.schemas.summary import MonthlySummary
-from app.services.auth import get_current_user
-from app.services.household import get_user_household
-from app.services.summary import get_monthly_summary
+from app.services.auth import get_current_user_async
+from app.services.household import get_user_household_async
+from app.services.summary import get_monthly_summary_async
+from app.services.data_version import get_data_version
+from app.services.read_routing import route_reads_to_replica
 from app.models import User
 
 router = APIRouter(prefix="/api/summary", tags=["summary"])
 
 
 @router.get("", response_model=MonthlySummary)
-def get_summary(
+async def get_summary(
+    request: Request,
+    response: Response,
     month: str = Query(
         default=None,
         description="YYYY-MM format. Defaults to current month",
@@ -23,16 +28,18 @@ def get_summary(
         default=None,
         description="Comma-separated UUIDs for filtering by accounts",
     ),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    household = get_user_household(db, current_user.id)
+    household = await get_user_household_async(db, current_user.id)
     if not household:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="You don't belong to any household",
         )
 
+    route_reads_to_replica(db, household.id)
+
     if not month:
         month = datetime.now().strftime("%Y-%m")
 
@@ -47,5 +54,19 @@ def get_summary(
                 detail="Invalid account_ids format",
             )
 
-    summary = get_monthly_summary(db, household.id, month, current_user.id, parsed_account_ids)
-    return summary
+    not_modified = check_not_modified(
+        request,
+        response,
+        "summary",
+        household.id,
+        await db.run_sync(get_data_version, household.id),
+        current_user.id,
+        month,
+        sorted(str(a) for a in parsed_account_ids or []),
+    )
+    if not_modified:
+        return not_modified
+
+    return await get_monthly_summary_async(
+        db, household.id, month, current_user.id, parsed_account_ids
+    )
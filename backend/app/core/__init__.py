@@ -1,5 +1,5 @@
 from app.core.config import settings
-from app.core.database import Base, get_db, engine
+from app.core.database import Base, get_db, get_async_db, engine
 from app.core.security import (
     verify_password,
     get_password_hash,
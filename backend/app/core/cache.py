@@ -0,0 +1,142 @@
+"""
+Pluggable key-value cache.
+
+LocalCache is a bounded in-process LRU used by default (and as the stand-in
+for tests). RedisCache shares entries across workers when CACHE_URL is set.
+Values must be JSON-serializable so both backends behave the same.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from app.core.config import settings
+
+
+class CacheBackend:
+    # True when calls do network I/O; async code then runs them in the thread pool
+    blocking = False
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def incr(self, key: str) -> int:
+        """Atomically increment an integer counter (created at 0), returning the new value"""
+        raise NotImplementedError
+
+    def get_int(self, key: str) -> int:
+        value = self.get(key)
+        return int(value) if value is not None else 0
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class LocalCache(CacheBackend):
+    """Thread-safe in-process LRU with a size bound and per-entry TTL"""
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, tuple[Optional[float], Any]] = OrderedDict()
+        # Counters live outside the LRU: evicting a version counter would
+        # reset it and resurrect entries cached under old versions
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = self._counters.get(key, 0) + 1
+            self._counters[key] = value
+            return value
+
+    def get_int(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._counters.clear()
+
+
+class RedisCache(CacheBackend):
+    """Shared cache backed by Redis (requires the redis package)"""
+
+    blocking = True
+
+    def __init__(self, url: str, prefix: str = "ourledger:"):
+        try:
+            import redis
+        except ImportError:
+            raise ValueError("redis library is required when CACHE_URL is set")
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.client.set(self.prefix + key, json.dumps(value), ex=ttl)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(self.prefix + key))
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+
+_backend: Optional[CacheBackend] = None
+
+
+def get_cache() -> CacheBackend:
+    global _backend
+    if _backend is None:
+        if settings.CACHE_URL:
+            _backend = RedisCache(settings.CACHE_URL)
+        else:
+            _backend = LocalCache(settings.CACHE_MAX_ENTRIES)
+    return _backend
+
+
+def set_cache_backend(backend: CacheBackend) -> None:
+    """Replace the process-wide cache backend (e.g. with a LocalCache in tests)"""
+    global _backend
+    _backend = backend
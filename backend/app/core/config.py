@@ -9,12 +9,64 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
 
+    # Password hashing. The first scheme hashes new passwords (e.g.
+    # "argon2,bcrypt" with argon2-cffi installed); existing hashes are
+    # upgraded on the next successful login
+    PASSWORD_SCHEMES: str = "bcrypt"
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4  # concurrent hash/verify operations
+
+    # JWT verification. "pyjwt" (pip install PyJWT) is faster than python-jose
+    # for HS256; tokens are interchangeable between the two. Verified tokens
+    # are cached per worker until they expire (0 disables the cache)
+    JWT_BACKEND: str = "jose"
+    TOKEN_CACHE_SIZE: int = 4096
+
     # OAuth (for future use)
     GOOGLE_CLIENT_ID: str = ""
     GOOGLE_CLIENT_SECRET: str = ""
 
     # Google Sheets Service Account (for v1.1)
     GOOGLE_SERVICE_ACCOUNT_FILE: Optional[str] = None
+    # Alternative API endpoint, e.g. a local fake (scripts/fake_sheets_server.py)
+    GOOGLE_SHEETS_ENDPOINT: Optional[str] = None
+    # Sync reads page through sheets with batchGet: rows per range, ranges per request
+    GOOGLE_SHEETS_PAGE_ROWS: int = 1000
+    GOOGLE_SHEETS_RANGES_PER_REQUEST: int = 5
+
+    # Async driver URL for async endpoints. Derived from DATABASE_URL
+    # (postgresql+asyncpg://...) when unset
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # Read replicas for heavy read endpoints (comma-separated sync URLs; the
+    # async routes use the same hosts via asyncpg). Reads stay on the primary
+    # for READ_YOUR_WRITES_SECONDS after a household writes
+    READ_REPLICA_URLS: str = ""
+    READ_YOUR_WRITES_SECONDS: int = 5
+
+    # Connection pool (PostgreSQL). Defaults suit a few workers against a
+    # single database; recycle stays below typical proxy/LB idle timeouts
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 30 * 60  # seconds
+    DB_POOL_PRE_PING: bool = True
+    # Per-statement timeout applied to every transaction (ms, None = no limit)
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None
+
+    # SQL profiling: statements slower than this are logged with normalized
+    # SQL; DEBUG_ENDPOINTS exposes per-route query stats at /debug/queries
+    SLOW_QUERY_MS: int = 200
+    DEBUG_ENDPOINTS: bool = False
+
+    # Prometheus-style metrics at GET /metrics
+    METRICS_ENABLED: bool = True
+
+    # Response cache (summary/settlement). In-process LRU unless CACHE_URL
+    # points at a shared Redis instance (redis://host:6379/0)
+    CACHE_URL: Optional[str] = None
+    CACHE_MAX_ENTRIES: int = 2048
+    CACHE_TTL_SECONDS: int = 60 * 60
 
     class Config:
         env_file = ".env"
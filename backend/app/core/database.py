@@ -1,10 +1,212 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+import random
+import threading
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.core.config import settings
 
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+class PoolMetrics:
+    """Counters for connection pool usage (checkouts and time spent waiting)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_failures = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_checkout(self, wait: float, ok: bool = True) -> None:
+        with self._lock:
+            if ok:
+                self.checkouts += 1
+            else:
+                self.checkout_failures += 1
+            self.wait_seconds_total += wait
+            if wait > self.wait_seconds_max:
+                self.wait_seconds_max = wait
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.checkout_failures
+            return {
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_avg": round(self.wait_seconds_total / attempts, 6) if attempts else 0.0,
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+class _TimedCheckoutMixin:
+    """Records how long each pool checkout waited for a connection"""
+
+    metrics: PoolMetrics | None = None  # set by register_engine
+
+    def _do_get(self):
+        metrics = self.metrics
+        if metrics is None:
+            return super()._do_get()
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except Exception:
+            metrics.record_checkout(time.perf_counter() - start, ok=False)
+            raise
+        metrics.record_checkout(time.perf_counter() - start)
+        return conn
+
+    def recreate(self):
+        # engine.dispose() swaps in a new pool; keep counting into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _engine_options(url: str, poolclass: type) -> dict:
+    # SQLite (dev/test) keeps SQLAlchemy's default pool; the sizing options
+    # only apply to QueuePool
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+class RoutingSession(Session):
+    """
+    Session that can send reads to a read replica.
+
+    Everything goes to the primary (the session's bind) unless
+    use_read_replica() picked a replica for this session. Even then flushes
+    and INSERT/UPDATE/DELETE statements always go to the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        replica = self.info.get("replica_engine")
+        if replica is None or self._flushing or isinstance(clause, UpdateBase):
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+        return replica
+
+
+def get_replica_urls() -> list[str]:
+    return [url.strip() for url in settings.READ_REPLICA_URLS.split(",") if url.strip()]
+
+
+def use_read_replica(db) -> bool:
+    """
+    Route this session's subsequent reads to a randomly chosen replica.
+    Works for both Session and AsyncSession; returns False when no replicas
+    are configured.
+    """
+    sync_session = getattr(db, "sync_session", db)
+    replicas = sync_session.info.get("replica_engines")
+    if not replicas:
+        return False
+    sync_session.info.setdefault("replica_engine", random.choice(replicas))
+    return True
+
+
+engine = create_engine(settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL, TimedQueuePool))
+replica_engines = [
+    create_engine(url, **_engine_options(url, TimedQueuePool)) for url in get_replica_urls()
+]
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    info={"replica_engines": replica_engines},
+)
+
+
+# Engines whose pools are reported by get_pool_stats, by label
+_engines: dict[str, tuple] = {}
+
+
+def register_engine(name: str, sync_engine) -> None:
+    """Track pool stats for an engine (pass async_engine.sync_engine for async ones)"""
+    metrics = PoolMetrics()
+    sync_engine.pool.metrics = metrics
+    event.listen(sync_engine, "connect", lambda dbapi_connection, record: metrics.record_connect())
+    event.listen(
+        sync_engine, "invalidate",
+        lambda dbapi_connection, record, exception: metrics.record_invalidation(),
+    )
+    _engines[name] = (sync_engine, metrics)
+
+
+register_engine("primary", engine)
+for _i, _replica in enumerate(replica_engines):
+    register_engine(f"replica{_i}", _replica)
+
+
+def get_pool_stats() -> dict[str, dict]:
+    """Pool occupancy plus checkout/wait counters, per engine"""
+    result = {}
+    for name, (sync_engine, metrics) in list(_engines.items()):
+        pool = sync_engine.pool
+        stats = metrics.snapshot()
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=pool.overflow(),
+            )
+        result[name] = stats
+    return result
+
+
+def set_statement_timeout(db: Session, timeout_ms: int | None) -> None:
+    """
+    Limit how long each statement of this session may run (PostgreSQL only).
+    Applied with SET LOCAL at the start of every transaction; None falls back
+    to DB_STATEMENT_TIMEOUT_MS (0 = no limit), also for the transaction in
+    progress.
+    """
+    db.info["statement_timeout_ms"] = timeout_ms
+    if db.in_transaction():
+        connection = db.connection()
+        if connection.dialect.name == "postgresql":
+            effective_ms = timeout_ms or settings.DB_STATEMENT_TIMEOUT_MS or 0
+            connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(effective_ms)}")
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_statement_timeout(session, transaction, connection):
+    timeout_ms = session.info.get("statement_timeout_ms") or settings.DB_STATEMENT_TIMEOUT_MS
+    if timeout_ms and connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
 
 
 class Base(DeclarativeBase):
@@ -17,3 +219,52 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Async stack for hot read endpoints. Created on first use so scripts and
+# Alembic never need the async driver (asyncpg) installed.
+_async_sessionmaker = None
+
+
+def get_async_database_url() -> str:
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    return _to_async_url(settings.DATABASE_URL)
+
+
+def _to_async_url(sync_url: str) -> str:
+    url = make_url(sync_url)
+    if url.get_backend_name() == "postgresql":
+        return url.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+    if url.get_backend_name() == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    raise ValueError(f"No async driver configured for {url.get_backend_name()}; set ASYNC_DATABASE_URL")
+
+
+def get_async_sessionmaker():
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        url = get_async_database_url()
+        async_engine = create_async_engine(url, **_engine_options(url, TimedAsyncQueuePool))
+        async_replicas = [
+            create_async_engine(url, **_engine_options(url, TimedAsyncQueuePool))
+            for url in map(_to_async_url, get_replica_urls())
+        ]
+        register_engine("async_primary", async_engine.sync_engine)
+        for i, replica in enumerate(async_replicas):
+            register_engine(f"async_replica{i}", replica.sync_engine)
+        _async_sessionmaker = async_sessionmaker(
+            async_engine,
+            sync_session_class=RoutingSession,
+            autoflush=False,
+            expire_on_commit=False,
+            info={"replica_engines": [e.sync_engine for e in async_replicas]},
+        )
+    return _async_sessionmaker
+
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -0,0 +1,39 @@
+import hashlib
+from fastapi import Request, Response
+
+# Clients may store responses but must revalidate them on every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """Build a weak ETag from a household data version and normalized request params"""
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [c.strip() for c in header.split(",")]
+    if "*" in candidates:
+        return True
+    # Weak comparison: ignore the W/ prefix on either side
+    bare = etag.removeprefix("W/")
+    return any(c.removeprefix("W/") == bare for c in candidates)
+
+
+def check_not_modified(request: Request, response: Response, *parts) -> Response | None:
+    """
+    Return a 304 response if the client's If-None-Match matches the ETag for
+    parts; otherwise set ETag headers on response and return None.
+    """
+    etag = make_etag(*parts)
+    if etag_matches(request, etag):
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+        )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return None
@@ -0,0 +1,273 @@
+"""
+Prometheus-style metrics.
+
+Counters and histograms are sharded per thread: each thread updates its own
+dict without locking, and shards are only summed when /metrics is scraped.
+Gauges (and CallbackCounters, for totals kept elsewhere) are callbacks
+evaluated at scrape time. Values are per worker
+process; Prometheus aggregates across workers.
+"""
+import bisect
+import threading
+import time
+from typing import Callable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Latency buckets (seconds) and response size buckets (bytes)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+_local = threading.local()
+_shards: list[dict] = []
+_shards_lock = threading.Lock()
+
+
+def _shard() -> dict:
+    shard = getattr(_local, "shard", None)
+    if shard is None:
+        shard = _local.shard = {}
+        with _shards_lock:
+            _shards.append(shard)
+    return shard
+
+
+def _label_key(labelnames: tuple[str, ...], labels: dict) -> tuple:
+    return tuple(str(labels.get(name, "")) for name in labelnames)
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        _register(self)
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        shard = _shard()
+        key = (self.name, _label_key(self.labelnames, labels))
+        shard[key] = shard.get(key, 0) + amount
+
+    def collect(self, shards: list[dict]) -> list[str]:
+        totals: dict[tuple, float] = {}
+        for shard in shards:
+            for (name, labels), value in shard.items():
+                if name == self.name:
+                    totals[labels] = totals.get(labels, 0) + value
+        lines = _header(self.name, self.documentation, "counter")
+        for labels, value in sorted(totals.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets)
+        _register(self)
+
+    def observe(self, value: float, **labels) -> None:
+        shard = _shard()
+        key = (self.name, _label_key(self.labelnames, labels))
+        state = shard.get(key)
+        if state is None:
+            # [count per bucket..., +Inf count, sum]
+            state = shard[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect.bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def collect(self, shards: list[dict]) -> list[str]:
+        totals: dict[tuple, list] = {}
+        for shard in shards:
+            for (name, labels), state in shard.items():
+                if name != self.name:
+                    continue
+                total = totals.get(labels)
+                if total is None:
+                    totals[labels] = list(state)
+                else:
+                    for i, v in enumerate(state):
+                        total[i] += v
+
+        lines = _header(self.name, self.documentation, "histogram")
+        for labels, state in sorted(totals.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), state):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames + ('le',), labels + (le,))} {cumulative}"
+                )
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class Gauge:
+    """
+    Value computed at scrape time; fn returns a number or {label values: number},
+    keyed by a tuple of label values (or a plain value with one label name)
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        fn: Callable[[], float | dict],
+        labelnames: tuple[str, ...] = (),
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.fn = fn
+        self.labelnames = labelnames
+        _register(self)
+
+    def collect(self, shards: list[dict]) -> list[str]:
+        lines = _header(self.name, self.documentation, self.kind)
+        value = self.fn()
+        if isinstance(value, dict):
+            for labels, v in sorted(value.items()):
+                labels = labels if isinstance(labels, tuple) else (labels,)
+                lines.append(
+                    f"{self.name}{_format_labels(self.labelnames, tuple(map(str, labels)))} {_format_value(v)}"
+                )
+        else:
+            lines.append(f"{self.name} {_format_value(value)}")
+        return lines
+
+
+class CallbackCounter(Gauge):
+    """Counter whose running total is kept elsewhere and read at scrape time"""
+
+    kind = "counter"
+
+
+_metrics: dict[str, Counter | Histogram | Gauge] = {}
+
+
+def _register(metric) -> None:
+    _metrics[metric.name] = metric
+
+
+def _header(name: str, documentation: str, kind: str) -> list[str]:
+    return [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def render_metrics() -> str:
+    """All metrics in the Prometheus text exposition format"""
+    with _shards_lock:
+        # dict.copy() is atomic under the GIL, so writers never need the lock
+        shards = [shard.copy() for shard in _shards]
+    lines = []
+    for metric in _metrics.values():
+        try:
+            lines.extend(metric.collect(shards))
+        except Exception:
+            # A failing gauge callback shouldn't break the whole scrape
+            continue
+    return "\n".join(lines) + "\n"
+
+
+def route_label(scope: Scope) -> str:
+    """Route template (/api/entries/{entry_id}) so IDs don't explode label cardinality"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class RequestMetricsMiddleware:
+    """Records latency and response size per route"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+        size = 0
+
+        async def send_and_measure(message: Message) -> None:
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_measure)
+        finally:
+            method = scope.get("method", "")
+            route = route_label(scope)
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - start, method=method, route=route, status=status_code
+            )
+            HTTP_RESPONSE_BYTES.observe(size, method=method, route=route)
+
+
+# Metrics shared across the app
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by route",
+    ("method", "route", "status"),
+)
+HTTP_RESPONSE_BYTES = Histogram(
+    "http_response_size_bytes",
+    "Response body size by route",
+    ("method", "route"),
+    buckets=SIZE_BUCKETS,
+)
+HTTP_REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Time spent in SQL per request by route",
+    ("method", "route"),
+)
+IMPORT_ROWS = Counter(
+    "import_rows_total",
+    "Imported rows by source (csv, sheets) and result (parsed, inserted, updated, deleted, skipped, failed)",
+    ("source", "result"),
+)
+SHEETS_SYNC_BATCHES = Counter(
+    "sheets_sync_batches_total",
+    "Google Sheets sync batches by direction (import, export)",
+    ("direction",),
+)
+AUTH_TOKEN_CACHE = Counter(
+    "auth_token_cache_total",
+    "Access token verifications by result (hit skips signature verification, miss)",
+    ("result",),
+)
+EXPORT_ROWS = Counter(
+    "export_rows_total",
+    "Exported entry rows by format (csv, xlsx, parquet)",
+    ("format",),
+)
@@ -0,0 +1,253 @@
+"""
+Per-request SQL profiling.
+
+Engine-level cursor hooks count statements and DB time for the request in
+progress (tracked through a context variable set by
+QueryProfilerMiddleware). Rows are counted as they are fetched, through a
+thin wrapper around the DBAPI cursor the result reads from, since
+cursor.rowcount doesn't cover SELECTs. Totals are returned in the Server-Timing header,
+aggregated per route for GET /debug/queries, and statements slower than
+SLOW_QUERY_MS are logged with normalized SQL.
+
+query_budget() counts every statement and fetched row while it is active,
+so scripts and tests can assert how much an endpoint queries.
+"""
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import HTTP_REQUEST_DB_SECONDS, route_label
+
+logger = logging.getLogger("app.sql")
+
+MAX_ROUTE_STATS = 512
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    db_seconds: float = 0.0
+    rows: int = 0  # rows fetched from results
+    statements: list[str] | None = None  # collected by query_budget only
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.db_seconds += elapsed
+        if self.statements is not None:
+            self.statements.append(statement)
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("request_query_stats", default=None)
+
+_budgets: list[QueryStats] = []
+_budgets_lock = threading.Lock()
+
+
+class _RowCountingCursor:
+    """DBAPI cursor proxy adding the rows fetched through it to QueryStats"""
+
+    __slots__ = ("_cursor", "_targets")
+
+    def __init__(self, cursor, targets: list[QueryStats]):
+        self._cursor = cursor
+        self._targets = targets
+
+    def _count(self, rows: int) -> None:
+        for stats in self._targets:
+            stats.rows += rows
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._count(1)
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._count(len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._count(len(rows))
+        return rows
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+_WHITESPACE = re.compile(r"\s+")
+_BIND_LIST = re.compile(r"\((?:\s*(?:%\([^)]+\)s|\$\d+|\?|:\w+)\s*,)+\s*(?:%\([^)]+\)s|\$\d+|\?|:\w+)\s*\)")
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+
+
+def normalize_sql(statement: str) -> str:
+    """Collapse whitespace, IN-lists and literals so similar queries group together"""
+    sql = _WHITESPACE.sub(" ", statement).strip()
+    sql = _BIND_LIST.sub("(...)", sql)
+    return _LITERALS.sub("?", sql)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+
+    targets = []
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+        targets.append(stats)
+    if _budgets:
+        with _budgets_lock:
+            for budget in _budgets:
+                budget.record(statement, elapsed)
+            targets.extend(_budgets)
+
+    if targets and context is not None and cursor.description is not None:
+        # The result is built from context.cursor right after this hook
+        context.cursor = _RowCountingCursor(cursor, targets)
+
+    if elapsed * 1000 >= settings.SLOW_QUERY_MS:
+        logger.warning("slow query (%.1f ms): %s", elapsed * 1000, normalize_sql(statement))
+
+
+@dataclass
+class RouteQueryStats:
+    requests: int = 0
+    queries: int = 0
+    max_queries: int = 0
+    db_seconds: float = 0.0
+    rows: int = 0
+    max_rows: int = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "queries": self.queries,
+            "avg_queries": round(self.queries / self.requests, 2) if self.requests else 0,
+            "max_queries": self.max_queries,
+            "db_ms_total": round(self.db_seconds * 1000, 3),
+            "db_ms_avg": round(self.db_seconds * 1000 / self.requests, 3) if self.requests else 0,
+            "rows": self.rows,
+            "avg_rows": round(self.rows / self.requests, 2) if self.requests else 0,
+            "max_rows": self.max_rows,
+        }
+
+
+_route_stats: dict[str, RouteQueryStats] = {}
+_route_stats_lock = threading.Lock()
+
+
+def _record_route(route: str, stats: QueryStats) -> None:
+    with _route_stats_lock:
+        entry = _route_stats.get(route)
+        if entry is None:
+            if len(_route_stats) >= MAX_ROUTE_STATS:
+                return
+            entry = _route_stats[route] = RouteQueryStats()
+        entry.requests += 1
+        entry.queries += stats.count
+        entry.max_queries = max(entry.max_queries, stats.count)
+        entry.db_seconds += stats.db_seconds
+        entry.rows += stats.rows
+        entry.max_rows = max(entry.max_rows, stats.rows)
+
+
+def get_route_query_stats() -> dict[str, dict]:
+    with _route_stats_lock:
+        return {route: entry.as_dict() for route, entry in sorted(_route_stats.items())}
+
+
+def reset_route_query_stats() -> None:
+    with _route_stats_lock:
+        _route_stats.clear()
+
+
+class QueryProfilerMiddleware:
+    """Collects per-request SQL stats and reports them in Server-Timing"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                total_ms = (time.perf_counter() - start) * 1000
+                timing = (
+                    f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.count} queries, {stats.rows} rows", '
+                    f"app;dur={total_ms:.1f}"
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", timing.encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            method = scope.get("method", "")
+            route = route_label(scope)
+            _record_route(f"{method} {route}", stats)
+            HTTP_REQUEST_DB_SECONDS.observe(stats.db_seconds, method=method, route=route)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@contextmanager
+def query_budget(max_queries: int | None = None, max_rows: int | None = None):
+    """
+    Count every SQL statement executed and row fetched (by any thread) while
+    active. Raises QueryBudgetExceeded on exit if more than max_queries ran
+    or more than max_rows were fetched.
+
+        with query_budget(5, max_rows=200) as stats:
+            client.get("/api/summary")
+    """
+    stats = QueryStats(statements=[])
+    with _budgets_lock:
+        _budgets.append(stats)
+    try:
+        yield stats
+    finally:
+        with _budgets_lock:
+            _budgets.remove(stats)
+    if max_queries is not None and stats.count > max_queries:
+        listing = "\n".join(normalize_sql(s) for s in stats.statements)
+        raise QueryBudgetExceeded(
+            f"Expected at most {max_queries} queries, got {stats.count}:\n{listing}"
+        )
+    if max_rows is not None and stats.rows > max_rows:
+        raise QueryBudgetExceeded(
+            f"Expected at most {max_rows} rows fetched, got {stats.rows}"
+        )
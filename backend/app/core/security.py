@@ -1,10 +1,42 @@
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from app.core.cache import LocalCache
 from app.core.config import settings
+from app.core.metrics import AUTH_TOKEN_CACHE
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def _build_pwd_context() -> CryptContext:
+    schemes = [s.strip() for s in settings.PASSWORD_SCHEMES.split(",") if s.strip()]
+    if "argon2" in schemes:
+        try:
+            import argon2  # noqa: F401
+        except ImportError:
+            raise ValueError("argon2 password hashing requires argon2-cffi. Run: pip install argon2-cffi")
+    # The first scheme hashes new passwords; hashes using any other scheme,
+    # or bcrypt with a different cost, are flagged for rehash on next login
+    return CryptContext(
+        schemes=schemes,
+        deprecated="auto",
+        bcrypt__rounds=settings.BCRYPT_ROUNDS,
+        bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+        bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+    )
+
+
+pwd_context = _build_pwd_context()
+
+# Hashing is CPU-bound and slow by design; a dedicated bounded pool keeps a
+# login burst from occupying the request threadpool or the event loop
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -15,6 +47,47 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """Verify a password; on success also return a new hash if the stored one is outdated"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+async def _run_hash(fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(_hash_executor, fn, *args)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_hash(get_password_hash, password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    return await _run_hash(verify_and_update_password, plain_password, hashed_password)
+
+
+def _load_jwt_backend():
+    """(encode, decode, error class) for JWT_BACKEND; both take the same arguments"""
+    if settings.JWT_BACKEND == "pyjwt":
+        try:
+            import jwt as pyjwt
+        except ImportError:
+            raise ValueError("JWT_BACKEND=pyjwt requires PyJWT. Run: pip install PyJWT")
+        return pyjwt.encode, pyjwt.decode, pyjwt.PyJWTError
+    if settings.JWT_BACKEND != "jose":
+        raise ValueError(f"Unknown JWT_BACKEND '{settings.JWT_BACKEND}' (expected jose or pyjwt)")
+    return jwt.encode, jwt.decode, JWTError
+
+
+_jwt_encode, _jwt_decode, _jwt_error = _load_jwt_backend()
+
+# Recently verified tokens: sha256(token) -> claims, dropped at the token's
+# exp. Holding hashes keeps raw bearer tokens out of memory
+_token_cache = LocalCache(max_entries=settings.TOKEN_CACHE_SIZE)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
@@ -22,13 +95,38 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = _jwt_encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
 def decode_access_token(token: str) -> Optional[dict]:
+    if settings.TOKEN_CACHE_SIZE <= 0:
+        return _verify_access_token(token)
+
+    key = hashlib.sha256(token.encode()).hexdigest()
+    claims = _token_cache.get(key)
+    if claims is not None:
+        AUTH_TOKEN_CACHE.inc(result="hit")
+        return dict(claims)
+
+    AUTH_TOKEN_CACHE.inc(result="miss")
+    payload = _verify_access_token(token)
+    if payload is not None:
+        exp = payload.get("exp")
+        # Only tokens that expire are cached, and never past their exp
+        ttl = exp - time.time() if isinstance(exp, (int, float)) else 0
+        if ttl > 0:
+            _token_cache.set(key, dict(payload), ttl=ttl)
+    return payload
+
+
+def _verify_access_token(token: str) -> Optional[dict]:
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = _jwt_decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         return payload
-    except JWTError:
+    except _jwt_error:
         return None
+
+
+def clear_token_cache() -> None:
+    _token_cache.clear()
@@ -0,0 +1,44 @@
+"""
+Chunked reads for large result sets.
+
+iter_partitions() executes a statement with yield_per, which turns on
+stream_results (a server-side cursor on PostgreSQL) and keeps only one
+partition of rows in memory at a time. Use it instead of .all() for queries
+that can return a whole household's entries, and select plain columns
+rather than ORM entities where possible.
+
+The cursor lives in the current transaction: don't commit while iterating.
+"""
+from typing import Iterator
+
+from sqlalchemy import Row
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql import Executable
+
+STREAM_BATCH_SIZE = 2_000
+
+
+def iter_partitions(
+    db: Session,
+    statement: Executable | Query,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[list[Row]]:
+    """Rows of statement in lists of up to batch_size, fetched lazily"""
+    if isinstance(statement, Query):
+        statement = statement.statement
+    result = db.execute(statement.execution_options(yield_per=batch_size))
+    try:
+        for partition in result.partitions():
+            yield partition
+    finally:
+        # Releases the server-side cursor if the caller stops early
+        result.close()
+
+
+def iter_rows(
+    db: Session,
+    statement: Executable | Query,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[Row]:
+    for partition in iter_partitions(db, statement, batch_size):
+        yield from partition
@@ -1,5 +1,12 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import settings
+from app.core.database import get_pool_stats
+from app.core.metrics import CallbackCounter, Gauge, RequestMetricsMiddleware, render_metrics
+from app.core.profiling import QueryProfilerMiddleware, get_route_query_stats
+from app.services import csv_import
 
 from app.api import (
     auth_router,
@@ -35,6 +42,50 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# SQL 쿼리 수/DB 시간 (Server-Timing 헤더)
+app.add_middleware(QueryProfilerMiddleware)
+# 라우트별 응답 시간/크기 (/metrics)
+app.add_middleware(RequestMetricsMiddleware)
+
+# 스크레이프 시점에 계산되는 게이지
+Gauge(
+    "db_pool_connections",
+    "Connection pool state per engine (size, checked_out, checked_in, overflow)",
+    lambda: {
+        (engine, k): v
+        for engine, stats in get_pool_stats().items()
+        for k, v in stats.items()
+        if k in ("size", "checked_out", "checked_in", "overflow")
+    },
+    labelnames=("engine", "state"),
+)
+CallbackCounter(
+    "db_pool_checkouts_total",
+    "Pool checkouts per engine (ok, failed)",
+    lambda: {
+        (engine, result): stats[key]
+        for engine, stats in get_pool_stats().items()
+        for result, key in (("ok", "checkouts"), ("failed", "checkout_failures"))
+    },
+    labelnames=("engine", "result"),
+)
+CallbackCounter(
+    "db_pool_wait_seconds_total",
+    "Time spent waiting for pool connections per engine",
+    lambda: {engine: stats["wait_seconds_total"] for engine, stats in get_pool_stats().items()},
+    labelnames=("engine",),
+)
+Gauge(
+    "import_staged_files",
+    "Uploaded files waiting for import confirmation",
+    lambda: len(csv_import._file_cache),
+)
+Gauge(
+    "import_staged_rows",
+    "Rows held by uploaded files waiting for import confirmation",
+    lambda: sum(len(f["rows"]) for f in list(csv_import._file_cache.values())),
+)
+
 # 라우터 등록
 app.include_router(auth_router)
 app.include_router(household_router)
@@ -55,3 +106,23 @@ def root():
 @app.get("/health")
 def health():
     return {"status": "ok"}
+
+
+@app.get("/health/db")
+def health_db():
+    return {"status": "ok", "pool": get_pool_stats()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/debug/queries")
+def debug_queries():
+    """Per-route SQL statement counts, DB time and rows (DEBUG_ENDPOINTS only)"""
+    if not settings.DEBUG_ENDPOINTS:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    return get_route_query_stats()
@@ -1,15 +1,16 @@
 from app.models.user import User
-from app.models.household import Household, HouseholdMember
+from app.models.household import Household, HouseholdMember, HouseholdMonthVersion
 from app.models.category import Category, Subcategory
 from app.models.entry import Entry
 from app.models.account import Account
 from app.models.external_source import ExternalDataSource, EntryExternalRef
-from app.models.settlement import MonthlySettlement
+from app.models.settlement import MonthlySettlement, SettlementSnapshot
 
 __all__ = [
     "User",
     "Household",
     "HouseholdMember",
+    "HouseholdMonthVersion",
     "Category",
     "Subcategory",
     "Entry",
@@ -17,4 +18,5 @@ __all__ = [
     "ExternalDataSource",
     "EntryExternalRef",
     "MonthlySettlement",
+    "SettlementSnapshot",
 ]
@@ -28,6 +28,8 @@ class ExternalDataSource(Base):
     )  # "import" | "export" | "both"
     last_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     last_synced_row: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # Sheet version seen at the last import; earlier rows are re-scanned only when it changes
+    sheet_checksum: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
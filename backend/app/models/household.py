@@ -1,7 +1,7 @@
 import uuid
 import secrets
 from datetime import datetime
-from sqlalchemy import String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import String, Integer, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 
@@ -19,6 +19,11 @@ class Household(Base):
         String(20), unique=True, nullable=False, default=generate_invite_code
     )
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Bumped on every write to household data; used for ETags and caching
+    data_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    # Bumped by writes that affect every month's summary (accounts, members,
+    # categories, settlements); entry writes bump HouseholdMonthVersion instead
+    base_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
     members: Mapped[list["HouseholdMember"]] = relationship(
         "HouseholdMember", back_populates="household"
@@ -54,6 +59,8 @@ class HouseholdMember(Base):
         ForeignKey("users.id"), nullable=False
     )
     role: Mapped[str] = mapped_column(String(20), default="member")  # owner | member
+    # Relative share of shared expenses (1 = equal split)
+    split_weight: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
     joined_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     household: Mapped["Household"] = relationship("Household", back_populates="members")
@@ -61,3 +68,14 @@ class HouseholdMember(Base):
     entries_as_payer: Mapped[list["Entry"]] = relationship(
         "Entry", back_populates="payer_member"
     )
+
+
+class HouseholdMonthVersion(Base):
+    """Version of one month of a household's entries, bumped by entry writes"""
+    __tablename__ = "household_month_versions"
+
+    household_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("households.id"), primary_key=True
+    )
+    month: Mapped[str] = mapped_column(String(7), primary_key=True)  # YYYY-MM
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
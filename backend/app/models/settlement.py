@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Integer, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import String, Integer, Boolean, DateTime, ForeignKey, UniqueConstraint, Index, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 
@@ -12,6 +12,11 @@ class MonthlySettlement(Base):
             "household_id", "user_id", "month",
             name="uq_household_user_month"
         ),
+        # Cumulative balances scan a household's records up to a month
+        Index(
+            "ix_monthly_settlements_household_month",
+            "household_id", "month", "user_id", "settlement_amount",
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
@@ -34,3 +39,25 @@ class MonthlySettlement(Base):
     # Relationships
     household: Mapped["Household"] = relationship("Household", back_populates="monthly_settlements")
     user: Mapped["User"] = relationship("User", back_populates="monthly_settlements")
+
+
+class SettlementSnapshot(Base):
+    """Frozen settlement and summary payloads of a finalized month"""
+    __tablename__ = "settlement_snapshots"
+    __table_args__ = (
+        UniqueConstraint(
+            "household_id", "month",
+            name="uq_settlement_snapshot_household_month"
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    household_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("households.id"), nullable=False
+    )
+    month: Mapped[str] = mapped_column(String(7), nullable=False)  # "YYYY-MM"
+    settlement: Mapped[dict] = mapped_column(JSON, nullable=False)  # SettlementResponse
+    summaries: Mapped[dict] = mapped_column(
+        JSON, nullable=False, default=dict
+    )  # user_id -> MonthlySummary (unfiltered, as seen by that member)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -4,6 +4,7 @@ from app.schemas.household import (
     HouseholdJoin,
     HouseholdResponse,
     MemberResponse,
+    MemberUpdate,
 )
 from app.schemas.category import CategoryCreate, CategoryResponse
 from app.schemas.entry import EntryCreate, EntryUpdate, EntryResponse, EntryListParams
@@ -40,6 +41,7 @@ __all__ = [
     "HouseholdJoin",
     "HouseholdResponse",
     "MemberResponse",
+    "MemberUpdate",
     "CategoryCreate",
     "CategoryResponse",
     "EntryCreate",
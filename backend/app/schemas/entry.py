@@ -110,7 +110,7 @@ class EntryListParams(BaseModel):
     amount_min: Optional[int] = None
     amount_max: Optional[int] = None
     memo_search: Optional[str] = None
-    sort_by: str = "occurred_at"  # occurred_at | amount
+    sort_by: str = "occurred_at"  # occurred_at | amount | relevance
     sort_order: str = "desc"  # asc | desc
     page: int = 1
     page_size: int = 50
@@ -126,3 +126,13 @@ class EntryListResponse(BaseModel):
     has_next: bool
     has_prev: bool
     summary: EntrySummary  # 필터링된 전체 거래 합산
+
+
+class EntrySuggestion(BaseModel):
+    """메모/카테고리 자동완성 후보"""
+    text: str
+    kind: str  # memo | category
+    count: int  # 사용 횟수
+    last_used: Optional[date_type] = None
+    category_id: Optional[UUID] = None  # 자동 입력할 카테고리
+    category_name: Optional[str] = None
@@ -89,6 +89,7 @@ class ExternalDataSourceResponse(ExternalDataSourceBase):
 class SyncImportResponse(BaseModel):
     imported_count: int
     updated_count: int
+    deleted_count: int = 0
     skipped_count: int
     last_synced_row: int
 
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 from uuid import UUID
 
@@ -30,7 +30,12 @@ class MemberResponse(BaseModel):
     user_name: str
     user_email: str
     role: str
+    split_weight: int = 1
     joined_at: datetime
 
     class Config:
         from_attributes = True
+
+
+class MemberUpdate(BaseModel):
+    split_weight: int = Field(ge=0, le=100)  # 공동 지출 분담 비율 (기본 1 = 균등)
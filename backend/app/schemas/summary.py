@@ -60,7 +60,10 @@ class MonthlySettlementRecord(BaseModel):
 
 class SettlementResponse(BaseModel):
     month: str
+    # Shared expenses paid by current members: the amount that is split
     total_shared_expense: int
+    # Shared expenses paid by former members or without a payer (not split)
+    unsplit_shared_expense: int = 0
     settlements: list[SettlementItem]
     # New fields for v1.1
     cumulative_settlements: list[CumulativeSettlement] = []
@@ -1,17 +1,23 @@
 from app.services.auth import (
     get_user_by_email,
     get_user_by_id,
+    get_user_names,
     create_user,
     authenticate_user,
+    create_user_async,
+    authenticate_user_async,
     get_current_user,
+    get_current_user_async,
 )
 from app.services.household import (
     get_user_household,
+    get_user_household_async,
     get_household_by_invite_code,
     create_household,
     join_household,
     get_household_members,
     get_member_by_user_and_household,
+    update_member_split_weight,
 )
 from app.services.entry import (
     get_entries,
@@ -25,3 +31,4 @@ from app.services.summary import (
     get_monthly_summary,
     calculate_settlement,
 )
+from app.services.data_version import get_data_version
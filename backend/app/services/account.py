@@ -1,9 +1,87 @@
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import or_, exists, select
 
-from app.models import Account, User, Household, HouseholdMember
+from app.models import Account, Entry, User, Household, HouseholdMember
 from app.schemas.account import AccountCreate, AccountUpdate
+from app.services.data_version import get_data_version
+
+# Hidden account IDs per (household_id, viewer_user_id), tagged with the
+# household data_version they were read at. Account writes bump that version
+# (on any worker), so a stale set is never used.
+_hidden_account_cache: dict[tuple[UUID, UUID], tuple[int, frozenset[UUID]]] = {}
+
+
+def get_hidden_account_ids(
+    db: Session,
+    household_id: UUID,
+    user_id: UUID,
+) -> frozenset[UUID]:
+    """
+    Get IDs of accounts in the household that the user is not allowed to see:
+    accounts owned by other members with is_shared_visible=False.
+    """
+    key = (household_id, user_id)
+    version = get_data_version(db, household_id)
+    cached = _hidden_account_cache.get(key)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    member_user_ids = select(HouseholdMember.user_id).where(
+        HouseholdMember.household_id == household_id
+    )
+    rows = (
+        db.query(Account.id)
+        .filter(
+            Account.is_shared_visible == False,
+            Account.owner_user_id != user_id,
+            or_(
+                Account.household_id == household_id,
+                Account.owner_user_id.in_(member_user_ids),
+            ),
+        )
+        .all()
+    )
+    hidden = frozenset(r.id for r in rows)
+    _hidden_account_cache[key] = (version, hidden)
+    return hidden
+
+
+def invalidate_hidden_accounts(household_ids) -> None:
+    """Drop cached hidden account sets of the given households"""
+    household_ids = set(household_ids)
+    for key in [k for k in _hidden_account_cache if k[0] in household_ids]:
+        _hidden_account_cache.pop(key, None)
+
+
+def _account_household_ids(db: Session, account: Account) -> set[UUID]:
+    """Households whose visibility an account affects"""
+    if account.household_id:
+        return {account.household_id}
+    # Personal account: every household its owner belongs to
+    rows = db.query(HouseholdMember.household_id).filter(
+        HouseholdMember.user_id == account.owner_user_id
+    )
+    return {r.household_id for r in rows}
+
+
+def visible_entry_filter(db: Session, household_id: UUID, user_id: UUID):
+    """
+    Build a filter that hides entries linked to accounts the user can't see.
+    Returns None when the household has no hidden accounts for this user.
+
+    Expressed as an anti-join (NOT EXISTS) on accounts so the planner can
+    probe the accounts primary key per entry instead of materializing an
+    IN list.
+    """
+    if not get_hidden_account_ids(db, household_id, user_id):
+        return None
+
+    return ~exists().where(
+        Account.id == Entry.account_id,
+        Account.is_shared_visible == False,
+        Account.owner_user_id != user_id,
+    )
 
 
 def get_accessible_accounts(
@@ -84,18 +162,23 @@ def create_account(
     db.add(account)
     db.commit()
     db.refresh(account)
+    invalidate_hidden_accounts(_account_household_ids(db, account))
     return account
 
 
 def update_account(db: Session, account: Account, account_data: AccountUpdate) -> Account:
     update_data = account_data.model_dump(exclude_unset=True)
+    household_ids = _account_household_ids(db, account)
     for field, value in update_data.items():
         setattr(account, field, value)
     db.commit()
     db.refresh(account)
+    invalidate_hidden_accounts(household_ids | _account_household_ids(db, account))
     return account
 
 
 def delete_account(db: Session, account: Account) -> None:
+    household_ids = _account_household_ids(db, account)
     db.delete(account)
     db.commit()
+    invalidate_hidden_accounts(household_ids)
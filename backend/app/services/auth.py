@@ -1,10 +1,18 @@
 from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
-from app.core.database import get_db
-from app.core.security import verify_password, get_password_hash, decode_access_token
+from app.core.database import get_db, get_async_db
+from app.core.security import (
+    get_password_hash,
+    get_password_hash_async,
+    verify_and_update_password,
+    verify_and_update_password_async,
+    decode_access_token,
+)
 from app.models import User
 from app.schemas import UserCreate
 
@@ -19,6 +27,20 @@ def get_user_by_id(db: Session, user_id: UUID) -> User | None:
     return db.query(User).filter(User.id == user_id).first()
 
 
+def get_user_names(db: Session, user_ids) -> dict[UUID, str]:
+    """
+    Map user IDs to names with one IN query.
+    Names are memoized on the session, so repeated lookups within the same
+    request don't hit the database again.
+    """
+    memo: dict[UUID, str] = db.info.setdefault("user_names", {})
+    missing = {uid for uid in user_ids if uid not in memo}
+    if missing:
+        rows = db.query(User.id, User.name).filter(User.id.in_(missing)).all()
+        memo.update({row.id: row.name for row in rows})
+    return {uid: memo[uid] for uid in user_ids if uid in memo}
+
+
 def create_user(db: Session, user_data: UserCreate) -> User:
     hashed_password = get_password_hash(user_data.password)
     db_user = User(
@@ -36,27 +58,76 @@ def authenticate_user(db: Session, email: str, password: str) -> User | None:
     user = get_user_by_email(db, email)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    verified, new_hash = verify_and_update_password(password, user.hashed_password)
+    if not verified:
         return None
+    if new_hash:
+        # Stored hash uses an old scheme or cost; upgrade it transparently
+        user.hashed_password = new_hash
+        db.commit()
     return user
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> User:
-    credentials_exception = HTTPException(
+async def create_user_async(db: AsyncSession, user_data: UserCreate) -> User:
+    db_user = User(
+        email=user_data.email,
+        hashed_password=await get_password_hash_async(user_data.password),
+        name=user_data.name,
+    )
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    return db_user
+
+
+async def authenticate_user_async(db: AsyncSession, email: str, password: str) -> User | None:
+    """authenticate_user with hashing offloaded to the password hash executor"""
+    user = await db.scalar(select(User).where(User.email == email))
+    if not user:
+        return None
+    verified, new_hash = await verify_and_update_password_async(password, user.hashed_password)
+    if not verified:
+        return None
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+    return user
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _user_id_from_token(token: str) -> UUID:
     payload = decode_access_token(token)
     if payload is None:
-        raise credentials_exception
+        raise _credentials_exception()
     user_id: str = payload.get("sub")
     if user_id is None:
-        raise credentials_exception
-    user = get_user_by_id(db, UUID(user_id))
+        raise _credentials_exception()
+    return UUID(user_id)
+
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> User:
+    user = get_user_by_id(db, _user_id_from_token(token))
+    if user is None:
+        raise _credentials_exception()
+    return user
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """get_current_user for async routes; shares the route's AsyncSession"""
+    user = await db.get(User, _user_id_from_token(token))
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
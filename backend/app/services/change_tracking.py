@@ -0,0 +1,94 @@
+"""
+Commit-time change notifications for ORM writes.
+
+Row changes are collected while a session flushes and handed to registered
+listeners only after the transaction commits, so in-process indexes and
+caches never see writes that were rolled back.
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "pending_row_changes"
+_listeners: list[Callable[[list["RowChange"]], None]] = []
+
+
+@dataclass(frozen=True)
+class RowChange:
+    table: str  # e.g. "entries"
+    op: str  # "insert" | "update" | "delete"
+    values: dict[str, Any]  # column values after the change (before, for deletes)
+    previous: dict[str, Any] = field(default_factory=dict)  # old values of modified columns
+
+
+def register_commit_listener(listener: Callable[[list[RowChange]], None]) -> None:
+    """Call listener with the committed row changes after every commit"""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def _snapshot(obj, op: str) -> RowChange | None:
+    state = inspect(obj)
+    table = getattr(state.mapper.local_table, "name", None)
+    if table is None:
+        return None
+
+    values = {}
+    previous = {}
+    for attr in state.mapper.column_attrs:
+        key = attr.key
+        values[key] = state.dict.get(key)
+        if op == "update":
+            history = state.attrs[key].history
+            if history.has_changes():
+                previous[key] = history.deleted[0] if history.deleted else None
+    if op == "update" and not previous:
+        return None
+    return RowChange(table=table, op=op, values=values, previous=previous)
+
+
+def record_changes(session: Session, changes: list[RowChange]) -> None:
+    """
+    Queue changes made with bulk Core statements (which bypass the flush
+    hook) so listeners receive them after the commit like ORM writes.
+    """
+    if _listeners and changes:
+        session.info.setdefault(_PENDING_KEY, []).extend(changes)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, flush_context) -> None:
+    if not _listeners:
+        return
+    pending = session.info.setdefault(_PENDING_KEY, [])
+    for op, objects in (
+        ("insert", session.new),
+        ("update", session.dirty),
+        ("delete", session.deleted),
+    ):
+        for obj in objects:
+            change = _snapshot(obj, op)
+            if change is not None:
+                pending.append(change)
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_changes(session: Session) -> None:
+    changes = session.info.pop(_PENDING_KEY, None)
+    if not changes:
+        return
+    for listener in _listeners:
+        try:
+            listener(changes)
+        except Exception:
+            logger.exception("Commit listener %r failed", listener)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -4,8 +4,12 @@ import io
 import uuid
 from datetime import datetime, date
 from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.metrics import IMPORT_ROWS
+from app.core.streaming import iter_rows
+from app.services.snapshot import get_finalized_months_for_dates
 from app.models import Entry, Category, Subcategory, Account
 from app.schemas.external_source import (
     CSVColumnMapping,
@@ -382,15 +386,21 @@ def execute_import(
     error_count = 0
     errors = []
 
+    # Parse dates once; they also bound the duplicate preload below
+    parsed_dates = [
+        parse_date(row.get(column_mapping.date, "")) if column_mapping.date else None
+        for row in rows
+    ]
+
+    # Entries in finalized settlement months are rejected, as in the entry API
+    finalized = get_finalized_months_for_dates(db, household_id, parsed_dates)
+
     # Get existing entry hashes for duplicate detection
     existing_hashes = set()
     if skip_duplicates:
-        existing_entries = db.query(Entry).filter(
-            Entry.household_id == household_id
-        ).all()
-        for entry in existing_entries:
-            hash_str = f"{entry.date}|{entry.amount}|{entry.memo or ''}"
-            existing_hashes.add(hashlib.md5(hash_str.encode()).hexdigest())
+        existing_hashes = get_existing_entry_hashes(
+            db, household_id, [d for d in parsed_dates if d]
+        )
 
     # Get categories for matching
     categories = db.query(Category).filter(
@@ -469,7 +479,7 @@ def execute_import(
             date_str = row.get(column_mapping.date, "") if column_mapping.date else ""
             amount_str = row.get(column_mapping.amount, "") if column_mapping.amount else ""
 
-            parsed_date = parse_date(date_str)
+            parsed_date = parsed_dates[i]
             parsed_amount = parse_amount(amount_str)
 
             if not parsed_date:
@@ -482,6 +492,12 @@ def execute_import(
                 errors.append(f"Row {i+1}: Invalid amount '{amount_str}'")
                 continue
 
+            month = parsed_date.strftime("%Y-%m")
+            if month in finalized:
+                error_count += 1
+                errors.append(f"Row {i+1}: Settlement for {month} is finalized")
+                continue
+
             # Determine type
             entry_type = "expense"
             if column_mapping.type and row.get(column_mapping.type):
@@ -495,8 +511,7 @@ def execute_import(
 
             # Check for duplicates
             if skip_duplicates:
-                hash_str = f"{parsed_date}|{abs(parsed_amount)}|{memo or ''}"
-                row_hash = hashlib.md5(hash_str.encode()).hexdigest()
+                row_hash = entry_hash(parsed_date, abs(parsed_amount), memo)
                 if row_hash in existing_hashes:
                     skipped_count += 1
                     continue
@@ -569,6 +584,11 @@ def execute_import(
     # Clean up cache
     del _file_cache[file_id]
 
+    IMPORT_ROWS.inc(len(rows), source="csv", result="parsed")
+    IMPORT_ROWS.inc(imported_count, source="csv", result="inserted")
+    IMPORT_ROWS.inc(skipped_count, source="csv", result="skipped")
+    IMPORT_ROWS.inc(error_count, source="csv", result="failed")
+
     return ImportConfirmResponse(
         imported_count=imported_count,
         skipped_count=skipped_count,
@@ -577,25 +597,47 @@ def execute_import(
     )
 
 
+def entry_hash(entry_date, amount, memo) -> bytes:
+    """Duplicate-detection key for an entry: date, amount and memo"""
+    return hashlib.md5(f"{entry_date}|{amount}|{memo or ''}".encode()).digest()
+
+
+def get_existing_entry_hashes(
+    db: Session,
+    household_id: uuid.UUID,
+    dates: list[date],
+) -> set[bytes]:
+    """
+    Hashes of existing entries dated within the range of dates.
+    Only the hashed columns are read, streamed in chunks, so memory depends on
+    the imported period rather than the household's whole history.
+    """
+    if not dates:
+        return set()
+    query = select(Entry.date, Entry.amount, Entry.memo).where(
+        Entry.household_id == household_id,
+        Entry.date.between(min(dates), max(dates)),
+    )
+    return {entry_hash(row.date, row.amount, row.memo) for row in iter_rows(db, query)}
+
+
 def check_duplicates(
     db: Session,
     household_id: uuid.UUID,
     entries: list[dict],
 ) -> list[bool]:
     """Check which entries are duplicates"""
-    existing_entries = db.query(Entry).filter(
-        Entry.household_id == household_id
-    ).all()
-
-    existing_hashes = set()
-    for entry in existing_entries:
-        hash_str = f"{entry.date}|{entry.amount}|{entry.memo or ''}"
-        existing_hashes.add(hashlib.md5(hash_str.encode()).hexdigest())
-
-    results = []
+    dates = []
     for entry_data in entries:
-        hash_str = f"{entry_data.get('date')}|{entry_data.get('amount')}|{entry_data.get('memo', '')}"
-        row_hash = hashlib.md5(hash_str.encode()).hexdigest()
-        results.append(row_hash in existing_hashes)
-
-    return results
+        value = entry_data.get("date")
+        if isinstance(value, str):
+            value = parse_date(value)
+        if isinstance(value, date):
+            dates.append(value)
+    existing_hashes = get_existing_entry_hashes(db, household_id, dates)
+
+    return [
+        entry_hash(entry_data.get("date"), entry_data.get("amount"), entry_data.get("memo", ""))
+        in existing_hashes
+        for entry_data in entries
+    ]
@@ -0,0 +1,253 @@
+"""
+Per-household data version.
+
+Every flush that writes household data bumps `households.data_version` in
+the same transaction, so readers can tell whether anything changed since
+a previous response (ETags) with a single PK lookup.
+
+The response cache needs finer keys, so writes also bump one of:
+- `households.base_version`, for account, member, category and settlement
+  writes (these feed every month's summary);
+- `household_month_versions`, per (household, month), for entry writes dated
+  in that month.
+Both live in the database, so every worker sees every other worker's writes.
+
+Bumps committed by this process are also counted per household, so
+in-process indexes that apply their own commits incrementally can tell
+whether the version moved only because of those writes (see
+local_bump_count).
+"""
+import threading
+from collections import Counter
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import and_, event, inspect, select, update
+from sqlalchemy.orm import Session
+
+from app.models import (
+    Account,
+    Category,
+    Entry,
+    ExternalDataSource,
+    Household,
+    HouseholdMember,
+    HouseholdMonthVersion,
+    MonthlySettlement,
+    Subcategory,
+)
+from app.services.read_routing import mark_household_write
+
+_ALL_HOUSEHOLDS = object()
+_PENDING_KEY = "pending_data_version_bumps"
+
+# Bumps committed by this process: per household, and to all households
+_local_bumps: Counter = Counter()
+_local_bumps_all = 0
+_local_bumps_lock = threading.Lock()
+
+
+def get_data_version(db: Session, household_id: UUID) -> int:
+    """Current data version of a household (0 if unknown)"""
+    version = db.execute(
+        select(Household.data_version).where(Household.id == household_id)
+    ).scalar()
+    return version or 0
+
+
+def get_month_version(db: Session, household_id: UUID, month: str) -> str:
+    """Version token of one month of a household: base_version.month_version"""
+    row = db.execute(
+        select(Household.base_version, HouseholdMonthVersion.version)
+        .select_from(Household)
+        .outerjoin(
+            HouseholdMonthVersion,
+            and_(
+                HouseholdMonthVersion.household_id == Household.id,
+                HouseholdMonthVersion.month == month,
+            ),
+        )
+        .where(Household.id == household_id)
+    ).first()
+    if row is None:
+        return "0.0"
+    return f"{row.base_version or 0}.{row.version or 0}"
+
+
+def _month_of(value) -> str | None:
+    return value.strftime("%Y-%m") if isinstance(value, date) else None
+
+
+def _entry_months(obj: Entry) -> set:
+    """(household_id, month) keys touched by writing an entry, old date included"""
+    dates = [obj.date, *inspect(obj).attrs.date.history.deleted]
+    return {(obj.household_id, m) for m in map(_month_of, dates) if m}
+
+
+def _affected_households(connection, obj) -> set | object:
+    """Household IDs whose data is affected by writing obj"""
+    if isinstance(obj, (Entry, MonthlySettlement, HouseholdMember, ExternalDataSource)):
+        return {obj.household_id}
+
+    if isinstance(obj, Account):
+        if obj.household_id:
+            return {obj.household_id}
+        # Personal account: affects every household its owner belongs to
+        rows = connection.execute(
+            select(HouseholdMember.household_id).where(
+                HouseholdMember.user_id == obj.owner_user_id
+            )
+        )
+        return {r.household_id for r in rows}
+
+    if isinstance(obj, Category):
+        return {obj.household_id} if obj.household_id else _ALL_HOUSEHOLDS
+
+    if isinstance(obj, Subcategory):
+        household_id = connection.execute(
+            select(Category.household_id).where(Category.id == obj.category_id)
+        ).scalar()
+        return {household_id} if household_id else _ALL_HOUSEHOLDS
+
+    return set()
+
+
+def bump_data_version(
+    db: Session,
+    household_ids,
+    all_households: bool = False,
+    months=None,
+) -> None:
+    """
+    Increment data_version for the given households within the current
+    transaction. Needed after bulk UPDATE/DELETE statements, which don't go
+    through the flush hook below.
+
+    Pass the entry months ("YYYY-MM") a bulk entry write touched as months;
+    otherwise the write is treated as affecting every month (base_version).
+    """
+    household_ids = set(household_ids)
+    if months is None:
+        _bump(db, household_ids, all_households, base_ids=household_ids)
+    else:
+        month_keys = {(h, m) for h in household_ids for m in months}
+        _bump(db, household_ids, all_households, month_keys=month_keys)
+
+
+def local_bump_count(household_id: UUID) -> int:
+    """Number of data_version bumps of a household committed by this process"""
+    with _local_bumps_lock:
+        return _local_bumps[household_id] + _local_bumps_all
+
+
+def _bump(
+    session: Session,
+    household_ids: set,
+    all_households: bool,
+    base_ids: set = frozenset(),
+    month_keys: set = frozenset(),
+) -> None:
+    household_ids.discard(None)
+    connection = session.connection()
+    pending = session.info.setdefault(_PENDING_KEY, Counter())
+    if all_households or household_ids:
+        mark_household_write(household_ids, all_households)
+    table = Household.__table__
+    stmt = update(table).values(data_version=table.c.data_version + 1)
+    if all_households:
+        # Unresolved writes (default categories) affect every month everywhere
+        connection.execute(stmt.values(base_version=table.c.base_version + 1))
+        pending[_ALL_HOUSEHOLDS] += 1
+        return
+    if not household_ids:
+        return
+
+    base_ids = {h for h in base_ids if h is not None}
+    if base_ids:
+        connection.execute(
+            stmt.values(base_version=table.c.base_version + 1)
+            .where(table.c.id.in_(base_ids))
+        )
+    rest = household_ids - base_ids
+    if rest:
+        connection.execute(stmt.where(table.c.id.in_(rest)))
+    month_keys = {(h, m) for h, m in month_keys if h is not None}
+    if month_keys:
+        _bump_months(connection, month_keys)
+    pending.update(household_ids)
+
+
+def _bump_months(connection, month_keys: set) -> None:
+    """Upsert household_month_versions rows, incrementing existing ones"""
+    table = HouseholdMonthVersion.__table__
+    rows = [
+        {"household_id": h, "month": m, "version": 1}
+        for h, m in sorted(month_keys, key=lambda k: (str(k[0]), k[1]))
+    ]
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        for row in rows:
+            result = connection.execute(
+                update(table)
+                .where(table.c.household_id == row["household_id"], table.c.month == row["month"])
+                .values(version=table.c.version + 1)
+            )
+            if not result.rowcount:
+                connection.execute(table.insert().values(**row))
+        return
+
+    stmt = insert(table)
+    connection.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[table.c.household_id, table.c.month],
+            set_={"version": table.c.version + 1},
+        ),
+        rows,
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_data_versions(session: Session, flush_context) -> None:
+    objects = list(session.new) + list(session.dirty) + list(session.deleted)
+    if not objects:
+        return
+
+    connection = session.connection()
+    household_ids = set()
+    base_ids = set()
+    month_keys = set()
+    bump_all = False
+    for obj in objects:
+        if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        affected = _affected_households(connection, obj)
+        if affected is _ALL_HOUSEHOLDS:
+            bump_all = True
+            break
+        household_ids |= affected
+        if isinstance(obj, Entry):
+            month_keys |= _entry_months(obj)
+        elif not isinstance(obj, ExternalDataSource):
+            base_ids |= affected
+
+    _bump(session, household_ids, bump_all, base_ids, month_keys)
+
+
+@event.listens_for(Session, "after_commit")
+def _count_committed_bumps(session: Session) -> None:
+    global _local_bumps_all
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    with _local_bumps_lock:
+        _local_bumps_all += pending.pop(_ALL_HOUSEHOLDS, 0)
+        _local_bumps.update(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_bumps(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
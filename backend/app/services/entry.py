@@ -1,11 +1,14 @@
 from uuid import UUID
 from datetime import date, datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import extract, or_, func
-from typing import Optional
+from sqlalchemy.orm import Query, Session
+from sqlalchemy import extract, or_, func, select
+from typing import Iterable, Optional
 
+from app.core.streaming import iter_rows
 from app.models import Entry, Category, HouseholdMember, Account
 from app.schemas.entry import EntryCreate, EntryUpdate, EntrySummary
+from app.services.account import visible_entry_filter
+from app.services.search import apply_memo_search, memo_rank_order
 
 
 def get_date_range_from_preset(preset: str) -> tuple[date, date]:
@@ -63,8 +66,8 @@ def determine_transfer_type(
         return "external_in"
 
 
-def calculate_summary(entries: list[Entry]) -> EntrySummary:
-    """Calculate summary for a list of entries"""
+def calculate_summary(entries: Iterable[Entry]) -> EntrySummary:
+    """Calculate summary for entries (or rows with type, transfer_type and amount, e.g. per-type sums)"""
     total_income = 0
     total_expense = 0
     total_transfer_in = 0
@@ -114,10 +117,18 @@ def calculate_running_balances(
     # Get initial balance
     initial_balance = account.balance or 0
 
-    # Get ALL entries for this account, sorted by date asc
+    # Walk ALL entries for this account, sorted by date asc. Only the columns
+    # the balance needs are read, streamed in chunks
     all_entries = (
-        db.query(Entry)
-        .filter(
+        select(
+            Entry.id,
+            Entry.type,
+            Entry.amount,
+            Entry.account_id,
+            Entry.transfer_from_account_id,
+            Entry.transfer_to_account_id,
+        )
+        .where(
             or_(
                 Entry.account_id == account_id,
                 Entry.transfer_from_account_id == account_id,
@@ -125,7 +136,6 @@ def calculate_running_balances(
             )
         )
         .order_by(Entry.occurred_at.asc().nullslast(), Entry.date.asc(), Entry.created_at.asc())
-        .all()
     )
 
     # Calculate running balance
@@ -133,7 +143,7 @@ def calculate_running_balances(
     balance_map = {}
     entry_ids_set = {e.id for e in entries}
 
-    for entry in all_entries:
+    for entry in iter_rows(db, all_entries):
         # Calculate balance change for this account
         if entry.type == "income" and entry.account_id == account_id:
             balance += entry.amount
@@ -148,11 +158,14 @@ def calculate_running_balances(
         # Store balance if this entry is in our filtered list
         if entry.id in entry_ids_set:
             balance_map[entry.id] = balance
+            # Later entries can't affect balances already recorded
+            if len(balance_map) == len(entry_ids_set):
+                break
 
     return balance_map
 
 
-def get_entries(
+def filter_entries(
     db: Session,
     household_id: UUID,
     current_user_id: UUID | None = None,
@@ -172,12 +185,8 @@ def get_entries(
     amount_min: int | None = None,
     amount_max: int | None = None,
     memo_search: str | None = None,
-    sort_by: str = "occurred_at",
-    sort_order: str = "desc",
-    page: int = 1,
-    page_size: int = 50,
-) -> tuple[list[Entry], int, EntrySummary, dict[UUID, int]]:
-    """Get entries with filtering and pagination. Returns (entries, total_count, summary, balance_map)."""
+) -> Query:
+    """Entry query with the list filters applied (shared by the list and export)"""
     query = db.query(Entry).filter(Entry.household_id == household_id)
 
     # Filter by account visibility: only show entries from
@@ -185,22 +194,9 @@ def get_entries(
     # - accounts owned by current user (regardless of is_shared_visible)
     # - entries without an account (account_id is NULL)
     if current_user_id:
-        # Get list of hidden account IDs (accounts not visible to this user)
-        hidden_accounts = db.query(Account.id).filter(
-            Account.is_shared_visible == False,
-            Account.owner_user_id != current_user_id,
-        ).all()
-        hidden_account_id_list = [a.id for a in hidden_accounts]
-
-        # Exclude entries linked to hidden accounts
-        if hidden_account_id_list:
-            query = query.filter(
-                # Entry must NOT have account_id in hidden list
-                or_(
-                    Entry.account_id == None,
-                    ~Entry.account_id.in_(hidden_account_id_list),
-                )
-            )
+        visibility_filter = visible_entry_filter(db, household_id, current_user_id)
+        if visibility_filter is not None:
+            query = query.filter(visibility_filter)
 
     # Date preset takes priority over explicit date_from/date_to
     if date_preset:
@@ -276,17 +272,26 @@ def get_entries(
 
     # Memo search filter
     if memo_search:
-        query = query.filter(Entry.memo.ilike(f"%{memo_search}%"))
+        query = apply_memo_search(db, query, household_id, memo_search)
 
-    # Get total count before pagination
-    total_count = query.count()
+    return query
 
-    # Get all filtered entries for summary calculation (without pagination)
-    all_filtered_entries = query.all()
-    summary = calculate_summary(all_filtered_entries)
 
-    # Sorting - use date as primary, occurred_at as secondary
-    if sort_by == "amount":
+def order_entries(
+    db: Session,
+    query: Query,
+    sort_by: str = "occurred_at",
+    sort_order: str = "desc",
+    memo_search: str | None = None,
+) -> Query:
+    """Apply the list ordering; date is primary, occurred_at secondary"""
+    if sort_by == "relevance" and memo_search:
+        query = query.order_by(
+            *memo_rank_order(db, memo_search),
+            Entry.date.desc(),
+            Entry.created_at.desc(),
+        )
+    elif sort_by == "amount":
         if sort_order == "asc":
             query = query.order_by(Entry.amount.asc(), Entry.date.desc(), Entry.created_at.desc())
         else:
@@ -298,6 +303,74 @@ def get_entries(
         else:
             query = query.order_by(Entry.date.desc(), Entry.occurred_at.desc().nullslast(), Entry.created_at.desc())
 
+    return query
+
+
+def get_entries(
+    db: Session,
+    household_id: UUID,
+    current_user_id: UUID | None = None,
+    month: str | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    date_preset: str | None = None,
+    category_id: UUID | None = None,
+    category_ids: list[UUID] | None = None,
+    include_uncategorized: bool = False,
+    payer_member_id: UUID | None = None,
+    shared: bool | None = None,
+    entry_type: str | None = None,
+    entry_types: list[str] | None = None,
+    transfer_type: str | None = None,
+    account_ids: list[UUID] | None = None,
+    amount_min: int | None = None,
+    amount_max: int | None = None,
+    memo_search: str | None = None,
+    sort_by: str = "occurred_at",
+    sort_order: str = "desc",
+    page: int = 1,
+    page_size: int = 50,
+) -> tuple[list[Entry], int, EntrySummary, dict[UUID, int]]:
+    """Get entries with filtering and pagination. Returns (entries, total_count, summary, balance_map)."""
+    query = filter_entries(
+        db,
+        household_id,
+        current_user_id=current_user_id,
+        month=month,
+        date_from=date_from,
+        date_to=date_to,
+        date_preset=date_preset,
+        category_id=category_id,
+        category_ids=category_ids,
+        include_uncategorized=include_uncategorized,
+        payer_member_id=payer_member_id,
+        shared=shared,
+        entry_type=entry_type,
+        entry_types=entry_types,
+        transfer_type=transfer_type,
+        account_ids=account_ids,
+        amount_min=amount_min,
+        amount_max=amount_max,
+        memo_search=memo_search,
+    )
+
+    # Total count and summary over all filtered entries (without pagination)
+    # from one aggregate per (type, transfer_type)
+    totals = (
+        query.with_entities(
+            Entry.type,
+            Entry.transfer_type,
+            func.count(Entry.id).label("count"),
+            func.coalesce(func.sum(Entry.amount), 0).label("amount"),
+        )
+        .group_by(Entry.type, Entry.transfer_type)
+        .all()
+    )
+    total_count = sum(row.count for row in totals)
+    summary = calculate_summary(totals)
+
+    query = order_entries(db, query, sort_by, sort_order, memo_search)
+
     # Pagination
     offset = (page - 1) * page_size
     entries = query.offset(offset).limit(page_size).all()
@@ -0,0 +1,188 @@
+"""
+Streaming export of entries (CSV, XLSX, Parquet).
+
+Rows are read as flat tuples (names joined in SQL, no ORM objects) through a
+server-side cursor (app.core.streaming), so memory stays constant however many
+entries are exported. CSV is streamed as it is written; XLSX (openpyxl
+write-only) and Parquet (one row group per batch) are assembled in a
+temporary file and streamed from disk.
+"""
+import csv
+import io
+import tempfile
+from typing import Iterable, Iterator
+
+from sqlalchemy.orm import Query, aliased
+
+from app.core.metrics import EXPORT_ROWS
+from app.core.streaming import iter_rows
+from app.models import Account, Category, Entry, HouseholdMember, Subcategory, User
+
+EXPORT_BATCH_SIZE = 2_000
+FILE_CHUNK_SIZE = 64 * 1024
+# Excel's row limit per sheet (header included); longer exports continue on a new sheet
+XLSX_MAX_ROWS = 1_048_576
+
+# Headers match what the CSV import auto-detects, so an export can be re-imported
+EXPORT_COLUMNS = [
+    "날짜", "시각", "구분", "이체유형", "금액", "카테고리", "세부카테고리",
+    "메모", "결제자", "공동", "계좌", "출금계좌", "입금계좌",
+]
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def check_export_format(fmt: str) -> None:
+    """Raise ValueError for unknown formats or a missing optional library"""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+    if fmt == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ValueError("Parquet export requires pyarrow. Run: pip install pyarrow")
+
+
+def export_rows(query: Query) -> Iterator[tuple]:
+    """Flat rows (in EXPORT_COLUMNS order) for an Entry query, fetched in batches"""
+    # Accounts are aliased so the visibility NOT EXISTS still correlates to entries
+    category = aliased(Category)
+    subcategory = aliased(Subcategory)
+    payer_member = aliased(HouseholdMember)
+    payer = aliased(User)
+    account = aliased(Account)
+    from_account = aliased(Account)
+    to_account = aliased(Account)
+
+    rows = (
+        query.outerjoin(category, Entry.category_id == category.id)
+        .outerjoin(subcategory, Entry.subcategory_id == subcategory.id)
+        .outerjoin(payer_member, Entry.payer_member_id == payer_member.id)
+        .outerjoin(payer, payer_member.user_id == payer.id)
+        .outerjoin(account, Entry.account_id == account.id)
+        .outerjoin(from_account, Entry.transfer_from_account_id == from_account.id)
+        .outerjoin(to_account, Entry.transfer_to_account_id == to_account.id)
+        .with_entities(
+            Entry.date,
+            Entry.occurred_at,
+            Entry.type,
+            Entry.transfer_type,
+            Entry.amount,
+            category.name,
+            subcategory.name,
+            Entry.memo,
+            payer.name,
+            Entry.shared,
+            account.name,
+            from_account.name,
+            to_account.name,
+        )
+    )
+    return iter_rows(query.session, rows, EXPORT_BATCH_SIZE)
+
+
+def _batches(rows: Iterable[tuple], fmt: str) -> Iterator[list[tuple]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            EXPORT_ROWS.inc(len(batch), format=fmt)
+            yield batch
+            batch = []
+    if batch:
+        EXPORT_ROWS.inc(len(batch), format=fmt)
+        yield batch
+
+
+def _stream_file(f) -> Iterator[bytes]:
+    f.seek(0)
+    while chunk := f.read(FILE_CHUNK_SIZE):
+        yield chunk
+
+
+def _write_csv(rows: Iterable[tuple]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM so Excel opens the Korean text as UTF-8
+    buffer.write("\ufeff")
+    writer.writerow(EXPORT_COLUMNS)
+    for batch in _batches(rows, "csv"):
+        for (day, occurred_at, type_, transfer_type, amount, *names, shared,
+             account, from_account, to_account) in batch:
+            writer.writerow([
+                day.isoformat(),
+                occurred_at.strftime("%H:%M") if occurred_at else "",
+                type_,
+                transfer_type or "",
+                amount,
+                *(name or "" for name in names),
+                "Y" if shared else "N",
+                account or "",
+                from_account or "",
+                to_account or "",
+            ])
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _write_xlsx(rows: Iterable[tuple]) -> Iterator[bytes]:
+    from openpyxl import Workbook
+
+    # write_only streams rows to a temp file instead of building the sheet in memory
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("거래")
+    sheet.append(EXPORT_COLUMNS)
+    sheet_rows = 1
+    for batch in _batches(rows, "xlsx"):
+        for row in batch:
+            if sheet_rows >= XLSX_MAX_ROWS:
+                sheet = workbook.create_sheet(f"거래{len(workbook.worksheets) + 1}")
+                sheet.append(EXPORT_COLUMNS)
+                sheet_rows = 1
+            sheet.append(tuple(row))
+            sheet_rows += 1
+
+    with tempfile.TemporaryFile() as f:
+        workbook.save(f)
+        yield from _stream_file(f)
+
+
+def _write_parquet(rows: Iterable[tuple]) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    types = [
+        pa.date32(), pa.timestamp("us"), pa.string(), pa.string(), pa.int64(),
+        pa.string(), pa.string(), pa.string(), pa.string(), pa.bool_(),
+        pa.string(), pa.string(), pa.string(),
+    ]
+    schema = pa.schema(list(zip(EXPORT_COLUMNS, types)))
+
+    with tempfile.TemporaryFile() as f:
+        with pq.ParquetWriter(f, schema) as writer:
+            for batch in _batches(rows, "parquet"):
+                columns = list(zip(*batch))
+                writer.write_batch(pa.record_batch(
+                    [pa.array(values, type=t) for values, t in zip(columns, types)],
+                    schema=schema,
+                ))
+        yield from _stream_file(f)
+
+
+_WRITERS = {
+    "csv": _write_csv,
+    "xlsx": _write_xlsx,
+    "parquet": _write_parquet,
+}
+
+
+def export_entries(query: Query, fmt: str) -> Iterator[bytes]:
+    """Encoded file chunks for an Entry query; call check_export_format first"""
+    return _WRITERS[fmt](export_rows(query))
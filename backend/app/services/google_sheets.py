@@ -1,8 +1,9 @@
 import hashlib
 from datetime import datetime
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 
 from app.models import (
@@ -17,93 +18,16 @@ from app.schemas.external_source import (
     SyncImportResponse,
     SyncExportResponse,
 )
-from app.core.config import settings
+from app.core.metrics import IMPORT_ROWS, SHEETS_SYNC_BATCHES
+from app.core.streaming import iter_rows
+from app.services.change_tracking import RowChange, record_changes
+from app.services.csv_import import parse_amount, parse_date
+from app.services.data_version import bump_data_version
+from app.services.sheets_client import get_sheet_version, read_sheet_values, update_sheet_values
+from app.services.snapshot import get_finalized_months_for_dates
 
-
-def get_sheets_client():
-    """
-    Get Google Sheets API client using service account credentials.
-    Returns None if credentials are not configured.
-    """
-    if not settings.GOOGLE_SERVICE_ACCOUNT_FILE:
-        return None
-
-    try:
-        from google.oauth2.service_account import Credentials
-        from googleapiclient.discovery import build
-
-        SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
-        credentials = Credentials.from_service_account_file(
-            settings.GOOGLE_SERVICE_ACCOUNT_FILE,
-            scopes=SCOPES,
-        )
-        service = build("sheets", "v4", credentials=credentials)
-        return service.spreadsheets()
-    except Exception as e:
-        print(f"Failed to initialize Google Sheets client: {e}")
-        return None
-
-
-def read_sheet_data(
-    sheet_id: str,
-    sheet_name: str,
-    start_row: int = 2,  # Skip header row
-    max_rows: int = 1000,
-) -> tuple[list[list[str]], int]:
-    """
-    Read data from Google Sheet.
-    Returns (rows, last_row_number)
-    """
-    client = get_sheets_client()
-    if not client:
-        raise ValueError("Google Sheets is not configured")
-
-    range_name = f"'{sheet_name}'!A{start_row}:Z{start_row + max_rows - 1}"
-
-    try:
-        result = client.values().get(
-            spreadsheetId=sheet_id,
-            range=range_name,
-        ).execute()
-
-        values = result.get("values", [])
-        last_row = start_row + len(values) - 1 if values else start_row - 1
-
-        return values, last_row
-    except Exception as e:
-        raise ValueError(f"Failed to read sheet: {e}")
-
-
-def write_sheet_data(
-    sheet_id: str,
-    sheet_name: str,
-    data: list[list[str]],
-    start_row: int = 2,
-) -> int:
-    """
-    Write data to Google Sheet.
-    Returns number of rows written.
-    """
-    client = get_sheets_client()
-    if not client:
-        raise ValueError("Google Sheets is not configured")
-
-    if not data:
-        return 0
-
-    range_name = f"'{sheet_name}'!A{start_row}"
-
-    try:
-        result = client.values().update(
-            spreadsheetId=sheet_id,
-            range=range_name,
-            valueInputOption="USER_ENTERED",
-            body={"values": data},
-        ).execute()
-
-        return result.get("updatedRows", 0)
-    except Exception as e:
-        raise ValueError(f"Failed to write to sheet: {e}")
+# Rows per values.update call when exporting
+SHEETS_WRITE_BATCH_SIZE = 1_000
 
 
 def get_external_sources(
@@ -177,6 +101,44 @@ def generate_row_hash(row: list[str]) -> str:
     return hashlib.md5("|".join(row).encode()).hexdigest()
 
 
+def _parse_sheet_row(row: list[str], columns: dict, category_map: dict) -> dict | None:
+    """Entry fields (type, amount, date, category_id, memo) for a sheet row, or None if unparseable"""
+    def cell(name: str, default: str = "") -> str:
+        col = columns[name]
+        return row[col] if len(row) > col else default
+
+    parsed_date = parse_date(cell("date"))
+    parsed_amount = parse_amount(cell("amount"))
+    if not parsed_date or parsed_amount is None:
+        return None
+
+    # Determine type
+    entry_type = "expense"
+    type_lower = cell("type", "expense").lower()
+    if "income" in type_lower or "수입" in type_lower:
+        entry_type = "income"
+    elif "transfer" in type_lower or "이체" in type_lower:
+        entry_type = "transfer"
+
+    # Find category
+    category_str = cell("category")
+    category_id = category_map.get(category_str.lower().strip()) if category_str else None
+
+    memo_str = cell("memo")
+    return {
+        "type": entry_type,
+        "amount": abs(parsed_amount),
+        "date": parsed_date,
+        "occurred_at": datetime.combine(parsed_date, datetime.min.time()),
+        "category_id": category_id,
+        "memo": memo_str if memo_str else None,
+    }
+
+
+def _is_blank(row: list[str]) -> bool:
+    return not any(str(cell).strip() for cell in row)
+
+
 def sync_import(
     db: Session,
     source: ExternalDataSource,
@@ -184,16 +146,25 @@ def sync_import(
 ) -> SyncImportResponse:
     """
     Import data from Google Sheet to entries.
-    Only imports new rows since last sync.
+    New rows since the last sync are inserted. When the sheet's version
+    changed since the last import, already-synced rows are re-scanned as
+    well: rows whose hash changed update their entry in place, and rows that
+    were cleared or removed delete it. Rows are identified by row number, so
+    deleting a row in the middle of the sheet shows up as updates to every
+    row below it.
     """
-    start_row = (source.last_synced_row or 1) + 1
-    rows, last_row = read_sheet_data(
+    sheet_version = get_sheet_version(source.sheet_id)
+    rescan = bool(source.last_synced_row) and (
+        sheet_version is None or sheet_version != source.sheet_checksum
+    )
+    start_row = 2 if rescan else (source.last_synced_row or 1) + 1
+    rows, last_row = read_sheet_values(
         source.sheet_id,
         source.sheet_name,
         start_row=start_row,
     )
 
-    if not rows:
+    if not rows and not rescan:
         return SyncImportResponse(
             imported_count=0,
             updated_count=0,
@@ -202,11 +173,13 @@ def sync_import(
         )
 
     column_mapping = source.column_mapping or {}
-    date_col = column_mapping.get("date", 0)
-    amount_col = column_mapping.get("amount", 1)
-    type_col = column_mapping.get("type", 2)
-    category_col = column_mapping.get("category", 3)
-    memo_col = column_mapping.get("memo", 4)
+    columns = {
+        "date": column_mapping.get("date", 0),
+        "amount": column_mapping.get("amount", 1),
+        "type": column_mapping.get("type", 2),
+        "category": column_mapping.get("category", 3),
+        "memo": column_mapping.get("memo", 4),
+    }
 
     # Get categories for matching
     categories = db.query(Category).filter(
@@ -214,107 +187,216 @@ def sync_import(
     ).all()
     category_map = {c.name.lower(): c.id for c in categories}
 
+    # Refs in one query: row id -> (ref id, hash, entry id). A re-scan loads
+    # all of the source's refs so rows that disappeared are noticed too
+    row_ids = [str(start_row + i) for i in range(len(rows))]
+    ref_query = select(
+        EntryExternalRef.external_row_id,
+        EntryExternalRef.id,
+        EntryExternalRef.external_hash,
+        EntryExternalRef.entry_id,
+    ).where(EntryExternalRef.source_id == source.id)
+    if not rescan:
+        ref_query = ref_query.where(EntryExternalRef.external_row_id.in_(row_ids))
+    refs = {ref.external_row_id: ref for ref in iter_rows(db, ref_query)}
+
     imported_count = 0
-    updated_count = 0
     skipped_count = 0
+    now = datetime.utcnow()
+    entry_rows = []
+    ref_rows = []
+    changed = {}  # entry_id -> (ref, new hash, entry fields)
+    removed = []  # refs whose row was cleared or removed
 
-    for i, row in enumerate(rows):
-        row_number = start_row + i
-        external_row_id = str(row_number)
+    for external_row_id, row in zip(row_ids, rows):
         row_hash = generate_row_hash(row)
 
         # Check if row already imported
-        existing_ref = (
-            db.query(EntryExternalRef)
-            .filter(
-                EntryExternalRef.source_id == source.id,
-                EntryExternalRef.external_row_id == external_row_id,
-            )
-            .first()
-        )
-
-        if existing_ref:
-            if existing_ref.external_hash == row_hash:
+        ref = refs.pop(external_row_id, None)
+        if ref is not None:
+            if ref.external_hash == row_hash:
                 # No changes
                 skipped_count += 1
-                continue
+            elif _is_blank(row):
+                removed.append(ref)
             else:
-                # Row updated - update entry
-                # TODO: Implement update logic
-                skipped_count += 1
-                continue
+                try:
+                    fields = _parse_sheet_row(row, columns, category_map)
+                except Exception:
+                    fields = None
+                if fields is None:
+                    skipped_count += 1
+                else:
+                    changed[ref.entry_id] = (ref, row_hash, fields)
+            continue
 
-        # Parse row data
         try:
-            date_str = row[date_col] if len(row) > date_col else ""
-            amount_str = row[amount_col] if len(row) > amount_col else ""
-            type_str = row[type_col] if len(row) > type_col else "expense"
-            category_str = row[category_col] if len(row) > category_col else ""
-            memo_str = row[memo_col] if len(row) > memo_col else ""
-
-            # Parse date
-            from app.services.csv_import import parse_date, parse_amount
-            parsed_date = parse_date(date_str)
-            parsed_amount = parse_amount(amount_str)
-
-            if not parsed_date or parsed_amount is None:
-                skipped_count += 1
-                continue
-
-            # Determine type
-            entry_type = "expense"
-            type_lower = type_str.lower()
-            if "income" in type_lower or "수입" in type_lower:
-                entry_type = "income"
-            elif "transfer" in type_lower or "이체" in type_lower:
-                entry_type = "transfer"
-
-            # Find category
-            category_id = None
-            if category_str:
-                category_id = category_map.get(category_str.lower().strip())
-
-            # Create entry
-            entry = Entry(
-                household_id=source.household_id,
-                created_by_user_id=source.created_by_user_id,
-                type=entry_type,
-                amount=abs(parsed_amount),
-                date=parsed_date,
-                occurred_at=datetime.combine(parsed_date, datetime.min.time()),
-                category_id=category_id,
-                memo=memo_str if memo_str else None,
-                payer_member_id=payer_member_id,
-                shared=False,
-                account_id=source.account_id,
-            )
-            db.add(entry)
-            db.flush()  # Get entry.id
-
-            # Create external ref
-            ref = EntryExternalRef(
-                entry_id=entry.id,
-                source_id=source.id,
-                external_row_id=external_row_id,
-                external_hash=row_hash,
-            )
-            db.add(ref)
+            fields = _parse_sheet_row(row, columns, category_map)
+        except Exception:
+            fields = None
+        if fields is None:
+            skipped_count += 1
+            continue
 
-            imported_count += 1
+        entry_id = uuid4()
+        entry_rows.append({
+            "id": entry_id,
+            "household_id": source.household_id,
+            "created_by_user_id": source.created_by_user_id,
+            "transfer_type": None,
+            "subcategory_id": None,
+            "payer_member_id": payer_member_id,
+            "shared": False,
+            "account_id": source.account_id,
+            "transfer_from_account_id": None,
+            "transfer_to_account_id": None,
+            "created_at": now,
+            "updated_at": now,
+            **fields,
+        })
+        ref_rows.append({
+            "id": uuid4(),
+            "entry_id": entry_id,
+            "source_id": source.id,
+            "external_row_id": external_row_id,
+            "external_hash": row_hash,
+            "created_at": now,
+            "updated_at": now,
+        })
+        imported_count += 1
+
+    if rescan:
+        # Refs not matched by any row point past the last non-empty row. The
+        # read covers the sheet's whole grid (see iter_sheet_rows), so those
+        # rows really were removed and not just left unread
+        removed.extend(refs.values())
+
+    # Current values of the entries to change, in one query
+    touched_ids = list(changed) + [ref.entry_id for ref in removed]
+    current = {}
+    if touched_ids:
+        current = {
+            row.id: row._asdict()
+            for row in db.execute(
+                select(*Entry.__table__.columns).where(Entry.id.in_(touched_ids))
+            )
+        }
+    finalized = get_finalized_months_for_dates(
+        db,
+        source.household_id,
+        [entry["date"] for entry in current.values()]
+        + [fields["date"] for _, _, fields in changed.values()]
+        + [row["date"] for row in entry_rows],
+    )
 
-        except Exception as e:
+    def is_locked(*dates) -> bool:
+        return any(d.strftime("%Y-%m") in finalized for d in dates if d)
+
+    # Changes to finalized months are held back (like edits through the API)
+    # and retried by the next sync once the month is reopened
+    held_back = False
+    if any(is_locked(row["date"]) for row in entry_rows):
+        held_back = True
+        locked = {row["id"] for row in entry_rows if is_locked(row["date"])}
+        entry_rows = [row for row in entry_rows if row["id"] not in locked]
+        ref_rows = [ref for ref in ref_rows if ref["entry_id"] not in locked]
+        imported_count -= len(locked)
+        skipped_count += len(locked)
+
+    entry_updates = []
+    ref_updates = []
+    row_changes = []
+    for entry_id, (ref, row_hash, fields) in changed.items():
+        old = current.get(entry_id)
+        if old is None:
+            continue
+        if is_locked(old["date"], fields["date"]):
             skipped_count += 1
+            held_back = True
+            continue
+        ref_updates.append({"id": ref.id, "external_hash": row_hash, "updated_at": now})
+        previous = {key: old[key] for key, value in fields.items() if old[key] != value}
+        if not previous:
+            # Only columns outside the mapping changed
             continue
+        entry_updates.append({"id": entry_id, **fields, "updated_at": now})
+        row_changes.append(RowChange(
+            table="entries",
+            op="update",
+            values={**old, **fields, "updated_at": now},
+            previous=previous,
+        ))
+
+    removed_ref_ids = []
+    removed_entry_ids = []
+    for ref in removed:
+        old = current.get(ref.entry_id)
+        if old is not None and is_locked(old["date"]):
+            skipped_count += 1
+            held_back = True
+            continue
+        removed_ref_ids.append(ref.id)
+        if old is not None:
+            removed_entry_ids.append(ref.entry_id)
+            row_changes.append(RowChange(table="entries", op="delete", values=old))
+
+    # Bulk statements: UPDATEs are batched by primary key (executemany)
+    if entry_updates:
+        db.execute(update(Entry), entry_updates)
+    if ref_updates:
+        db.execute(update(EntryExternalRef), ref_updates)
+    if removed_ref_ids:
+        db.execute(
+            delete(EntryExternalRef)
+            .where(EntryExternalRef.id.in_(removed_ref_ids))
+            .execution_options(synchronize_session=False)
+        )
+    if removed_entry_ids:
+        db.execute(
+            delete(Entry)
+            .where(Entry.id.in_(removed_entry_ids))
+            .execution_options(synchronize_session=False)
+        )
+    if entry_rows:
+        db.execute(insert(Entry.__table__), entry_rows)
+        db.execute(insert(EntryExternalRef.__table__), ref_rows)
+        row_changes.extend(RowChange(table="entries", op="insert", values=row) for row in entry_rows)
+
+    if row_changes:
+        # Bulk statements skip the flush hooks: bump the household's data
+        # versions of the touched months and queue the row changes for the
+        # commit listeners
+        months = {
+            value.strftime("%Y-%m")
+            for change in row_changes
+            for value in (change.values.get("date"), change.previous.get("date"))
+            if value is not None
+        }
+        bump_data_version(db, {source.household_id}, months=months)
+        record_changes(db, row_changes)
 
     # Update last synced info
-    source.last_synced_at = datetime.utcnow()
+    source.last_synced_at = now
     source.last_synced_row = last_row
+    # Without a version (or with held-back changes) the next sync re-scans
+    source.sheet_checksum = None if held_back else sheet_version
 
     db.commit()
 
+    updated_count = len(entry_updates)
+    deleted_count = len(removed_entry_ids)
+
+    SHEETS_SYNC_BATCHES.inc(direction="import")
+    IMPORT_ROWS.inc(len(rows), source="sheets", result="parsed")
+    IMPORT_ROWS.inc(imported_count, source="sheets", result="inserted")
+    IMPORT_ROWS.inc(updated_count, source="sheets", result="updated")
+    IMPORT_ROWS.inc(deleted_count, source="sheets", result="deleted")
+    IMPORT_ROWS.inc(skipped_count, source="sheets", result="skipped")
+
     return SyncImportResponse(
         imported_count=imported_count,
         updated_count=updated_count,
+        deleted_count=deleted_count,
         skipped_count=skipped_count,
         last_synced_row=last_row,
     )
@@ -326,74 +408,106 @@ def sync_export(
 ) -> SyncExportResponse:
     """
     Export entries to Google Sheet.
-    Only exports entries not yet exported.
+    Only exports entries not yet exported, written and committed in chunks.
     """
     # Get entries without external refs for this source
-    exported_entry_ids = (
-        db.query(EntryExternalRef.entry_id)
-        .filter(EntryExternalRef.source_id == source.id)
-        .subquery()
+    exported_entry_ids = select(EntryExternalRef.entry_id).where(
+        EntryExternalRef.source_id == source.id
     )
 
-    entries_query = db.query(Entry).filter(
-        Entry.household_id == source.household_id,
-        ~Entry.id.in_(exported_entry_ids),
+    entries_query = (
+        select(
+            Entry.id,
+            Entry.date,
+            Entry.amount,
+            Entry.type,
+            Category.name.label("category_name"),
+            Entry.memo,
+        )
+        .outerjoin(Category, Entry.category_id == Category.id)
+        .where(
+            Entry.household_id == source.household_id,
+            ~Entry.id.in_(exported_entry_ids),
+        )
+        .order_by(Entry.date, Entry.created_at)
     )
 
     if source.account_id:
-        entries_query = entries_query.filter(Entry.account_id == source.account_id)
-
-    entries = entries_query.order_by(Entry.date, Entry.created_at).limit(1000).all()
-
-    if not entries:
-        return SyncExportResponse(
-            exported_count=0,
-            last_synced_row=source.last_synced_row or 0,
-        )
-
-    # Prepare data for export
-    column_mapping = source.column_mapping or {}
-    data = []
-
-    for entry in entries:
-        row = [
-            entry.date.strftime("%Y-%m-%d"),
-            str(entry.amount),
-            entry.type,
-            entry.category.name if entry.category else "",
-            entry.memo or "",
-        ]
-        data.append(row)
+        entries_query = entries_query.where(Entry.account_id == source.account_id)
 
+    exported_count = 0
     # Determine start row
     start_row = (source.last_synced_row or 1) + 1
+    # Our own writes change the Drive version. If nothing else changed the
+    # sheet since the last import, store the post-write version afterwards so
+    # the next import doesn't rescan every row because of this export
+    sheet_unchanged = None
+
+    # One chunk per query and commit: exported entries get refs and drop out
+    # of the next query, and whatever is already in the sheet stays recorded
+    # if a later chunk fails (no cursor is held across commits)
+    while True:
+        entries = db.execute(entries_query.limit(SHEETS_WRITE_BATCH_SIZE)).all()
+        if not entries:
+            break
+        if sheet_unchanged is None:
+            sheet_unchanged = (
+                source.sheet_checksum is not None
+                and get_sheet_version(source.sheet_id) == source.sheet_checksum
+            )
 
-    # Write to sheet
-    written = write_sheet_data(
-        source.sheet_id,
-        source.sheet_name,
-        data,
-        start_row=start_row,
-    )
+        # Prepare data for export
+        data = [
+            [
+                entry.date.strftime("%Y-%m-%d"),
+                str(entry.amount),
+                entry.type,
+                entry.category_name or "",
+                entry.memo or "",
+            ]
+            for entry in entries
+        ]
 
-    # Create external refs
-    for i, entry in enumerate(entries[:written] if written else entries):
-        row_number = start_row + i
-        ref = EntryExternalRef(
-            entry_id=entry.id,
-            source_id=source.id,
-            external_row_id=str(row_number),
-            external_hash=generate_row_hash(data[i]),
+        # Write to sheet
+        written = update_sheet_values(
+            source.sheet_id,
+            source.sheet_name,
+            data,
+            start_row=start_row,
         )
-        db.add(ref)
 
-    # Update last synced info
-    source.last_synced_at = datetime.utcnow()
-    source.last_synced_row = start_row + len(entries) - 1
+        # Create external refs for the rows actually written
+        if written:
+            db.execute(
+                insert(EntryExternalRef.__table__),
+                [
+                    {
+                        "entry_id": entry.id,
+                        "source_id": source.id,
+                        "external_row_id": str(start_row + i),
+                        "external_hash": generate_row_hash(data[i]),
+                    }
+                    for i, entry in enumerate(entries[:written])
+                ],
+            )
 
-    db.commit()
+            # Update last synced info
+            start_row += written
+            exported_count += written
+            source.last_synced_at = datetime.utcnow()
+            source.last_synced_row = start_row - 1
+        db.commit()
+
+        SHEETS_SYNC_BATCHES.inc(direction="export")
+        if written < len(entries):
+            # Short write: the rest is picked up by the next sync
+            break
+
+    if exported_count and sheet_unchanged:
+        source.sheet_checksum = get_sheet_version(source.sheet_id)
+        db.commit()
 
     return SyncExportResponse(
-        exported_count=len(entries),
-        last_synced_row=source.last_synced_row,
+        exported_count=exported_count,
+        last_synced_row=source.last_synced_row or 0,
     )
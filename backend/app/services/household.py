@@ -1,4 +1,6 @@
 from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models import Household, HouseholdMember, User
@@ -16,6 +18,15 @@ def get_user_household(db: Session, user_id: UUID) -> Household | None:
     return None
 
 
+async def get_user_household_async(db: AsyncSession, user_id: UUID) -> Household | None:
+    return await db.scalar(
+        select(Household)
+        .join(HouseholdMember, HouseholdMember.household_id == Household.id)
+        .where(HouseholdMember.user_id == user_id)
+        .limit(1)
+    )
+
+
 def get_household_by_invite_code(db: Session, invite_code: str) -> Household | None:
     return db.query(Household).filter(Household.invite_code == invite_code).first()
 
@@ -69,3 +80,12 @@ def get_member_by_user_and_household(
         )
         .first()
     )
+
+
+def update_member_split_weight(
+    db: Session, member: HouseholdMember, split_weight: int
+) -> HouseholdMember:
+    member.split_weight = split_weight
+    db.commit()
+    db.refresh(member)
+    return member
@@ -0,0 +1,48 @@
+"""
+Read-replica routing with a read-your-writes guard.
+
+Every flush that writes household data marks the household as recently
+written (see data_version). For READ_YOUR_WRITES_SECONDS afterwards its
+reads stay on the primary, so a member never sees a replica that hasn't
+caught up with their own change yet. The marker lives in the cache backend;
+multi-worker deployments need a shared one (CACHE_URL).
+"""
+from uuid import UUID
+
+from app.core.cache import get_cache
+from app.core.config import settings
+from app.core.database import use_read_replica
+
+
+def _recent_write_key(household_id) -> str:
+    return f"rw:{household_id}"
+
+
+def mark_household_write(household_ids, all_households: bool = False) -> None:
+    if not settings.READ_REPLICA_URLS:
+        return
+    cache = get_cache()
+    ttl = settings.READ_YOUR_WRITES_SECONDS
+    if all_households:
+        cache.set(_recent_write_key("all"), 1, ttl=ttl)
+    for household_id in household_ids:
+        cache.set(_recent_write_key(household_id), 1, ttl=ttl)
+
+
+def has_recent_write(household_id: UUID) -> bool:
+    cache = get_cache()
+    return (
+        cache.get(_recent_write_key(household_id)) is not None
+        or cache.get(_recent_write_key("all")) is not None
+    )
+
+
+def route_reads_to_replica(db, household_id: UUID) -> bool:
+    """
+    Send the rest of this session's reads to a replica unless the household
+    wrote recently. Call once the household is resolved. Returns True if
+    the session now reads from a replica.
+    """
+    if not settings.READ_REPLICA_URLS or has_recent_write(household_id):
+        return False
+    return use_read_replica(db)
@@ -0,0 +1,90 @@
+"""
+Cache for computed summary and settlement responses.
+
+Keys embed the household's version token for the month (see
+data_version.get_month_version):
+- base_version, bumped by account, member, category and settlement writes
+  (these feed net balance, visibility and cumulative settlement)
+- the (household, month) version, bumped by entry writes dated in that month
+
+Writes therefore invalidate only the months they touch; stale entries are
+never read again and age out of the LRU. Both versions are bumped in the
+database by the transaction that writes, so they hold across workers with
+either cache backend.
+
+get_or_compute_async serves AsyncSession routes without blocking the event
+loop: the version lookup runs on the connection, Redis calls in the thread
+pool, and compute is awaited so callers decide where their work runs.
+"""
+from typing import Awaitable, Callable, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import get_cache
+from app.core.config import settings
+from app.services.data_version import get_month_version
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _cache_key(kind: str, household_id: UUID, month: str, params: tuple, version: str) -> str:
+    return "{}:{}:{}:{}:{}".format(
+        kind,
+        household_id,
+        month,
+        ":".join(str(p) for p in params),
+        version,
+    )
+
+
+def get_or_compute(
+    db: Session,
+    model: type[ModelT],
+    kind: str,
+    household_id: UUID,
+    month: str,
+    params: tuple,
+    compute: Callable[[], ModelT],
+) -> ModelT:
+    """Return a cached response for (kind, household, month, params) or compute and store it"""
+    cache = get_cache()
+    key = _cache_key(kind, household_id, month, params, get_month_version(db, household_id, month))
+    cached = cache.get(key)
+    if cached is not None:
+        return model.model_validate(cached)
+
+    value = compute()
+    cache.set(key, value.model_dump(mode="json"), ttl=settings.CACHE_TTL_SECONDS)
+    return value
+
+
+async def _cache_call(fn: Callable, *args, **kwargs):
+    if get_cache().blocking:
+        return await run_in_threadpool(fn, *args, **kwargs)
+    return fn(*args, **kwargs)
+
+
+async def get_or_compute_async(
+    db: AsyncSession,
+    model: type[ModelT],
+    kind: str,
+    household_id: UUID,
+    month: str,
+    params: tuple,
+    compute: Callable[[], Awaitable[ModelT]],
+) -> ModelT:
+    """get_or_compute for AsyncSession routes; compute is awaited"""
+    cache = get_cache()
+    version = await db.run_sync(get_month_version, household_id, month)
+    key = _cache_key(kind, household_id, month, params, version)
+    cached = await _cache_call(cache.get, key)
+    if cached is not None:
+        return model.model_validate(cached)
+
+    value = await compute()
+    await _cache_call(cache.set, key, value.model_dump(mode="json"), ttl=settings.CACHE_TTL_SECONDS)
+    return value
@@ -0,0 +1,190 @@
+"""
+Memo search for entries.
+
+On PostgreSQL, `memo ILIKE '%term%'` is served by the pg_trgm GIN index
+created in migration 008 and results can be ranked by trigram similarity.
+Other dialects (e.g. SQLite dev/test setups) fall back to an in-process
+n-gram inverted index per household that narrows the search to candidate
+entry IDs.
+
+Trigrams need at least 3 characters, so on PostgreSQL shorter terms (e.g.
+2-syllable Hangul like "커피") are still substring matches but scan the
+household's rows instead of using the index. memo_rank_order puts memos
+starting with the term first.
+"""
+import threading
+from collections import defaultdict
+from uuid import UUID
+
+from sqlalchemy import case, false, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+from starlette.concurrency import run_in_threadpool
+
+from app.models import Entry
+from app.services.change_tracking import RowChange, register_commit_listener
+
+# Bigrams rather than trigrams: most Korean merchant names are 2-4 syllables
+NGRAM_SIZE = 2
+# Larger match sets are filtered with LIKE instead of an IN list, which
+# would exceed SQLite's bound-parameter limit
+MAX_MATCHED_IDS = 500
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def escape_like(term: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _ngrams(text: str) -> set[str]:
+    if len(text) < NGRAM_SIZE:
+        return set()
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+def is_postgres(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+class MemoIndex:
+    """In-process n-gram inverted index of entry memos for one household"""
+
+    def __init__(self):
+        self.memos: dict[UUID, str] = {}
+        self.postings: dict[str, set[UUID]] = defaultdict(set)
+
+    def add(self, entry_id: UUID, memo: str | None) -> None:
+        self.remove(entry_id)
+        if not memo:
+            return
+        text = normalize_text(memo)
+        self.memos[entry_id] = text
+        for gram in _ngrams(text):
+            self.postings[gram].add(entry_id)
+
+    def remove(self, entry_id: UUID) -> None:
+        text = self.memos.pop(entry_id, None)
+        if text is None:
+            return
+        for gram in _ngrams(text):
+            ids = self.postings.get(gram)
+            if ids is not None:
+                ids.discard(entry_id)
+                if not ids:
+                    del self.postings[gram]
+
+    def search(self, term: str) -> set[UUID]:
+        """Return IDs of entries whose memo contains term (case-insensitive)"""
+        text = normalize_text(term)
+        if not text:
+            return set()
+
+        grams = _ngrams(text)
+        if grams:
+            posting_lists = sorted((self.postings.get(g, set()) for g in grams), key=len)
+            candidates = set(posting_lists[0])
+            for ids in posting_lists[1:]:
+                candidates &= ids
+                if not candidates:
+                    return set()
+        else:
+            candidates = self.memos.keys()
+
+        return {eid for eid in candidates if text in self.memos[eid]}
+
+
+_indexes: dict[UUID, MemoIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def _load_memo_rows(db: Session, household_id: UUID) -> list:
+    return (
+        db.query(Entry.id, Entry.memo)
+        .filter(Entry.household_id == household_id, Entry.memo != None)
+        .all()
+    )
+
+
+def _build_memo_index(household_id: UUID, rows: list) -> MemoIndex:
+    index = MemoIndex()
+    for row in rows:
+        index.add(row.id, row.memo)
+
+    with _indexes_lock:
+        return _indexes.setdefault(household_id, index)
+
+
+def get_memo_index(db: Session, household_id: UUID) -> MemoIndex:
+    """Get the household's memo index, building it from entries on first use"""
+    index = _indexes.get(household_id)
+    if index is not None:
+        return index
+    return _build_memo_index(household_id, _load_memo_rows(db, household_id))
+
+
+async def ensure_memo_index_async(db: AsyncSession, household_id: UUID) -> None:
+    """
+    Build the household's memo index ahead of a search from an async route:
+    memos are read in run_sync, n-grams computed in the thread pool
+    """
+    if household_id in _indexes or db.bind.dialect.name == "postgresql":
+        return
+    rows = await db.run_sync(_load_memo_rows, household_id)
+    await run_in_threadpool(_build_memo_index, household_id, rows)
+
+
+def _apply_entry_changes(changes: list[RowChange]) -> None:
+    for change in changes:
+        if change.table != "entries":
+            continue
+        household_id = change.values.get("household_id")
+        index = _indexes.get(household_id)
+        if index is None:
+            continue
+        entry_id = change.values.get("id")
+        if change.op == "delete":
+            index.remove(entry_id)
+        elif change.op == "insert" or "memo" in change.previous:
+            index.add(entry_id, change.values.get("memo"))
+
+
+register_commit_listener(_apply_entry_changes)
+
+
+def apply_memo_search(db: Session, query: Query, household_id: UUID, term: str) -> Query:
+    """Filter an Entry query to entries whose memo contains term"""
+    term = term.strip()
+    if not term:
+        return query
+
+    pattern = Entry.memo.ilike(f"%{escape_like(term)}%", escape="\\")
+    if is_postgres(db):
+        return query.filter(pattern)
+
+    matched_ids = get_memo_index(db, household_id).search(term)
+    if not matched_ids:
+        return query.filter(false())
+    if len(matched_ids) > MAX_MATCHED_IDS:
+        return query.filter(pattern)
+    return query.filter(Entry.id.in_(matched_ids))
+
+
+def memo_rank_order(db: Session, term: str) -> list:
+    """
+    ORDER BY clauses ranking memo matches: memos starting with the term first,
+    then word-prefix matches, then by trigram similarity (PostgreSQL only).
+    """
+    pattern = escape_like(term.strip())
+    prefix_rank = case(
+        (Entry.memo.ilike(f"{pattern}%", escape="\\"), 0),
+        (Entry.memo.ilike(f"% {pattern}%", escape="\\"), 1),
+        else_=2,
+    )
+    order = [prefix_rank.asc()]
+    if is_postgres(db):
+        order.append(func.similarity(Entry.memo, term.strip()).desc())
+    return order
@@ -0,0 +1,149 @@
+"""
+Settlement engine: weighted splits and minimum-transfer solving.
+
+split_by_weights divides a total into integer shares that add up exactly
+(largest-remainder method), so no KRW is lost to rounding.
+
+minimize_transfers turns net balances into a list of transfers. The fewest
+transfers for n non-zero balances is n - k, where k is the largest number
+of disjoint zero-sum groups they can be split into. For small groups this is
+solved exactly with a DP over subsets (O(2^n * n)); larger groups fall back
+to pairing exact opposites and then greedy largest-first matching.
+"""
+from typing import Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+# 2^12 * 12 ≈ 50k steps; beyond this the exact solver gets noticeably slow
+EXACT_SOLVER_MAX_PARTIES = 12
+
+
+def split_by_weights(total: int, weights: dict[K, int]) -> dict[K, int]:
+    """
+    Split total into integer shares proportional to weights.
+    Shares always sum to total; leftover units go to the largest fractional
+    remainders (ties broken by key order for stable results).
+    """
+    if not weights:
+        return {}
+    weight_sum = sum(max(w, 0) for w in weights.values())
+    if weight_sum == 0:
+        weights = {k: 1 for k in weights}
+        weight_sum = len(weights)
+
+    keys = sorted(weights, key=str)
+    shares = {}
+    remainders = []
+    for key in keys:
+        quotient, remainder = divmod(total * max(weights[key], 0), weight_sum)
+        shares[key] = quotient
+        remainders.append((remainder, key))
+
+    leftover = total - sum(shares.values())
+    remainders.sort(key=lambda r: -r[0])
+    for _, key in remainders[:leftover]:
+        shares[key] += 1
+    return shares
+
+
+def _greedy_transfers(balances: list[tuple[K, int]]) -> list[tuple[K, K, int]]:
+    """Match largest debtor with largest creditor until everything is settled"""
+    debtors = sorted(([k, -b] for k, b in balances if b < 0), key=lambda x: -x[1])
+    creditors = sorted(([k, b] for k, b in balances if b > 0), key=lambda x: -x[1])
+
+    transfers = []
+    i = j = 0
+    while i < len(debtors) and j < len(creditors):
+        amount = min(debtors[i][1], creditors[j][1])
+        if amount > 0:
+            transfers.append((debtors[i][0], creditors[j][0], amount))
+        debtors[i][1] -= amount
+        creditors[j][1] -= amount
+        if debtors[i][1] == 0:
+            i += 1
+        if creditors[j][1] == 0:
+            j += 1
+    return transfers
+
+
+def _zero_sum_groups(balances: list[tuple[K, int]]) -> list[list[tuple[K, int]]]:
+    """Split balances into the maximum number of zero-sum groups (exact, DP over subsets)"""
+    n = len(balances)
+    full = (1 << n) - 1
+    subset_sum = [0] * (full + 1)
+    best = [0] * (full + 1)
+    for mask in range(1, full + 1):
+        low_bit = mask & -mask
+        subset_sum[mask] = subset_sum[mask ^ low_bit] + balances[low_bit.bit_length() - 1][1]
+        closes_group = 1 if subset_sum[mask] == 0 else 0
+        m = mask
+        while m:
+            bit = m & -m
+            candidate = best[mask ^ bit] + closes_group
+            if candidate > best[mask]:
+                best[mask] = candidate
+            m ^= bit
+
+    # Walk back to recover an element ordering whose zero-sum prefixes are the groups
+    order = []
+    mask = full
+    while mask:
+        closes_group = 1 if subset_sum[mask] == 0 else 0
+        m = mask
+        while m:
+            bit = m & -m
+            if best[mask ^ bit] + closes_group == best[mask]:
+                break
+            m ^= bit
+        order.append(bit.bit_length() - 1)
+        mask ^= bit
+    order.reverse()
+
+    groups = []
+    current = []
+    running = 0
+    for index in order:
+        current.append(balances[index])
+        running += balances[index][1]
+        if running == 0:
+            groups.append(current)
+            current = []
+    if current:
+        groups.append(current)
+    return groups
+
+
+def minimize_transfers(balances: dict[K, int]) -> list[tuple[K, K, int]]:
+    """
+    Compute transfers (from, to, amount) that settle balances.
+    Positive balance = should receive, negative = should pay.
+    Balances must sum to zero.
+    """
+    nonzero = sorted(((k, b) for k, b in balances.items() if b != 0), key=lambda x: str(x[0]))
+    if not nonzero:
+        return []
+    if sum(b for _, b in nonzero) != 0:
+        raise ValueError("Balances must sum to zero")
+
+    if len(nonzero) <= EXACT_SOLVER_MAX_PARTIES:
+        groups = _zero_sum_groups(nonzero)
+    else:
+        # Heuristic: settle exact opposite pairs directly, greedy for the rest
+        groups = []
+        unmatched: dict[int, list[tuple[K, int]]] = {}
+        rest = []
+        for item in nonzero:
+            partners = unmatched.get(-item[1])
+            if partners:
+                groups.append([partners.pop(), item])
+            else:
+                unmatched.setdefault(item[1], []).append(item)
+        for items in unmatched.values():
+            rest.extend(items)
+        if rest:
+            groups.append(rest)
+
+    transfers = []
+    for group in groups:
+        transfers.extend(_greedy_transfers(group))
+    return transfers
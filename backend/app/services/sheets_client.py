@@ -0,0 +1,230 @@
+"""
+Google Sheets API client layer.
+
+Credentials are loaded once per process and the discovery-built service is
+cached per thread (httplib2, which the client uses underneath, is not
+thread-safe), so a sync no longer rebuilds the client. Reads page through a
+sheet with values.batchGet, several row ranges per request. The Drive file
+version serves as a cheap change marker for the whole spreadsheet.
+
+GOOGLE_SHEETS_ENDPOINT points the client at another server, e.g. the fake
+in scripts/fake_sheets_server.py; without a service account file the fake
+is called anonymously.
+"""
+import logging
+import threading
+from functools import lru_cache
+from typing import Iterator
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    # files.get(version) for change detection
+    "https://www.googleapis.com/auth/drive.metadata.readonly",
+]
+LAST_COLUMN = "Z"
+NUM_RETRIES = 3  # retries on 429/5xx with exponential backoff (googleapiclient)
+
+_local = threading.local()
+
+
+def is_configured() -> bool:
+    return bool(settings.GOOGLE_SERVICE_ACCOUNT_FILE or settings.GOOGLE_SHEETS_ENDPOINT)
+
+
+@lru_cache(maxsize=1)
+def _get_credentials():
+    if settings.GOOGLE_SERVICE_ACCOUNT_FILE:
+        from google.oauth2.service_account import Credentials
+
+        # Access tokens are refreshed by google-auth as they expire
+        return Credentials.from_service_account_file(
+            settings.GOOGLE_SERVICE_ACCOUNT_FILE,
+            scopes=SCOPES,
+        )
+    from google.auth.credentials import AnonymousCredentials
+
+    return AnonymousCredentials()
+
+
+def _get_service(api: str, version: str):
+    """Discovery-built service for this thread, built on first use"""
+    services = _local.__dict__.setdefault("services", {})
+    service = services.get((api, version))
+    if service is not None:
+        return service
+
+    if not is_configured():
+        raise ValueError("Google Sheets is not configured")
+
+    try:
+        from googleapiclient.discovery import build
+
+        client_options = None
+        if settings.GOOGLE_SHEETS_ENDPOINT:
+            client_options = {"api_endpoint": settings.GOOGLE_SHEETS_ENDPOINT.rstrip("/") + "/"}
+        # The bundled (static) discovery document avoids a network round trip
+        service = build(
+            api,
+            version,
+            credentials=_get_credentials(),
+            client_options=client_options,
+            static_discovery=True,
+            cache_discovery=False,
+        )
+    except Exception as e:
+        raise ValueError(f"Failed to initialize Google Sheets client: {e}")
+
+    services[(api, version)] = service
+    return service
+
+
+def get_sheets_client():
+    """
+    spreadsheets() resource for this thread.
+    Raises ValueError if Google Sheets is not configured.
+    """
+    return _get_service("sheets", "v4").spreadsheets()
+
+
+def get_sheet_version(sheet_id: str) -> str | None:
+    """
+    Drive file version of the spreadsheet: a cheap checksum that changes on
+    every edit. None if it can't be read (e.g. Drive API not enabled).
+    """
+    try:
+        result = _get_service("drive", "v3").files().get(
+            fileId=sheet_id,
+            fields="version",
+            supportsAllDrives=True,
+        ).execute(num_retries=NUM_RETRIES)
+    except Exception as e:
+        logger.warning("Could not read version of sheet %s: %s", sheet_id, e)
+        return None
+    version = result.get("version")
+    return str(version) if version is not None else None
+
+
+def reset_sheets_client() -> None:
+    """Forget cached credentials and clients (after changing settings)"""
+    _get_credentials.cache_clear()
+    _local.__dict__.clear()
+
+
+def a1_range(sheet_name: str, start_row: int, end_row: int | None = None) -> str:
+    escaped = sheet_name.replace("'", "''")
+    if end_row is None:
+        return f"'{escaped}'!A{start_row}"
+    return f"'{escaped}'!A{start_row}:{LAST_COLUMN}{end_row}"
+
+
+def get_sheet_row_count(sheet_id: str, sheet_name: str) -> int:
+    """Number of rows in the sheet's grid (data ends at or before it)"""
+    try:
+        result = get_sheets_client().get(
+            spreadsheetId=sheet_id,
+            fields="sheets.properties(title,gridProperties.rowCount)",
+        ).execute(num_retries=NUM_RETRIES)
+    except Exception as e:
+        raise ValueError(f"Failed to read sheet: {e}")
+    for sheet in result.get("sheets", []):
+        properties = sheet.get("properties", {})
+        if properties.get("title") == sheet_name:
+            return properties.get("gridProperties", {}).get("rowCount", 0)
+    raise ValueError(f"Sheet '{sheet_name}' not found")
+
+
+def iter_sheet_rows(
+    sheet_id: str,
+    sheet_name: str,
+    start_row: int = 2,
+    max_rows: int | None = None,
+    page_rows: int | None = None,
+    ranges_per_request: int | None = None,
+) -> Iterator[tuple[int, list[str]]]:
+    """
+    Yield (row_number, values) from start_row to the last non-empty row (or
+    max_rows rows). Each batchGet asks for ranges_per_request consecutive
+    ranges of page_rows rows, up to the sheet's grid row count. Blank rows
+    before the last non-empty one are yielded as [], so row numbers are
+    contiguous; trailing blank rows are not yielded.
+    """
+    client = get_sheets_client()
+    page_rows = page_rows or settings.GOOGLE_SHEETS_PAGE_ROWS
+    ranges_per_request = ranges_per_request or settings.GOOGLE_SHEETS_RANGES_PER_REQUEST
+    # Ranges past the grid are rejected, and a short range can end in blank
+    # rows with data below, so the grid size is what bounds the read
+    end_row = get_sheet_row_count(sheet_id, sheet_name)
+    if max_rows:
+        end_row = min(end_row, start_row + max_rows - 1)
+
+    row_number = start_row
+    blank_from = start_row  # first row after the last non-empty one seen
+    while row_number <= end_row:
+        ranges = []
+        for i in range(ranges_per_request):
+            first = row_number + i * page_rows
+            if first > end_row:
+                break
+            ranges.append((first, min(first + page_rows - 1, end_row)))
+
+        try:
+            result = client.values().batchGet(
+                spreadsheetId=sheet_id,
+                ranges=[a1_range(sheet_name, first, last) for first, last in ranges],
+                majorDimension="ROWS",
+            ).execute(num_retries=NUM_RETRIES)
+        except Exception as e:
+            raise ValueError(f"Failed to read sheet: {e}")
+
+        value_ranges = result.get("valueRanges", [])
+        if len(value_ranges) != len(ranges):
+            raise ValueError("Failed to read sheet: incomplete batchGet response")
+        for (first, last), value_range in zip(ranges, value_ranges):
+            # Trailing empty rows of each range are omitted
+            values = value_range.get("values", [])
+            if not values:
+                continue
+            for number in range(blank_from, first):
+                yield number, []
+            for offset, row in enumerate(values):
+                yield first + offset, row
+            blank_from = first + len(values)
+        row_number = ranges[-1][1] + 1
+
+
+def read_sheet_values(
+    sheet_id: str,
+    sheet_name: str,
+    start_row: int = 2,
+    max_rows: int | None = None,
+) -> tuple[list[list[str]], int]:
+    """All rows from start_row as (rows, last_row_number)"""
+    rows = [row for _, row in iter_sheet_rows(sheet_id, sheet_name, start_row, max_rows)]
+    last_row = start_row + len(rows) - 1 if rows else start_row - 1
+    return rows, last_row
+
+
+def update_sheet_values(
+    sheet_id: str,
+    sheet_name: str,
+    data: list[list[str]],
+    start_row: int = 2,
+) -> int:
+    """Write rows starting at start_row; returns the number of rows written"""
+    if not data:
+        return 0
+    client = get_sheets_client()
+    try:
+        result = client.values().update(
+            spreadsheetId=sheet_id,
+            range=a1_range(sheet_name, start_row),
+            valueInputOption="USER_ENTERED",
+            body={"values": data},
+        ).execute(num_retries=NUM_RETRIES)
+    except Exception as e:
+        raise ValueError(f"Failed to write to sheet: {e}")
+    return result.get("updatedRows", 0)
@@ -0,0 +1,123 @@
+"""
+Snapshots of finalized months.
+
+Finalizing a month stores its SettlementResponse and every member's
+unfiltered MonthlySummary as JSON, so old months are served with a single
+lookup instead of being recomputed. Entries dated in a finalized month can't
+be edited until the month is reopened, which drops the snapshot.
+"""
+from datetime import date, datetime
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session
+
+from app.models import MonthlySettlement, SettlementSnapshot
+from app.schemas.summary import MonthlySummary, SettlementResponse
+from app.services.data_version import bump_data_version
+
+
+def get_snapshot(db: Session, household_id: UUID, month: str) -> SettlementSnapshot | None:
+    return (
+        db.query(SettlementSnapshot)
+        .filter(
+            SettlementSnapshot.household_id == household_id,
+            SettlementSnapshot.month == month,
+        )
+        .first()
+    )
+
+
+def get_settlement_snapshot(
+    db: Session, household_id: UUID, month: str
+) -> SettlementResponse | None:
+    snapshot = get_snapshot(db, household_id, month)
+    if snapshot is None:
+        return None
+    return SettlementResponse.model_validate(snapshot.settlement)
+
+
+def get_summary_snapshot(
+    db: Session, household_id: UUID, month: str, user_id: UUID
+) -> MonthlySummary | None:
+    snapshot = get_snapshot(db, household_id, month)
+    if snapshot is None:
+        return None
+    payload = snapshot.summaries.get(str(user_id))
+    return MonthlySummary.model_validate(payload) if payload else None
+
+
+def store_snapshot(
+    db: Session,
+    household_id: UUID,
+    settlement: SettlementResponse,
+    summaries: dict[UUID, MonthlySummary],
+) -> SettlementSnapshot:
+    """Create or replace the snapshot of a month (caller commits)"""
+    snapshot = get_snapshot(db, household_id, settlement.month)
+    if snapshot is None:
+        snapshot = SettlementSnapshot(household_id=household_id, month=settlement.month)
+        db.add(snapshot)
+    snapshot.settlement = settlement.model_dump(mode="json")
+    # net_balance is the live total of account balances, not a value of the
+    # month, so it isn't frozen; get_monthly_summary fills it in when serving
+    snapshot.summaries = {
+        str(user_id): summary.model_dump(mode="json", exclude={"net_balance"})
+        for user_id, summary in summaries.items()
+    }
+    return snapshot
+
+
+def get_finalized_months(
+    db: Session, household_id: UUID, months: Iterable[str]
+) -> set[str]:
+    """Months among the given ones that have finalized settlement records"""
+    months = set(months)
+    if not months:
+        return set()
+    rows = (
+        db.query(MonthlySettlement.month)
+        .filter(
+            MonthlySettlement.household_id == household_id,
+            MonthlySettlement.month.in_(months),
+            MonthlySettlement.is_finalized == True,
+        )
+        .distinct()
+        .all()
+    )
+    return {row.month for row in rows}
+
+
+def get_finalized_months_for_dates(
+    db: Session, household_id: UUID, dates: Iterable[date | None]
+) -> set[str]:
+    return get_finalized_months(
+        db, household_id, {d.strftime("%Y-%m") for d in dates if d is not None}
+    )
+
+
+def reopen_month(db: Session, household_id: UUID, month: str) -> int:
+    """Un-finalize a month's settlement records and drop its snapshot"""
+    result = db.execute(
+        update(MonthlySettlement)
+        .where(
+            MonthlySettlement.household_id == household_id,
+            MonthlySettlement.month == month,
+            MonthlySettlement.is_finalized == True,
+        )
+        .values(is_finalized=False, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(
+        delete(SettlementSnapshot)
+        .where(
+            SettlementSnapshot.household_id == household_id,
+            SettlementSnapshot.month == month,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    # Bulk statements bypass ORM change tracking, so bump versions explicitly
+    bump_data_version(db, {household_id})
+    db.commit()
+    return result.rowcount
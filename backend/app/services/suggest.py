@@ -0,0 +1,303 @@
+"""
+Typeahead suggestions for entry memos and category names.
+
+Each household gets an in-memory prefix trie, built lazily from its entries
+and updated incrementally by a commit listener as entries are written in
+this process. Category, account and membership changes (renames,
+visibility) drop the affected household's trie so it is rebuilt.
+
+Writes made by other workers are caught through the household data_version:
+a trie stays valid while the version has only moved by bumps this process
+committed itself (whose changes the listener applied), and is rebuilt
+otherwise. Tries are evicted LRU across households so memory stays bounded.
+
+Entries linked to private accounts (is_shared_visible=False) are left out so
+suggestions never reveal another member's private memos.
+"""
+import math
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from app.models import Account, Category, Entry, HouseholdMember
+from app.schemas.entry import EntrySuggestion
+from app.services.change_tracking import RowChange, register_commit_listener
+from app.services.data_version import get_data_version, local_bump_count
+
+MAX_SUGGEST_HOUSEHOLDS = 256
+RECENCY_HALF_LIFE_DAYS = 30
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+@dataclass
+class TermStats:
+    text: str  # display form (first seen spelling)
+    kind: str  # "memo" | "category"
+    count: int = 0
+    last_used: date | None = None
+    category_counts: Counter = field(default_factory=Counter)
+    category_id: UUID | None = None  # for kind == "category"
+
+    def score(self, today: date) -> float:
+        if self.last_used is None:
+            return float(self.count)
+        age_days = max((today - self.last_used).days, 0)
+        return self.count * math.pow(0.5, age_days / RECENCY_HALF_LIFE_DAYS)
+
+
+class _Node:
+    __slots__ = ("children", "terms")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        self.terms: dict[str, TermStats] = {}  # kind -> stats, at terminal nodes
+
+
+class SuggestTrie:
+    """Prefix trie of normalized memo and category terms for one household"""
+
+    def __init__(self, version: int = 0, local_bumps: int = 0):
+        # data_version and this process' bump count when the trie was built
+        self.version = version
+        self.local_bumps = local_bumps
+        self.root = _Node()
+        self.category_names: dict[UUID, str] = {}
+        self.private_account_ids: set[UUID] = set()
+        self.member_user_ids: set[UUID] = set()
+
+    def _node(self, key: str, create: bool) -> _Node | None:
+        node = self.root
+        for ch in key:
+            child = node.children.get(ch)
+            if child is None:
+                if not create:
+                    return None
+                child = node.children[ch] = _Node()
+            node = child
+        return node
+
+    def add(
+        self,
+        text: str,
+        kind: str,
+        count: int = 1,
+        last_used: date | None = None,
+        category_id: UUID | None = None,
+    ) -> None:
+        key = _normalize(text)
+        if not key:
+            return
+        node = self._node(key, create=True)
+        stats = node.terms.get(kind)
+        if stats is None:
+            stats = node.terms[kind] = TermStats(text=text.strip(), kind=kind)
+        stats.count += count
+        if last_used and (stats.last_used is None or last_used > stats.last_used):
+            stats.last_used = last_used
+        if kind == "memo" and category_id:
+            stats.category_counts[category_id] += count
+        if kind == "category":
+            stats.category_id = category_id
+
+    def discard(self, text: str, kind: str, category_id: UUID | None = None) -> None:
+        node = self._node(_normalize(text), create=False)
+        stats = node.terms.get(kind) if node else None
+        if stats is None:
+            return
+        stats.count = max(stats.count - 1, 0)
+        if category_id and stats.category_counts[category_id] > 0:
+            stats.category_counts[category_id] -= 1
+        # Category names stay suggestible even when no entry uses them
+        if stats.count == 0 and kind == "memo":
+            del node.terms[kind]
+
+    def is_current(self, version: int, local_bumps: int) -> bool:
+        """True if the version only moved by this process' own (applied) writes"""
+        return version - self.version == local_bumps - self.local_bumps
+
+    def search(self, prefix: str, limit: int, today: date) -> list[TermStats]:
+        node = self._node(_normalize(prefix), create=False)
+        if node is None:
+            return []
+        found = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            found.extend(current.terms.values())
+            stack.extend(current.children.values())
+        found.sort(key=lambda s: s.score(today), reverse=True)
+        return found[:limit]
+
+    def top_category(self, stats: TermStats) -> UUID | None:
+        counts = +stats.category_counts
+        if not counts:
+            return None
+        return counts.most_common(1)[0][0]
+
+
+_tries: OrderedDict[UUID, SuggestTrie] = OrderedDict()
+_tries_lock = threading.Lock()
+
+
+def _build_trie(db: Session, household_id: UUID, version: int, local_bumps: int) -> SuggestTrie:
+    trie = SuggestTrie(version, local_bumps)
+
+    categories = db.query(Category).filter(
+        (Category.household_id == None) | (Category.household_id == household_id)
+    ).all()
+    for category in categories:
+        trie.category_names[category.id] = category.name
+        trie.add(category.name, "category", count=0, category_id=category.id)
+
+    member_user_ids = select(HouseholdMember.user_id).where(
+        HouseholdMember.household_id == household_id
+    )
+    trie.member_user_ids = set(db.execute(member_user_ids).scalars())
+    private_accounts = db.query(Account.id).filter(
+        Account.is_shared_visible == False,
+        or_(
+            Account.household_id == household_id,
+            Account.owner_user_id.in_(member_user_ids),
+        ),
+    ).all()
+    trie.private_account_ids = {a.id for a in private_accounts}
+
+    # Aggregate in SQL: one row per (memo, category) instead of per entry
+    query = db.query(
+        Entry.memo,
+        Entry.category_id,
+        func.count().label("count"),
+        func.max(Entry.date).label("last_used"),
+    ).filter(
+        Entry.household_id == household_id,
+        Entry.memo != None,
+    )
+    if trie.private_account_ids:
+        query = query.filter(
+            or_(
+                Entry.account_id == None,
+                ~Entry.account_id.in_(trie.private_account_ids),
+            )
+        )
+    rows = query.group_by(Entry.memo, Entry.category_id).all()
+    for row in rows:
+        trie.add(row.memo, "memo", count=row.count, last_used=row.last_used, category_id=row.category_id)
+        if row.category_id and row.category_id in trie.category_names:
+            trie.add(
+                trie.category_names[row.category_id],
+                "category",
+                count=row.count,
+                last_used=row.last_used,
+                category_id=row.category_id,
+            )
+    return trie
+
+
+def get_suggest_trie(db: Session, household_id: UUID) -> SuggestTrie:
+    """
+    Get the household's trie, (re)building it on first use or when other
+    workers wrote to the household since it was built, and evicting LRU
+    """
+    local_bumps = local_bump_count(household_id)
+    version = get_data_version(db, household_id)
+    with _tries_lock:
+        trie = _tries.get(household_id)
+        if trie is not None and trie.is_current(version, local_bumps):
+            _tries.move_to_end(household_id)
+            return trie
+
+    trie = _build_trie(db, household_id, version, local_bumps)
+    if local_bump_count(household_id) != local_bumps:
+        # A local commit landed during the build and may be missing from
+        # it; mark it stale so the next request rebuilds
+        trie.version = -1
+    with _tries_lock:
+        _tries[household_id] = trie
+        _tries.move_to_end(household_id)
+        while len(_tries) > MAX_SUGGEST_HOUSEHOLDS:
+            _tries.popitem(last=False)
+    return trie
+
+
+def _entry_terms(trie: SuggestTrie, values: dict):
+    """Yield (text, kind, category_id) terms contributed by an entry row"""
+    if values.get("account_id") in trie.private_account_ids:
+        return
+    category_id = values.get("category_id")
+    if values.get("memo"):
+        yield values["memo"], "memo", category_id
+    if category_id in trie.category_names:
+        yield trie.category_names[category_id], "category", category_id
+
+
+def _apply_changes(changes: list[RowChange]) -> None:
+    for change in changes:
+        if change.table not in ("categories", "accounts", "household_members"):
+            continue
+        if change.table == "household_members" and change.op == "update":
+            continue  # e.g. split_weight
+        # Renames, visibility and membership changes (which accounts count
+        # as the household's private ones): rebuild affected households lazily
+        household_id = change.values.get("household_id")
+        owner_user_id = change.values.get("owner_user_id")
+        with _tries_lock:
+            if household_id is not None:
+                _tries.pop(household_id, None)
+            elif change.table == "accounts":
+                # Personal account: every household of its owner
+                for key in [k for k, t in _tries.items() if owner_user_id in t.member_user_ids]:
+                    del _tries[key]
+            else:
+                # Default category: every household
+                _tries.clear()
+
+    for change in changes:
+        if change.table != "entries":
+            continue
+        with _tries_lock:
+            trie = _tries.get(change.values.get("household_id"))
+        if trie is None:
+            continue
+
+        if change.op in ("delete", "update"):
+            old_values = {**change.values, **change.previous} if change.op == "update" else change.values
+            for text, kind, category_id in _entry_terms(trie, old_values):
+                trie.discard(text, kind, category_id)
+        if change.op in ("insert", "update"):
+            for text, kind, category_id in _entry_terms(trie, change.values):
+                trie.add(text, kind, last_used=change.values.get("date"), category_id=category_id)
+
+
+register_commit_listener(_apply_changes)
+
+
+def suggest(
+    db: Session,
+    household_id: UUID,
+    q: str,
+    limit: int = 10,
+) -> list[EntrySuggestion]:
+    """Memo and category suggestions for a typed prefix, ranked by frequency and recency"""
+    trie = get_suggest_trie(db, household_id)
+    results = []
+    for stats in trie.search(q, limit, date.today()):
+        category_id = stats.category_id if stats.kind == "category" else trie.top_category(stats)
+        results.append(
+            EntrySuggestion(
+                text=stats.text,
+                kind=stats.kind,
+                count=stats.count,
+                last_used=stats.last_used,
+                category_id=category_id,
+                category_name=trie.category_names.get(category_id) if category_id else None,
+            )
+        )
+    return results
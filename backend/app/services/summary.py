@@ -1,6 +1,9 @@
 from uuid import UUID
+from datetime import date, datetime
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import extract, func, or_
+from sqlalchemy import extract, func, or_, update
+from starlette.concurrency import run_in_threadpool
 
 from app.models import Entry, Category, HouseholdMember, Account, MonthlySettlement, User
 from app.schemas.summary import (
@@ -12,6 +15,47 @@ from app.schemas.summary import (
     CumulativeSettlement,
     MonthlySettlementRecord,
 )
+from app.services.account import visible_entry_filter
+from app.services.auth import get_user_names
+from app.services.data_version import bump_data_version
+from app.services.response_cache import get_or_compute, get_or_compute_async
+from app.services.settlement_engine import split_by_weights, minimize_transfers
+from app.services.snapshot import (
+    get_finalized_months,
+    get_settlement_snapshot,
+    get_summary_snapshot,
+    store_snapshot,
+)
+
+
+def month_date_range(month: str) -> tuple[date, date]:
+    """Return [first day of month, first day of next month) for a YYYY-MM string"""
+    year, mon = map(int, month.split("-"))
+    start = date(year, mon, 1)
+    if mon == 12:
+        return start, date(year + 1, 1, 1)
+    return start, date(year, mon + 1, 1)
+
+
+def _load_monthly_summary(
+    db: Session,
+    household_id: UUID,
+    month: str,
+    current_user_id: UUID,
+    account_ids: list[UUID] | None = None,
+) -> MonthlySummary:
+    # Finalized months are frozen; account-filtered views aren't snapshotted
+    if not account_ids:
+        snapshot = get_summary_snapshot(db, household_id, month, current_user_id)
+        if snapshot is not None:
+            # Account balances are live, not part of the frozen month
+            snapshot.net_balance = calculate_net_balance(db, household_id, current_user_id)
+            return snapshot
+    return _compute_monthly_summary(db, household_id, month, current_user_id, account_ids)
+
+
+def _summary_cache_params(current_user_id: UUID, account_ids: list[UUID] | None) -> tuple:
+    return (current_user_id, ",".join(sorted(str(a) for a in account_ids or [])))
 
 
 def get_monthly_summary(
@@ -21,14 +65,46 @@ def get_monthly_summary(
     current_user_id: UUID,
     account_ids: list[UUID] | None = None,
 ) -> MonthlySummary:
-    year, mon = map(int, month.split("-"))
+    return get_or_compute(
+        db,
+        MonthlySummary,
+        "summary",
+        household_id,
+        month,
+        _summary_cache_params(current_user_id, account_ids),
+        lambda: _load_monthly_summary(db, household_id, month, current_user_id, account_ids),
+    )
 
-    # Get list of hidden account IDs (accounts not visible to this user)
-    hidden_accounts = db.query(Account.id).filter(
-        Account.is_shared_visible == False,
-        Account.owner_user_id != current_user_id,
-    ).all()
-    hidden_account_id_list = [a.id for a in hidden_accounts]
+
+async def get_monthly_summary_async(
+    db: AsyncSession,
+    household_id: UUID,
+    month: str,
+    current_user_id: UUID,
+    account_ids: list[UUID] | None = None,
+) -> MonthlySummary:
+    """get_monthly_summary for async routes; the summary is all SQL aggregates, so it runs in run_sync"""
+    return await get_or_compute_async(
+        db,
+        MonthlySummary,
+        "summary",
+        household_id,
+        month,
+        _summary_cache_params(current_user_id, account_ids),
+        lambda: db.run_sync(
+            _load_monthly_summary, household_id, month, current_user_id, account_ids
+        ),
+    )
+
+
+def _compute_monthly_summary(
+    db: Session,
+    household_id: UUID,
+    month: str,
+    current_user_id: UUID,
+    account_ids: list[UUID] | None = None,
+) -> MonthlySummary:
+    year, mon = map(int, month.split("-"))
 
     # Base query for the month with visibility filter
     base_query = db.query(Entry).filter(
@@ -38,13 +114,9 @@ def get_monthly_summary(
     )
 
     # Exclude entries linked to hidden accounts
-    if hidden_account_id_list:
-        base_query = base_query.filter(
-            or_(
-                Entry.account_id == None,
-                ~Entry.account_id.in_(hidden_account_id_list),
-            )
-        )
+    visibility_filter = visible_entry_filter(db, household_id, current_user_id)
+    if visibility_filter is not None:
+        base_query = base_query.filter(visibility_filter)
 
     # Apply account filter if provided
     if account_ids:
@@ -174,37 +246,30 @@ def calculate_cumulative_settlement(
     Positive balance = user should receive money
     Negative balance = user should pay money
     """
-    # Get all settlement records up to and including the month
-    records = (
-        db.query(MonthlySettlement)
+    # One aggregate per user, joined to users for names
+    rows = (
+        db.query(
+            MonthlySettlement.user_id,
+            User.name,
+            func.sum(MonthlySettlement.settlement_amount).label("balance"),
+        )
+        .join(User, User.id == MonthlySettlement.user_id)
         .filter(
             MonthlySettlement.household_id == household_id,
             MonthlySettlement.month <= up_to_month,
         )
+        .group_by(MonthlySettlement.user_id, User.name)
         .all()
     )
 
-    # Aggregate by user
-    user_balances = {}
-    for record in records:
-        if record.user_id not in user_balances:
-            user_balances[record.user_id] = 0
-        user_balances[record.user_id] += record.settlement_amount
-
-    # Get user names
-    result = []
-    for user_id, balance in user_balances.items():
-        user = db.query(User).filter(User.id == user_id).first()
-        if user:
-            result.append(
-                CumulativeSettlement(
-                    user_id=user_id,
-                    user_name=user.name,
-                    cumulative_balance=balance,
-                )
-            )
-
-    return result
+    return [
+        CumulativeSettlement(
+            user_id=row.user_id,
+            user_name=row.name,
+            cumulative_balance=row.balance or 0,
+        )
+        for row in rows
+    ]
 
 
 def calculate_net_balance(
@@ -239,106 +304,321 @@ def calculate_net_balance(
 def calculate_settlement(
     db: Session, household_id: UUID, month: str
 ) -> SettlementResponse:
-    year, mon = map(int, month.split("-"))
+    return get_or_compute(
+        db,
+        SettlementResponse,
+        "settlement",
+        household_id,
+        month,
+        (),
+        lambda: get_settlement_snapshot(db, household_id, month)
+        or _compute_settlement(db, household_id, month),
+    )
 
-    # Get all shared expenses for the month
-    shared_entries = (
-        db.query(Entry)
-        .filter(
-            Entry.household_id == household_id,
-            Entry.type == "expense",
-            Entry.shared == True,
-            extract("year", Entry.date) == year,
-            extract("month", Entry.date) == mon,
-        )
-        .all()
+
+async def calculate_settlement_async(
+    db: AsyncSession, household_id: UUID, month: str
+) -> SettlementResponse:
+    """
+    calculate_settlement for async routes: queries run in run_sync, the
+    transfer minimization in the thread pool
+    """
+    async def compute() -> SettlementResponse:
+        snapshot = await db.run_sync(get_settlement_snapshot, household_id, month)
+        if snapshot is not None:
+            return snapshot
+        inputs = await db.run_sync(_load_settlement_inputs, household_id, month)
+        return await run_in_threadpool(_settle_month, month, *inputs)
+
+    return await get_or_compute_async(
+        db, SettlementResponse, "settlement", household_id, month, (), compute
     )
 
-    total_shared = sum(e.amount for e in shared_entries)
 
-    # Get members
-    members = (
-        db.query(HouseholdMember)
+def _get_settlement_members(db: Session, household_id: UUID) -> list:
+    """Members with their names and split weights in one query"""
+    return (
+        db.query(
+            HouseholdMember.id,
+            HouseholdMember.user_id,
+            HouseholdMember.split_weight,
+            User.name,
+        )
+        .join(User, User.id == HouseholdMember.user_id)
         .filter(HouseholdMember.household_id == household_id)
         .all()
     )
 
+
+def _settle_month(
+    month: str,
+    members: list,
+    paid_by_member: dict[UUID, int],
+    cumulative_settlements: list[CumulativeSettlement],
+    monthly_records: list[MonthlySettlementRecord],
+) -> SettlementResponse:
+    # Only current members' payments are split; report the rest separately
+    # so the total matches the amount the shares add up to
+    member_ids = {member.id for member in members}
+    total_shared = sum(paid for payer, paid in paid_by_member.items() if payer in member_ids)
+    unsplit_shared = sum(paid for payer, paid in paid_by_member.items() if payer not in member_ids)
+
     if len(members) < 2:
         return SettlementResponse(
             month=month,
             total_shared_expense=total_shared,
+            unsplit_shared_expense=unsplit_shared,
             settlements=[],
-            cumulative_settlements=calculate_cumulative_settlement(db, household_id, month),
-            monthly_records=get_monthly_settlement_records(db, household_id, month),
+            cumulative_settlements=cumulative_settlements,
+            monthly_records=monthly_records,
         )
 
-    # Calculate how much each member paid for shared expenses
+    # How much each member paid for shared expenses
     member_paid = {}
     for member in members:
-        paid = sum(e.amount for e in shared_entries if e.payer_member_id == member.id)
         member_paid[member.id] = {
-            "name": member.user.name,
+            "name": member.name,
             "user_id": member.user_id,
-            "paid": paid,
+            "paid": paid_by_member.get(member.id, 0),
         }
 
-    # Equal split per person
-    per_person = total_shared // len(members)
-
-    # Calculate balance (positive = overpaid, negative = underpaid)
-    balances = []
-    for member_id, data in member_paid.items():
-        balance = data["paid"] - per_person
-        balances.append({
-            "member_id": member_id,
-            "user_id": data["user_id"],
-            "name": data["name"],
-            "balance": balance,
-        })
-
-    # Sort by balance (negative first - they need to pay)
-    balances.sort(key=lambda x: x["balance"])
-
-    # Calculate settlements (who pays whom)
-    settlements = []
-    i, j = 0, len(balances) - 1
-
-    while i < j:
-        debtor = balances[i]
-        creditor = balances[j]
-
-        if debtor["balance"] >= 0:
-            break
-
-        amount = min(-debtor["balance"], creditor["balance"])
-        if amount > 0:
-            settlements.append(
-                SettlementItem(
-                    from_member_id=debtor["member_id"],
-                    from_member_name=debtor["name"],
-                    to_member_id=creditor["member_id"],
-                    to_member_name=creditor["name"],
-                    amount=amount,
-                )
-            )
-
-        debtor["balance"] += amount
-        creditor["balance"] -= amount
+    # Split by member weights (equal by default); shares add up exactly, so
+    # the remainder is distributed instead of dropped
+    shares = split_by_weights(
+        total_shared,
+        {member.id: member.split_weight for member in members},
+    )
 
-        if debtor["balance"] == 0:
-            i += 1
-        if creditor["balance"] == 0:
-            j -= 1
+    # Balance per member (positive = overpaid, negative = underpaid)
+    balances = {
+        member_id: data["paid"] - shares[member_id]
+        for member_id, data in member_paid.items()
+    }
+
+    # Calculate settlements (who pays whom) with the fewest transfers
+    settlements = [
+        SettlementItem(
+            from_member_id=from_id,
+            from_member_name=member_paid[from_id]["name"],
+            to_member_id=to_id,
+            to_member_name=member_paid[to_id]["name"],
+            amount=amount,
+        )
+        for from_id, to_id, amount in minimize_transfers(balances)
+    ]
 
     return SettlementResponse(
         month=month,
         total_shared_expense=total_shared,
+        unsplit_shared_expense=unsplit_shared,
         settlements=settlements,
-        cumulative_settlements=calculate_cumulative_settlement(db, household_id, month),
-        monthly_records=get_monthly_settlement_records(db, household_id, month),
+        cumulative_settlements=cumulative_settlements,
+        monthly_records=monthly_records,
+    )
+
+
+def _load_settlement_inputs(db: Session, household_id: UUID, month: str) -> tuple:
+    """Everything _settle_month needs for a month after the month argument"""
+    month_start, next_month_start = month_date_range(month)
+
+    # Shared expense totals per payer in one aggregate
+    paid_rows = (
+        db.query(Entry.payer_member_id, func.sum(Entry.amount).label("paid"))
+        .filter(
+            Entry.household_id == household_id,
+            Entry.type == "expense",
+            Entry.shared == True,
+            Entry.date >= month_start,
+            Entry.date < next_month_start,
+        )
+        .group_by(Entry.payer_member_id)
+        .all()
+    )
+
+    return (
+        _get_settlement_members(db, household_id),
+        {r.payer_member_id: r.paid or 0 for r in paid_rows},
+        calculate_cumulative_settlement(db, household_id, month),
+        get_monthly_settlement_records(db, household_id, month),
     )
 
 
+def _compute_settlement(
+    db: Session, household_id: UUID, month: str
+) -> SettlementResponse:
+    return _settle_month(month, *_load_settlement_inputs(db, household_id, month))
+
+
+def iter_months(from_month: str, to_month: str) -> list[str]:
+    """List YYYY-MM months from from_month to to_month inclusive"""
+    year, mon = map(int, from_month.split("-"))
+    end_year, end_mon = map(int, to_month.split("-"))
+    months = []
+    while (year, mon) <= (end_year, end_mon):
+        months.append(f"{year:04d}-{mon:02d}")
+        year, mon = (year + 1, 1) if mon == 12 else (year, mon + 1)
+    return months
+
+
+def calculate_cumulative_settlement_by_month(
+    db: Session,
+    household_id: UUID,
+    months: list[str],
+) -> dict[str, list[CumulativeSettlement]]:
+    """
+    Cumulative settlement balances as of each of the given months, from one
+    (month, user) aggregate and a running prefix sum.
+    """
+    if not months:
+        return {}
+    rows = (
+        db.query(
+            MonthlySettlement.month,
+            MonthlySettlement.user_id,
+            User.name,
+            func.sum(MonthlySettlement.settlement_amount).label("amount"),
+        )
+        .join(User, User.id == MonthlySettlement.user_id)
+        .filter(
+            MonthlySettlement.household_id == household_id,
+            MonthlySettlement.month <= max(months),
+        )
+        .group_by(MonthlySettlement.month, MonthlySettlement.user_id, User.name)
+        .order_by(MonthlySettlement.month)
+        .all()
+    )
+
+    result = {}
+    running: dict[UUID, int] = {}
+    names: dict[UUID, str] = {}
+    i = 0
+    for month in sorted(months):
+        while i < len(rows) and rows[i].month <= month:
+            row = rows[i]
+            running[row.user_id] = running.get(row.user_id, 0) + (row.amount or 0)
+            names[row.user_id] = row.name
+            i += 1
+        result[month] = [
+            CumulativeSettlement(
+                user_id=user_id,
+                user_name=names[user_id],
+                cumulative_balance=balance,
+            )
+            for user_id, balance in running.items()
+        ]
+    return result
+
+
+def calculate_settlement_range(
+    db: Session,
+    household_id: UUID,
+    from_month: str,
+    to_month: str,
+) -> list[SettlementResponse]:
+    """Settlement for every month in [from_month, to_month] with a fixed number of queries"""
+    months = iter_months(from_month, to_month)
+    if not months:
+        return []
+    return _settle_months(months, *_load_settlement_range_inputs(db, household_id, months))
+
+
+async def calculate_settlement_range_async(
+    db: AsyncSession,
+    household_id: UUID,
+    from_month: str,
+    to_month: str,
+) -> list[SettlementResponse]:
+    """calculate_settlement_range for async routes (queries in run_sync, settling in the thread pool)"""
+    months = iter_months(from_month, to_month)
+    if not months:
+        return []
+    inputs = await db.run_sync(_load_settlement_range_inputs, household_id, months)
+    return await run_in_threadpool(_settle_months, months, *inputs)
+
+
+def _load_settlement_range_inputs(db: Session, household_id: UUID, months: list[str]) -> tuple:
+    """Members, paid totals, cumulative balances and records for each month"""
+    range_start, _ = month_date_range(months[0])
+    _, range_end = month_date_range(months[-1])
+
+    # Shared expense totals per (month, payer) in one aggregate
+    year_col = extract("year", Entry.date).label("year")
+    month_col = extract("month", Entry.date).label("mon")
+    paid_rows = (
+        db.query(
+            year_col,
+            month_col,
+            Entry.payer_member_id,
+            func.sum(Entry.amount).label("paid"),
+        )
+        .filter(
+            Entry.household_id == household_id,
+            Entry.type == "expense",
+            Entry.shared == True,
+            Entry.date >= range_start,
+            Entry.date < range_end,
+        )
+        .group_by(year_col, month_col, Entry.payer_member_id)
+        .all()
+    )
+    paid_by_month: dict[str, dict[UUID, int]] = {}
+    for row in paid_rows:
+        key = f"{int(row.year):04d}-{int(row.mon):02d}"
+        paid_by_month.setdefault(key, {})[row.payer_member_id] = row.paid or 0
+
+    # Settlement records for all months, names loaded in bulk
+    records = (
+        db.query(MonthlySettlement)
+        .filter(
+            MonthlySettlement.household_id == household_id,
+            MonthlySettlement.month >= months[0],
+            MonthlySettlement.month <= months[-1],
+        )
+        .all()
+    )
+    user_names = get_user_names(db, {record.user_id for record in records})
+    records_by_month: dict[str, list[MonthlySettlementRecord]] = {}
+    for record in records:
+        if record.user_id not in user_names:
+            continue
+        records_by_month.setdefault(record.month, []).append(
+            MonthlySettlementRecord(
+                id=record.id,
+                user_id=record.user_id,
+                user_name=user_names[record.user_id],
+                month=record.month,
+                settlement_amount=record.settlement_amount,
+                is_finalized=record.is_finalized,
+            )
+        )
+
+    return (
+        _get_settlement_members(db, household_id),
+        paid_by_month,
+        calculate_cumulative_settlement_by_month(db, household_id, months),
+        records_by_month,
+    )
+
+
+def _settle_months(
+    months: list[str],
+    members: list,
+    paid_by_month: dict[str, dict[UUID, int]],
+    cumulative: dict[str, list[CumulativeSettlement]],
+    records_by_month: dict[str, list[MonthlySettlementRecord]],
+) -> list[SettlementResponse]:
+    return [
+        _settle_month(
+            month,
+            members,
+            paid_by_month.get(month, {}),
+            cumulative[month],
+            records_by_month.get(month, []),
+        )
+        for month in months
+    ]
+
+
 def get_monthly_settlement_records(
     db: Session,
     household_id: UUID,
@@ -354,22 +634,20 @@ def get_monthly_settlement_records(
         .all()
     )
 
-    result = []
-    for record in records:
-        user = db.query(User).filter(User.id == record.user_id).first()
-        if user:
-            result.append(
-                MonthlySettlementRecord(
-                    id=record.id,
-                    user_id=record.user_id,
-                    user_name=user.name,
-                    month=record.month,
-                    settlement_amount=record.settlement_amount,
-                    is_finalized=record.is_finalized,
-                )
-            )
+    user_names = get_user_names(db, {record.user_id for record in records})
 
-    return result
+    return [
+        MonthlySettlementRecord(
+            id=record.id,
+            user_id=record.user_id,
+            user_name=user_names[record.user_id],
+            month=record.month,
+            settlement_amount=record.settlement_amount,
+            is_finalized=record.is_finalized,
+        )
+        for record in records
+        if record.user_id in user_names
+    ]
 
 
 def save_monthly_settlement(
@@ -426,5 +704,55 @@ def finalize_monthly_settlement(
     for record in records:
         record.is_finalized = True
 
+    if records:
+        _store_month_snapshot(db, household_id, _compute_settlement(db, household_id, month))
     db.commit()
     return records
+
+
+def _store_month_snapshot(
+    db: Session, household_id: UUID, settlement: SettlementResponse
+) -> None:
+    """Freeze a finalized month's settlement and every member's summary"""
+    member_user_ids = [
+        row.user_id
+        for row in db.query(HouseholdMember.user_id).filter(
+            HouseholdMember.household_id == household_id
+        )
+    ]
+    summaries = {
+        user_id: _compute_monthly_summary(db, household_id, settlement.month, user_id)
+        for user_id in member_user_ids
+    }
+    store_snapshot(db, household_id, settlement, summaries)
+
+
+def finalize_settlement_range(
+    db: Session,
+    household_id: UUID,
+    from_month: str,
+    to_month: str,
+) -> int:
+    """Finalize all settlement records from from_month to to_month in one statement"""
+    result = db.execute(
+        update(MonthlySettlement)
+        .where(
+            MonthlySettlement.household_id == household_id,
+            MonthlySettlement.month >= from_month,
+            MonthlySettlement.month <= to_month,
+            MonthlySettlement.is_finalized == False,
+        )
+        .values(is_finalized=True, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    # Bulk UPDATE bypasses ORM change tracking, so bump versions explicitly
+    bump_data_version(db, {household_id})
+
+    finalized = get_finalized_months(db, household_id, iter_months(from_month, to_month))
+    if finalized:
+        for settlement in calculate_settlement_range(db, household_id, min(finalized), max(finalized)):
+            if settlement.month in finalized:
+                _store_month_snapshot(db, household_id, settlement)
+
+    db.commit()
+    return result.rowcount
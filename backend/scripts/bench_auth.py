@@ -0,0 +1,108 @@
+"""
+Microbenchmark of per-request auth overhead.
+Run with: python -m scripts.bench_auth --iterations 20000
+
+Times decode_access_token with the verified-token cache off and on for each
+installed JWT backend (python-jose, PyJWT) and prints JSON with the cost per
+call. With --http it also times GET /api/auth/me in-process against a
+synthetic user (needs the database), i.e. token check plus user lookup.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import json
+import time
+
+from app.core import security
+from app.core.config import settings
+
+BACKENDS = ("jose", "pyjwt")
+
+
+def _per_call(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def bench_decode(backend: str, iterations: int) -> list[dict]:
+    settings.JWT_BACKEND = backend
+    try:
+        security._jwt_encode, security._jwt_decode, security._jwt_error = security._load_jwt_backend()
+    except ValueError as e:
+        print(f"skipping {backend}: {e}", file=sys.stderr)
+        return []
+
+    token = security.create_access_token({"sub": "00000000-0000-0000-0000-000000000001"})
+    results = []
+    for cache_size in (0, settings.TOKEN_CACHE_SIZE or 4096):
+        settings.TOKEN_CACHE_SIZE = cache_size
+        security.clear_token_cache()
+        seconds = _per_call(lambda: security.decode_access_token(token), iterations)
+        results.append({
+            "scenario": "decode",
+            "backend": backend,
+            "cached": cache_size > 0,
+            "iterations": iterations,
+            "us_per_call": round(seconds * 1e6, 2),
+        })
+    return results
+
+
+async def bench_http(iterations: int) -> dict:
+    import httpx
+
+    from app.core.database import SessionLocal
+    from app.main import app
+    from scripts.synthetic_household import BENCH_PASSWORD, generate_household
+
+    db = SessionLocal()
+    try:
+        household = generate_household(db, members=1, accounts=0, categories=1, entries=0, tag=f"auth-{int(time.time())}")
+    finally:
+        db.close()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        response = await client.post(
+            "/api/auth/login", data={"username": household.emails[0], "password": BENCH_PASSWORD}
+        )
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            (await client.get("/api/auth/me", headers=headers)).raise_for_status()
+        seconds = (time.perf_counter() - start) / iterations
+
+    return {
+        "scenario": "GET /api/auth/me",
+        "backend": settings.JWT_BACKEND,
+        "cached": settings.TOKEN_CACHE_SIZE > 0,
+        "iterations": iterations,
+        "us_per_call": round(seconds * 1e6, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--http", action="store_true", help="Also time GET /api/auth/me")
+    parser.add_argument("--http-iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    results = []
+    for backend in args.backends:
+        results.extend(bench_decode(backend, args.iterations))
+    if args.http:
+        results.append(asyncio.run(bench_http(args.http_iterations)))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark password verification and login throughput.
+Run with: python -m scripts.bench_login --rounds 10 12 --concurrency 1 4 16
+
+Measures verifications per second through the password hash executor at
+several bcrypt costs and concurrency levels. With --http it also logs a
+synthetic user in through POST /api/auth/login in-process (needs the
+database) and reports logins per second.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import json
+import time
+
+from passlib.context import CryptContext
+
+from app.core import security
+from app.core.config import settings
+
+
+async def _verify_burst(total: int, concurrency: int, hashed: str) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            verified, _ = await security.verify_and_update_password_async("password123", hashed)
+            assert verified
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return time.perf_counter() - start
+
+
+def bench_verify(rounds: int, concurrency: int, total: int) -> dict:
+    # Swap in a context with the requested cost for the duration of the run
+    security.pwd_context = CryptContext(
+        schemes=["bcrypt"], bcrypt__rounds=rounds,
+        bcrypt__min_rounds=rounds, bcrypt__max_rounds=rounds,
+    )
+    hashed = security.get_password_hash("password123")
+    elapsed = asyncio.run(_verify_burst(total, concurrency, hashed))
+    return {
+        "scenario": "verify",
+        "bcrypt_rounds": rounds,
+        "concurrency": concurrency,
+        "executor_workers": settings.PASSWORD_HASH_WORKERS,
+        "verifications": total,
+        "per_second": round(total / elapsed, 2),
+        "avg_ms": round(elapsed / total * 1000, 2),
+    }
+
+
+async def _login_burst(total: int, concurrency: int) -> dict:
+    import httpx
+
+    from app.core.database import SessionLocal
+    from app.main import app
+    from scripts.synthetic_household import BENCH_PASSWORD, generate_household
+
+    db = SessionLocal()
+    try:
+        household = generate_household(db, members=1, accounts=0, categories=1, entries=0, tag=f"login-{int(time.time())}")
+    finally:
+        db.close()
+
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = 0
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def one():
+            nonlocal failures
+            async with semaphore:
+                response = await client.post(
+                    "/api/auth/login",
+                    data={"username": household.emails[0], "password": BENCH_PASSWORD},
+                )
+                if response.status_code != 200:
+                    failures += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "scenario": "http_login",
+        "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+        "concurrency": concurrency,
+        "logins": total,
+        "failures": failures,
+        "per_second": round(total / elapsed, 2),
+        "avg_ms": round(elapsed / total * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 12])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--total", type=int, default=32, help="Verifications per case")
+    parser.add_argument("--http", action="store_true", help="Also benchmark POST /api/auth/login")
+    args = parser.parse_args()
+
+    results = [
+        bench_verify(rounds, concurrency, args.total)
+        for rounds in args.rounds
+        for concurrency in args.concurrency
+    ]
+    if args.http:
+        security.pwd_context = security._build_pwd_context()
+        results.extend(
+            asyncio.run(_login_burst(args.total, concurrency)) for concurrency in args.concurrency
+        )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
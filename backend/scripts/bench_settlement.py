@@ -0,0 +1,57 @@
+"""
+Benchmark the settlement engine (split + minimum-transfer solver).
+Run with: python -m scripts.bench_settlement
+
+Simulates households of 2-20 members with thousands of shared entries and
+prints timing per household size as JSON.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import random
+import time
+
+from app.services.settlement_engine import split_by_weights, minimize_transfers
+
+
+def run_case(members: int, entries: int, rounds: int = 20) -> dict:
+    rng = random.Random(members * 100_003 + entries)
+    timings = []
+    transfers = 0
+    for _ in range(rounds):
+        paid = {f"m{i}": 0 for i in range(members)}
+        for _ in range(entries):
+            paid[f"m{rng.randrange(members)}"] += rng.randint(1, 200) * 100
+        weights = {m: rng.choice([1, 1, 1, 2, 3]) for m in paid}
+
+        start = time.perf_counter()
+        shares = split_by_weights(sum(paid.values()), weights)
+        result = minimize_transfers({m: paid[m] - shares[m] for m in paid})
+        timings.append(time.perf_counter() - start)
+        transfers += len(result)
+
+    timings.sort()
+    return {
+        "members": members,
+        "entries": entries,
+        "rounds": rounds,
+        "median_ms": round(timings[len(timings) // 2] * 1000, 3),
+        "max_ms": round(timings[-1] * 1000, 3),
+        "avg_transfers": round(transfers / rounds, 2),
+    }
+
+
+def main():
+    results = [
+        run_case(members, entries)
+        for members in (2, 4, 8, 12, 16, 20)
+        for entries in (100, 5000)
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Benchmark suite against a synthetic household.
+Run with: python -m scripts.bench_suite --entries 100000 --output bench.json
+
+Generates a household (see scripts/synthetic_household.py), then times fixed
+scenarios through the service layer and prints JSON with timings and query
+counts per scenario. Compare the output of two commits to spot regressions.
+Writes to DATABASE_URL; use a dedicated benchmark database.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import csv
+import io
+import json
+import platform
+import random
+import subprocess
+import time
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_cache
+from app.core.database import SessionLocal
+from app.core.profiling import query_budget
+from app.models import Entry
+from app.schemas.external_source import CSVColumnMapping
+from app.services.csv_import import execute_import, preview_import
+from app.services.entry import get_entries
+from app.services.summary import _compute_monthly_summary, _compute_settlement
+from scripts.synthetic_household import (
+    GeneratedHousehold,
+    MERCHANTS,
+    add_generator_arguments,
+    generate_from_args,
+)
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    index = min(int(round(pct / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def run_scenario(name: str, fn: Callable[[Session], object], rounds: int, setup: Callable[[Session], None] | None = None) -> dict:
+    """Run fn on a fresh session per round; report wall time and SQL statements"""
+    timings = []
+    queries = []
+    rows = []
+    for _ in range(rounds):
+        db = SessionLocal()
+        try:
+            if setup:
+                setup(db)
+            # Measure uncached work: the response cache would otherwise hide it
+            get_cache().clear()
+            with query_budget() as stats:
+                start = time.perf_counter()
+                fn(db)
+                timings.append(time.perf_counter() - start)
+            queries.append(stats.count)
+            rows.append(stats.rows)
+        finally:
+            db.rollback()
+            db.close()
+
+    timings.sort()
+    return {
+        "scenario": name,
+        "rounds": rounds,
+        "min_ms": round(timings[0] * 1000, 3),
+        "median_ms": round(_percentile(timings, 50) * 1000, 3),
+        "p95_ms": round(_percentile(timings, 95) * 1000, 3),
+        "max_ms": round(timings[-1] * 1000, 3),
+        "queries": max(queries),
+        "rows": max(rows),
+    }
+
+
+def _import_csv_bytes(rows: int, seed: int) -> bytes:
+    rng = random.Random(seed)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["날짜", "금액", "구분", "카테고리", "메모"])
+    for _ in range(rows):
+        writer.writerow([
+            f"2026-{rng.randint(1, 6):02d}-{rng.randint(1, 28):02d}",
+            rng.randint(10, 3000) * 100,
+            "지출",
+            "식비",
+            f"{rng.choice(MERCHANTS)} {rng.randrange(10_000)}",
+        ])
+    return buffer.getvalue().encode("utf-8")
+
+
+def build_scenarios(household: GeneratedHousehold, args) -> list[tuple]:
+    household_id = household.household_id
+    user_id = household.user_ids[0]
+    month = household.months[-1]
+    account_id = household.account_ids[0] if household.account_ids else None
+    page_size = 50
+    deep_page = max(household.entries // page_size // 2, 1)
+
+    def list_page(page: int):
+        return lambda db: get_entries(db, household_id, current_user_id=user_id, page=page, page_size=page_size)
+
+    def import_csv(db: Session):
+        preview = preview_import(db, csv_bytes, household_id, filename="bench.csv")
+        execute_import(
+            db,
+            preview.file_id,
+            household_id,
+            user_id,
+            CSVColumnMapping(date="날짜", amount="금액", type="구분", category="카테고리", memo="메모"),
+            default_account_id=account_id,
+            default_category_id=None,
+            default_payer_member_id=household.member_ids[0],
+            skip_duplicates=True,
+        )
+
+    delete_ids: list = []
+
+    def pick_delete_ids(db: Session):
+        delete_ids[:] = [
+            row.id for row in db.query(Entry.id)
+            .filter(Entry.household_id == household_id)
+            .order_by(Entry.id)
+            .limit(args.bulk_delete)
+        ]
+
+    def bulk_delete(db: Session):
+        # Same steps as DELETE /api/entries/bulk; the caller rolls back
+        entries = db.query(Entry).filter(
+            Entry.id.in_(delete_ids),
+            Entry.household_id == household_id,
+        ).all()
+        for entry in entries:
+            db.delete(entry)
+        db.flush()
+
+    csv_bytes = _import_csv_bytes(args.import_rows, args.seed)
+
+    scenarios = [
+        ("list_first_page", list_page(1), None),
+        ("list_deep_page", list_page(deep_page), None),
+        ("summary", lambda db: _compute_monthly_summary(db, household_id, month, user_id), None),
+        ("settlement", lambda db: _compute_settlement(db, household_id, month), None),
+        ("bulk_delete", bulk_delete, pick_delete_ids),
+    ]
+    if account_id:
+        scenarios.insert(2, (
+            "single_account_balances",
+            lambda db: get_entries(
+                db, household_id, current_user_id=user_id, account_ids=[account_id], page=1, page_size=page_size
+            ),
+            None,
+        ))
+    # Import commits its rows, so it runs last and once per round on top of the data
+    scenarios.append(("csv_import", import_csv, None))
+    return scenarios
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_generator_arguments(parser)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--import-rows", type=int, default=1_000)
+    parser.add_argument("--bulk-delete", type=int, default=500)
+    parser.add_argument("--only", nargs="*", help="Run only these scenarios")
+    parser.add_argument("--output", help="Write JSON results to this file as well")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        household = generate_from_args(db, args)
+    finally:
+        db.close()
+
+    results = []
+    for name, fn, setup in build_scenarios(household, args):
+        if args.only and name not in args.only:
+            continue
+        results.append(run_scenario(name, fn, args.rounds, setup))
+        print(f"{name}: {results[-1]['median_ms']} ms median", file=sys.stderr)
+
+    report = {
+        "commit": _git_commit(),
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "python": platform.python_version(),
+        "params": {
+            k: v for k, v in vars(args).items() if k not in ("output", "only")
+        },
+        "generation_seconds": household.seconds,
+        "results": results,
+    }
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Local fake of the Google Sheets values API for sync tests and benchmarks.
+Run with: python -m scripts.fake_sheets_server --rows 10000 --port 8085
+
+Then start the backend with GOOGLE_SHEETS_ENDPOINT=http://localhost:8085 and
+create an external source with sheet_id "fake" and sheet_name "Sheet1".
+Implements values.get, values.batchGet and values.update plus spreadsheet
+metadata and the Drive files.get version (bumped on every update), all in
+memory. --latency-ms adds a delay per HTTP request, which
+makes the effect of batching several ranges per request visible.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import random
+import re
+from datetime import date, timedelta
+
+from fastapi import Body, FastAPI, HTTPException, Query
+
+HEADER = ["날짜", "금액", "구분", "카테고리", "메모"]
+CATEGORIES = ["식비", "카페", "교통", "쇼핑", "주거", "급여"]
+MEMOS = ["스타벅스", "이마트", "쿠팡", "GS25", "카카오택시", "월급"]
+
+_RANGE = re.compile(r"^(?:'((?:[^']|'')*)'|([^!]+))!A(\d+)(?::[A-Z]+(\d+))?$")
+
+app = FastAPI(title="Fake Google Sheets")
+# (spreadsheet_id, sheet_name) -> rows; index 0 is row 1
+sheets: dict[tuple[str, str], list[list[str]]] = {}
+# spreadsheet_id -> Drive file version
+versions: dict[str, int] = {}
+latency_seconds = 0.0
+
+
+def seed_sheet(spreadsheet_id: str, sheet_name: str, rows: int, seed: int) -> None:
+    rng = random.Random(seed)
+    start = date(2026, 1, 1)
+    grid = [list(HEADER)]
+    for _ in range(rows):
+        category = rng.choice(CATEGORIES)
+        grid.append([
+            (start + timedelta(days=rng.randrange(180))).isoformat(),
+            str(rng.randint(10, 3000) * 100),
+            "수입" if category == "급여" else "지출",
+            category,
+            f"{rng.choice(MEMOS)} {rng.randrange(10_000)}",
+        ])
+    sheets[(spreadsheet_id, sheet_name)] = grid
+    versions[spreadsheet_id] = versions.get(spreadsheet_id, 0) + 1
+
+
+def _parse_range(range_name: str) -> tuple[str, int, int | None]:
+    match = _RANGE.match(range_name)
+    if not match:
+        raise HTTPException(status_code=400, detail=f"Unsupported range: {range_name}")
+    quoted, plain, start, end = match.groups()
+    sheet_name = quoted.replace("''", "'") if quoted is not None else plain
+    return sheet_name, int(start), int(end) if end else None
+
+
+def _grid(spreadsheet_id: str, sheet_name: str) -> list[list[str]]:
+    grid = sheets.get((spreadsheet_id, sheet_name))
+    if grid is None:
+        raise HTTPException(status_code=404, detail=f"Unable to parse range: {sheet_name}")
+    return grid
+
+
+def _value_range(spreadsheet_id: str, range_name: str) -> dict:
+    sheet_name, start, end = _parse_range(range_name)
+    grid = _grid(spreadsheet_id, sheet_name)
+    values = [list(row) for row in grid[start - 1:end if end else None]]
+    # Like the real API: trailing empty rows are omitted
+    while values and not any(values[-1]):
+        values.pop()
+    result = {"range": range_name, "majorDimension": "ROWS"}
+    if values:
+        result["values"] = values
+    return result
+
+
+async def _delay() -> None:
+    if latency_seconds:
+        await asyncio.sleep(latency_seconds)
+
+
+@app.get("/v4/spreadsheets/{spreadsheet_id}/values:batchGet")
+async def batch_get(spreadsheet_id: str, ranges: list[str] = Query(...)):
+    await _delay()
+    return {
+        "spreadsheetId": spreadsheet_id,
+        "valueRanges": [_value_range(spreadsheet_id, r) for r in ranges],
+    }
+
+
+@app.get("/v4/spreadsheets/{spreadsheet_id}/values/{range_name}")
+async def get_values(spreadsheet_id: str, range_name: str):
+    await _delay()
+    return _value_range(spreadsheet_id, range_name)
+
+
+@app.put("/v4/spreadsheets/{spreadsheet_id}/values/{range_name}")
+async def update_values(spreadsheet_id: str, range_name: str, body: dict = Body(...)):
+    await _delay()
+    sheet_name, start, _ = _parse_range(range_name)
+    grid = sheets.setdefault((spreadsheet_id, sheet_name), [])
+    values = body.get("values", [])
+    while len(grid) < start - 1 + len(values):
+        grid.append([])
+    for offset, row in enumerate(values):
+        grid[start - 1 + offset] = [str(v) for v in row]
+    versions[spreadsheet_id] = versions.get(spreadsheet_id, 0) + 1
+    return {
+        "spreadsheetId": spreadsheet_id,
+        "updatedRange": range_name,
+        "updatedRows": len(values),
+        "updatedColumns": max((len(r) for r in values), default=0),
+        "updatedCells": sum(len(r) for r in values),
+    }
+
+
+@app.get("/v4/spreadsheets/{spreadsheet_id}")
+async def get_spreadsheet(spreadsheet_id: str):
+    await _delay()
+    return {
+        "spreadsheetId": spreadsheet_id,
+        "sheets": [
+            {"properties": {"title": name, "gridProperties": {"rowCount": len(grid), "columnCount": 26}}}
+            for (sid, name), grid in sheets.items()
+            if sid == spreadsheet_id
+        ],
+    }
+
+
+# The Drive client is pointed at GOOGLE_SHEETS_ENDPOINT too; with an
+# api_endpoint override it requests /files/{id} without the drive/v3 prefix
+@app.get("/files/{file_id}")
+async def get_file(file_id: str):
+    await _delay()
+    if file_id not in versions:
+        raise HTTPException(status_code=404, detail=f"File not found: {file_id}")
+    return {"id": file_id, "version": str(versions[file_id])}
+
+
+def main():
+    global latency_seconds
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8085)
+    parser.add_argument("--spreadsheet-id", default="fake")
+    parser.add_argument("--sheet", default="Sheet1")
+    parser.add_argument("--rows", type=int, default=1_000, help="Data rows to seed (below a header row)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    seed_sheet(args.spreadsheet_id, args.sheet, args.rows, args.seed)
+    latency_seconds = args.latency_ms / 1000
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+Load test: replay a mix of user traffic at rising concurrency.
+Run with: python -m scripts.load_test --households 5 --members 4 --concurrency 1 10 50
+
+Generates synthetic households (see scripts/synthetic_household.py), logs
+every member in through /api/auth/login and replays weighted traffic with
+httpx: dashboard polls, entry list scrolling, adding entries and CSV
+imports. Requests go to the ASGI app in-process by default, or to a running
+server with --base-url http://localhost:8000. Prints p50/p95/p99 per route
+and throughput for each concurrency level as JSON.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass
+from datetime import date
+
+import httpx
+
+from app.core.database import SessionLocal
+from scripts.bench_suite import _import_csv_bytes, _percentile
+from scripts.synthetic_household import (
+    BENCH_PASSWORD,
+    GeneratedHousehold,
+    add_generator_arguments,
+    generate_from_args,
+)
+
+# Relative weights of user actions
+DEFAULT_MIX = {
+    "dashboard": 50,
+    "scroll": 35,
+    "add_entry": 12,
+    "import": 3,
+}
+
+
+@dataclass
+class VirtualUser:
+    token: str
+    household: GeneratedHousehold
+    member_id: str
+
+    @property
+    def headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+
+    def record(self, route: str, seconds: float, ok: bool) -> None:
+        self.latencies.setdefault(route, []).append(seconds)
+        if not ok:
+            self.errors[route] = self.errors.get(route, 0) + 1
+
+    def report(self, elapsed: float) -> dict:
+        routes = {}
+        total = 0
+        for route, values in sorted(self.latencies.items()):
+            values.sort()
+            total += len(values)
+            routes[route] = {
+                "requests": len(values),
+                "errors": self.errors.get(route, 0),
+                "p50_ms": round(_percentile(values, 50) * 1000, 2),
+                "p95_ms": round(_percentile(values, 95) * 1000, 2),
+                "p99_ms": round(_percentile(values, 99) * 1000, 2),
+                "max_ms": round(values[-1] * 1000, 2),
+            }
+        return {
+            "requests": total,
+            "errors": sum(self.errors.values()),
+            "throughput_rps": round(total / elapsed, 2) if elapsed else 0,
+            "routes": routes,
+        }
+
+
+async def _request(client: httpx.AsyncClient, recorder: Recorder, route: str, method: str, url: str, **kwargs):
+    start = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+        ok = response.status_code < 400 or response.status_code == 304
+    except httpx.HTTPError:
+        response, ok = None, False
+    recorder.record(route, time.perf_counter() - start, ok)
+    return response
+
+
+async def dashboard(client, recorder, user: VirtualUser, rng: random.Random) -> None:
+    month = rng.choice(user.household.months[-3:])
+    await asyncio.gather(
+        _request(client, recorder, "GET /api/summary", "GET", f"/api/summary?month={month}", headers=user.headers),
+        _request(client, recorder, "GET /api/settlement", "GET", f"/api/settlement?month={month}", headers=user.headers),
+        _request(client, recorder, "GET /api/accounts", "GET", "/api/accounts", headers=user.headers),
+    )
+
+
+async def scroll(client, recorder, user: VirtualUser, rng: random.Random) -> None:
+    # A few pages in a row, like an infinite scroll
+    for page in range(1, rng.randint(2, 5)):
+        await _request(
+            client, recorder, "GET /api/entries", "GET",
+            f"/api/entries?page={page}&page_size=50", headers=user.headers,
+        )
+
+
+async def add_entry(client, recorder, user: VirtualUser, rng: random.Random) -> None:
+    await _request(
+        client, recorder, "POST /api/entries", "POST", "/api/entries",
+        headers=user.headers,
+        json={
+            "type": "expense",
+            "amount": rng.randint(10, 500) * 100,
+            "date": date.today().isoformat(),
+            "memo": "부하테스트",
+            "payer_member_id": user.member_id,
+            "shared": rng.random() < 0.5,
+        },
+    )
+
+
+async def import_csv(client, recorder, user: VirtualUser, rng: random.Random) -> None:
+    response = await _request(
+        client, recorder, "POST /api/import/csv/upload", "POST", "/api/import/csv/upload",
+        headers=user.headers,
+        files={"file": ("load.csv", _import_csv_bytes(50, rng.randrange(1 << 30)), "text/csv")},
+    )
+    if response is None or response.status_code != 200:
+        return
+    await _request(
+        client, recorder, "POST /api/import/csv/confirm", "POST", "/api/import/csv/confirm",
+        headers=user.headers,
+        json={
+            "file_id": response.json()["file_id"],
+            "column_mapping": {"date": "날짜", "amount": "금액", "type": "구분", "category": "카테고리", "memo": "메모"},
+            "default_payer_member_id": user.member_id,
+        },
+    )
+
+
+ACTIONS = {
+    "dashboard": dashboard,
+    "scroll": scroll,
+    "add_entry": add_entry,
+    "import": import_csv,
+}
+
+
+async def login_all(client: httpx.AsyncClient, households: list[GeneratedHousehold]) -> list[VirtualUser]:
+    async def login(household: GeneratedHousehold, index: int) -> VirtualUser:
+        response = await client.post(
+            "/api/auth/login",
+            data={"username": household.emails[index], "password": BENCH_PASSWORD},
+        )
+        response.raise_for_status()
+        return VirtualUser(response.json()["access_token"], household, str(household.member_ids[index]))
+
+    return await asyncio.gather(*(
+        login(household, i) for household in households for i in range(len(household.emails))
+    ))
+
+
+async def run_stage(
+    client: httpx.AsyncClient,
+    users: list[VirtualUser],
+    concurrency: int,
+    duration: float,
+    mix: dict[str, int],
+    seed: int,
+) -> dict:
+    recorder = Recorder()
+    deadline = time.perf_counter() + duration
+    names = list(mix)
+    weights = [mix[n] for n in names]
+
+    async def worker(worker_id: int) -> None:
+        rng = random.Random(seed * 1_000 + worker_id)
+        user = users[worker_id % len(users)]
+        while time.perf_counter() < deadline:
+            action = rng.choices(names, weights)[0]
+            await ACTIONS[action](client, recorder, user, rng)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return {"concurrency": concurrency, **recorder.report(time.perf_counter() - start)}
+
+
+def _make_client(base_url: str | None, timeout: float) -> httpx.AsyncClient:
+    if base_url:
+        return httpx.AsyncClient(base_url=base_url, timeout=timeout)
+    from app.main import app
+
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://loadtest",
+        timeout=timeout,
+    )
+
+
+async def main_async(args) -> dict:
+    db = SessionLocal()
+    try:
+        households = []
+        for i in range(args.households):
+            # Distinct seed per household so generated IDs don't collide
+            household_args = argparse.Namespace(**{**vars(args), "seed": args.seed + i, "tag": f"load-{args.seed + i}"})
+            households.append(generate_from_args(db, household_args))
+    finally:
+        db.close()
+
+    mix = dict(DEFAULT_MIX)
+    for item in args.mix or []:
+        name, _, weight = item.partition("=")
+        if name not in ACTIONS:
+            raise SystemExit(f"Unknown action '{name}'. Choose from {', '.join(ACTIONS)}")
+        mix[name] = int(weight)
+
+    async with _make_client(args.base_url, args.timeout) as client:
+        users = await login_all(client, households)
+        stages = []
+        for concurrency in args.concurrency:
+            stage = await run_stage(client, users, concurrency, args.duration, mix, args.seed)
+            print(
+                f"concurrency={concurrency}: {stage['throughput_rps']} req/s, {stage['errors']} errors",
+                file=sys.stderr,
+            )
+            stages.append(stage)
+
+    return {
+        "target": args.base_url or "in-process",
+        "users": len(users),
+        "mix": mix,
+        "duration_seconds": args.duration,
+        "stages": stages,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_generator_arguments(parser)
+    parser.set_defaults(entries=5_000, members=4)
+    parser.add_argument("--households", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 5, 10, 25, 50])
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds per concurrency level")
+    parser.add_argument("--mix", nargs="*", help="Override action weights, e.g. dashboard=70 import=0")
+    parser.add_argument("--base-url", help="Target a running server instead of the in-process app")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output", help="Write JSON results to this file as well")
+    args = parser.parse_args()
+
+    report = asyncio.run(main_async(args))
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+Synthetic household generator for benchmarks and load tests.
+Run with: python -m scripts.synthetic_household --entries 100000
+
+Builds one household with the given number of members, accounts, categories
+and entries using bulk inserts. Output is deterministic for a given --seed
+(IDs, amounts, dates), so results can be compared between commits; reusing
+a seed therefore needs a fresh database. Writes to DATABASE_URL; use a
+dedicated benchmark database.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import random
+import time
+import uuid
+from dataclasses import dataclass, field, asdict
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.core.security import get_password_hash
+from app.models import Account, Category, Entry, Household, HouseholdMember, User
+from app.services.summary import iter_months
+
+BENCH_PASSWORD = "password123"
+INSERT_CHUNK = 10_000
+# Data ends on a fixed date so the same seed always produces the same months
+END_DATE = date(2026, 6, 30)
+
+EXPENSE_CATEGORIES = ["식비", "카페", "교통", "주거", "통신", "쇼핑", "의료", "문화", "여행", "교육", "경조사", "기타"]
+INCOME_CATEGORIES = ["급여", "부수입", "이자"]
+MERCHANTS = [
+    "스타벅스", "이마트", "쿠팡", "배달의민족", "GS25", "CU", "카카오택시", "올리브영",
+    "다이소", "홈플러스", "메가커피", "파리바게뜨", "교보문고", "CGV", "SK주유소", "약국",
+]
+
+
+@dataclass
+class GeneratedHousehold:
+    household_id: uuid.UUID
+    user_ids: list[uuid.UUID]
+    member_ids: list[uuid.UUID]
+    account_ids: list[uuid.UUID]
+    category_ids: list[uuid.UUID]
+    emails: list[str]
+    entries: int
+    months: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def as_dict(self) -> dict:
+        return json.loads(json.dumps(asdict(self), default=str))
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def generate_household(
+    db: Session,
+    members: int = 2,
+    accounts: int = 4,
+    categories: int = 12,
+    entries: int = 10_000,
+    months: int = 24,
+    transfer_ratio: float = 0.08,
+    income_ratio: float = 0.05,
+    shared_ratio: float = 0.5,
+    seed: int = 42,
+    tag: str | None = None,
+) -> GeneratedHousehold:
+    """Create a household with synthetic data and return its IDs"""
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    tag = tag or f"{seed}-{entries}"
+
+    # Hashing is slow on purpose; all synthetic users share one hash
+    hashed_password = get_password_hash(BENCH_PASSWORD)
+    emails = [f"bench-{tag}-{i}@example.com" for i in range(members)]
+    if db.query(User.id).filter(User.email.in_(emails)).first():
+        raise ValueError(f"Household for tag '{tag}' already exists; pass another --tag or reset the database")
+
+    household = Household(id=_uuid(rng), name=f"벤치마크 {tag}")
+    db.add(household)
+    users = [
+        User(id=_uuid(rng), email=email, hashed_password=hashed_password, name=f"사용자{i + 1}")
+        for i, email in enumerate(emails)
+    ]
+    db.add_all(users)
+    db.flush()
+
+    member_rows = [
+        HouseholdMember(
+            id=_uuid(rng),
+            household_id=household.id,
+            user_id=user.id,
+            role="owner" if i == 0 else "member",
+        )
+        for i, user in enumerate(users)
+    ]
+    db.add_all(member_rows)
+
+    account_rows = []
+    for i in range(accounts):
+        owner = users[i % members]
+        shared = i % 3 == 0
+        account_rows.append(
+            Account(
+                id=_uuid(rng),
+                owner_user_id=owner.id,
+                household_id=household.id if shared else None,
+                name=f"계좌{i + 1}",
+                bank_name=rng.choice(["국민", "신한", "우리", "하나", "카카오뱅크"]),
+                type="shared" if shared else "personal",
+                account_type="card" if i % 4 == 3 else "checking",
+                balance=rng.randint(0, 500) * 10_000,
+                # Keep one private account so visibility filters are exercised
+                is_shared_visible=i != accounts - 1 or accounts == 1,
+            )
+        )
+    db.add_all(account_rows)
+
+    expense_names = (EXPENSE_CATEGORIES * (categories // len(EXPENSE_CATEGORIES) + 1))[:categories]
+    category_rows = [
+        Category(id=_uuid(rng), household_id=household.id, name=f"{name}{i // len(EXPENSE_CATEGORIES) or ''}", type="expense", sort_order=i)
+        for i, name in enumerate(expense_names)
+    ] + [
+        Category(id=_uuid(rng), household_id=household.id, name=name, type="income", sort_order=100 + i)
+        for i, name in enumerate(INCOME_CATEGORIES)
+    ]
+    db.add_all(category_rows)
+    db.commit()
+
+    expense_categories = [c.id for c in category_rows if c.type == "expense"]
+    income_categories = [c.id for c in category_rows if c.type == "income"]
+    member_ids = [m.id for m in member_rows]
+    member_users = {m.id: m.user_id for m in member_rows}
+    account_ids = [a.id for a in account_rows]
+    span_days = months * 30
+    start_date = END_DATE - timedelta(days=span_days - 1)
+
+    inserted = 0
+    while inserted < entries:
+        chunk = []
+        for _ in range(min(INSERT_CHUNK, entries - inserted)):
+            payer = rng.choice(member_ids)
+            day = start_date + timedelta(days=rng.randrange(span_days))
+            occurred_at = datetime.combine(day, datetime.min.time()) + timedelta(minutes=rng.randrange(24 * 60))
+            roll = rng.random()
+            row = {
+                "id": _uuid(rng),
+                "household_id": household.id,
+                "created_by_user_id": member_users[payer],
+                "transfer_type": None,
+                "date": day,
+                "occurred_at": occurred_at,
+                "category_id": None,
+                "subcategory_id": None,
+                "memo": None,
+                "payer_member_id": payer,
+                "shared": False,
+                "account_id": rng.choice(account_ids) if account_ids else None,
+                "transfer_from_account_id": None,
+                "transfer_to_account_id": None,
+                "created_at": occurred_at,
+                "updated_at": occurred_at,
+            }
+            if roll < transfer_ratio and len(account_ids) >= 2:
+                from_id, to_id = rng.sample(account_ids, 2)
+                row.update(
+                    type="transfer",
+                    transfer_type="internal",
+                    amount=rng.randint(1, 100) * 10_000,
+                    account_id=None,
+                    transfer_from_account_id=from_id,
+                    transfer_to_account_id=to_id,
+                    memo="계좌이체",
+                )
+            elif roll < transfer_ratio + income_ratio:
+                row.update(
+                    type="income",
+                    amount=rng.randint(50, 400) * 10_000,
+                    category_id=rng.choice(income_categories),
+                    memo="급여" if rng.random() < 0.7 else "부수입",
+                )
+            else:
+                row.update(
+                    type="expense",
+                    # Long tail: mostly small purchases, occasional big ones
+                    amount=int(rng.lognormvariate(9.5, 1.0)) // 100 * 100 + 100,
+                    category_id=rng.choice(expense_categories),
+                    memo=rng.choice(MERCHANTS) if rng.random() < 0.8 else None,
+                    shared=rng.random() < shared_ratio,
+                )
+            chunk.append(row)
+        db.execute(insert(Entry.__table__), chunk)
+        db.commit()
+        inserted += len(chunk)
+
+    month_keys = iter_months(start_date.strftime("%Y-%m"), END_DATE.strftime("%Y-%m"))
+
+    return GeneratedHousehold(
+        household_id=household.id,
+        user_ids=[u.id for u in users],
+        member_ids=member_ids,
+        account_ids=account_ids,
+        category_ids=expense_categories + income_categories,
+        emails=emails,
+        entries=entries,
+        months=month_keys,
+        seconds=round(time.perf_counter() - started, 3),
+    )
+
+
+def add_generator_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--members", type=int, default=2)
+    parser.add_argument("--accounts", type=int, default=4)
+    parser.add_argument("--categories", type=int, default=12)
+    parser.add_argument("--entries", type=int, default=10_000)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--transfer-ratio", type=float, default=0.08)
+    parser.add_argument("--income-ratio", type=float, default=0.05)
+    parser.add_argument("--shared-ratio", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--tag", default=None, help="Distinguishes households built with the same seed")
+
+
+def generate_from_args(db: Session, args: argparse.Namespace) -> GeneratedHousehold:
+    return generate_household(
+        db,
+        members=args.members,
+        accounts=args.accounts,
+        categories=args.categories,
+        entries=args.entries,
+        months=args.months,
+        transfer_ratio=args.transfer_ratio,
+        income_ratio=args.income_ratio,
+        shared_ratio=args.shared_ratio,
+        seed=args.seed,
+        tag=args.tag,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_generator_arguments(parser)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        generated = generate_from_args(db, args)
+    finally:
+        db.close()
+    print(json.dumps(generated.as_dict(), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Shared pytest fixtures.
+
+Tests run against TEST_DATABASE_URL (a throwaway SQLite file by default);
+DATABASE_URL is overridden before the app is imported so they never touch
+the development database.
+"""
+import os
+import tempfile
+
+os.environ["DATABASE_URL"] = os.environ.get(
+    "TEST_DATABASE_URL",
+    "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="ourledger-test-"), "test.db"),
+)
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.cache import get_cache
+from app.core.database import Base, SessionLocal, engine
+from app.core.profiling import query_budget
+from app.main import app
+from scripts.synthetic_household import BENCH_PASSWORD, GeneratedHousehold, generate_household
+
+
+@pytest.fixture(scope="session")
+def household() -> GeneratedHousehold:
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        return generate_household(db, entries=2000, months=6, seed=7, tag="pytest")
+    finally:
+        db.close()
+
+
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def auth_headers(client: TestClient, household: GeneratedHousehold) -> dict:
+    response = client.post(
+        "/api/auth/login",
+        data={"username": household.emails[0], "password": BENCH_PASSWORD},
+    )
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def assert_query_budget():
+    """
+    Assert how much SQL a block runs, with the response cache cleared first
+    so cached responses don't hide queries:
+
+        with assert_query_budget(max_queries=10, max_rows=100):
+            client.get("/api/summary", headers=auth_headers)
+    """
+    def budget(max_queries: int | None = None, max_rows: int | None = None):
+        get_cache().clear()
+        return query_budget(max_queries, max_rows)
+
+    return budget
@@ -0,0 +1,25 @@
+"""Per-endpoint SQL budgets: fail when an endpoint starts running more queries or fetching more rows"""
+import pytest
+
+# path, params, max queries, max rows fetched
+ENDPOINT_BUDGETS = [
+    ("/api/household", {}, 3, 10),
+    ("/api/accounts", {}, 5, 20),
+    ("/api/entries", {"page_size": 50}, 30, 100),
+    ("/api/entries/suggest", {"q": "스타"}, 8, 300),
+    ("/api/summary", {"month": "latest"}, 18, 100),
+    ("/api/settlement", {"month": "latest"}, 9, 50),
+]
+
+
+@pytest.mark.parametrize(
+    "path,params,max_queries,max_rows",
+    ENDPOINT_BUDGETS,
+    ids=[path for path, *_ in ENDPOINT_BUDGETS],
+)
+def test_endpoint_query_budget(client, auth_headers, household, assert_query_budget, path, params, max_queries, max_rows):
+    params = {key: household.months[-1] if value == "latest" else value for key, value in params.items()}
+    with assert_query_budget(max_queries, max_rows) as stats:
+        response = client.get(path, params=params, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    assert stats.count > 0
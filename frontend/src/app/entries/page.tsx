@@ -3,7 +3,7 @@
 import { useState, useEffect, useCallback, useMemo } from 'react';
 import { useRouter, useSearchParams } from 'next/navigation';
 import Link from 'next/link';
-import { entriesAPI, householdAPI, accountsAPI, categoriesAPI, Entry, Account, EntryCreateData, EntryListParams, Category, Subcategory } from '@/lib/api';
+import { entriesAPI, householdAPI, accountsAPI, categoriesAPI, Entry, Account, EntryCreateData, EntryListParams, EntrySuggestion, Category, Subcategory } from '@/lib/api';
 import { useAuth } from '@/lib/auth';
 import FilterBar, { FilterState } from '@/components/filters/FilterBar';
 import EntrySummary from '@/components/EntrySummary';
@@ -137,6 +137,23 @@ export default function EntriesPage() {
   const [formTransferToAccountId, setFormTransferToAccountId] = useState('');
   const [formError, setFormError] = useState('');
   const [formLoading, setFormLoading] = useState(false);
+  const [memoSuggestions, setMemoSuggestions] = useState<EntrySuggestion[]>([]);
+
+  // 메모 자동완성 (debounce)
+  useEffect(() => {
+    const q = formMemo.trim();
+    if (!showForm || !q) {
+      setMemoSuggestions([]);
+      return;
+    }
+    const timer = setTimeout(() => {
+      entriesAPI.suggest(q, 8)
+        .then((data) => setMemoSuggestions(data.filter((s) => s.kind === 'memo')))
+        .catch(() => setMemoSuggestions([]));
+    }, 200);
+
+    return () => clearTimeout(timer);
+  }, [formMemo, showForm]);
 
   useEffect(() => {
     if (!authLoading && !user) {
@@ -332,6 +349,21 @@ export default function EntriesPage() {
     formType === 'transfer' ? false : c.type === formType
   );
 
+  const handleMemoChange = (value: string) => {
+    setFormMemo(value);
+    // 새 거래: 자동완성 메모를 고르면 자주 쓰인 대분류를 채움
+    const picked = memoSuggestions.find((s) => s.text === value);
+    if (
+      picked?.category_id &&
+      !editingEntry &&
+      !formCategoryId &&
+      filteredCategories.some((c) => c.id === picked.category_id)
+    ) {
+      setFormCategoryId(picked.category_id);
+      setFormSubcategoryId('');
+    }
+  };
+
   return (
     <div className={`min-h-screen bg-gray-50 ${isSelectionMode ? 'pb-24' : 'pb-20'}`}>
       {/* Header */}
@@ -741,10 +773,19 @@ export default function EntriesPage() {
                 <input
                   type="text"
                   value={formMemo}
-                  onChange={(e) => setFormMemo(e.target.value)}
+                  onChange={(e) => handleMemoChange(e.target.value)}
                   placeholder="메모 (선택)"
                   className="input mt-1"
+                  list="memo-suggestions"
+                  autoComplete="off"
                 />
+                <datalist id="memo-suggestions">
+                  {memoSuggestions.map((s) => (
+                    <option key={s.text} value={s.text}>
+                      {s.category_name || ''}
+                    </option>
+                  ))}
+                </datalist>
               </div>
 
               {/* Buttons */}
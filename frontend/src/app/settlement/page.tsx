@@ -9,6 +9,7 @@ import { useAuth } from '@/lib/auth';
 type Settlement = {
   month: string;
   total_shared_expense: number;
+  unsplit_shared_expense?: number;
   settlements: Array<{
     from_member_id: string;
     from_member_name: string;
@@ -110,6 +111,11 @@ export default function SettlementPage() {
               <p className="text-2xl font-bold text-gray-900">
                 {formatCurrency(settlement.total_shared_expense)}
               </p>
+              {!!settlement.unsplit_shared_expense && (
+                <p className="text-xs text-gray-400 mt-1">
+                  전 구성원/미지정 결제 {formatCurrency(settlement.unsplit_shared_expense)} 제외
+                </p>
+              )}
             </div>
 
             {/* Settlements */}
@@ -88,8 +88,15 @@ export const householdAPI = {
         user_name: string;
         user_email: string;
         role: string;
+        split_weight: number;
       }>
     >('/api/household/members'),
+
+  updateMember: (memberId: string, split_weight: number) =>
+    fetchAPI(`/api/household/members/${memberId}`, {
+      method: 'PATCH',
+      body: { split_weight },
+    }),
 };
 
 // Types for entries
@@ -174,34 +181,64 @@ export interface EntryListResponse {
   summary: EntrySummary;
 }
 
+export interface EntrySuggestion {
+  text: string;
+  kind: 'memo' | 'category';
+  count: number;
+  last_used: string | null;
+  category_id: string | null;
+  category_name: string | null;
+}
+
 // Entries API
+function entrySearchParams(params?: EntryListParams): URLSearchParams {
+  const searchParams = new URLSearchParams();
+  if (params?.month) searchParams.append('month', params.month);
+  if (params?.date_from) searchParams.append('date_from', params.date_from);
+  if (params?.date_to) searchParams.append('date_to', params.date_to);
+  if (params?.date_preset) searchParams.append('date_preset', params.date_preset);
+  if (params?.category_id) searchParams.append('category_id', params.category_id);
+  if (params?.category_ids?.length) searchParams.append('category_ids', params.category_ids.join(','));
+  if (params?.payer_member_id) searchParams.append('payer_member_id', params.payer_member_id);
+  if (params?.shared !== undefined) searchParams.append('shared', String(params.shared));
+  if (params?.type) searchParams.append('type', params.type);
+  if (params?.types?.length) searchParams.append('types', params.types.join(','));
+  if (params?.transfer_type) searchParams.append('transfer_type', params.transfer_type);
+  if (params?.account_ids?.length) searchParams.append('account_ids', params.account_ids.join(','));
+  if (params?.amount_min !== undefined) searchParams.append('amount_min', String(params.amount_min));
+  if (params?.amount_max !== undefined) searchParams.append('amount_max', String(params.amount_max));
+  if (params?.memo_search) searchParams.append('memo_search', params.memo_search);
+  if (params?.sort_by) searchParams.append('sort_by', params.sort_by);
+  if (params?.sort_order) searchParams.append('sort_order', params.sort_order);
+  if (params?.page) searchParams.append('page', String(params.page));
+  if (params?.page_size) searchParams.append('page_size', String(params.page_size));
+  return searchParams;
+}
+
 export const entriesAPI = {
   list: (params?: EntryListParams) => {
-    const searchParams = new URLSearchParams();
-    if (params?.month) searchParams.append('month', params.month);
-    if (params?.date_from) searchParams.append('date_from', params.date_from);
-    if (params?.date_to) searchParams.append('date_to', params.date_to);
-    if (params?.date_preset) searchParams.append('date_preset', params.date_preset);
-    if (params?.category_id) searchParams.append('category_id', params.category_id);
-    if (params?.category_ids?.length) searchParams.append('category_ids', params.category_ids.join(','));
-    if (params?.payer_member_id) searchParams.append('payer_member_id', params.payer_member_id);
-    if (params?.shared !== undefined) searchParams.append('shared', String(params.shared));
-    if (params?.type) searchParams.append('type', params.type);
-    if (params?.types?.length) searchParams.append('types', params.types.join(','));
-    if (params?.transfer_type) searchParams.append('transfer_type', params.transfer_type);
-    if (params?.account_ids?.length) searchParams.append('account_ids', params.account_ids.join(','));
-    if (params?.amount_min !== undefined) searchParams.append('amount_min', String(params.amount_min));
-    if (params?.amount_max !== undefined) searchParams.append('amount_max', String(params.amount_max));
-    if (params?.memo_search) searchParams.append('memo_search', params.memo_search);
-    if (params?.sort_by) searchParams.append('sort_by', params.sort_by);
-    if (params?.sort_order) searchParams.append('sort_order', params.sort_order);
-    if (params?.page) searchParams.append('page', String(params.page));
-    if (params?.page_size) searchParams.append('page_size', String(params.page_size));
-
-    const query = searchParams.toString();
+    const query = entrySearchParams(params).toString();
     return fetchAPI<EntryListResponse>(`/api/entries${query ? `?${query}` : ''}`);
   },
 
+  // 목록과 같은 필터로 전체 거래를 파일(Blob)로 내려받기
+  export: async (format: 'csv' | 'xlsx' | 'parquet', params?: EntryListParams) => {
+    const searchParams = entrySearchParams(params);
+    searchParams.delete('page');
+    searchParams.delete('page_size');
+    searchParams.append('format', format);
+
+    const token = typeof window !== 'undefined' ? localStorage.getItem('token') : null;
+    const response = await fetch(`${API_URL}/api/entries/export?${searchParams.toString()}`, {
+      headers: token ? { Authorization: `Bearer ${token}` } : {},
+    });
+    if (!response.ok) {
+      const error = await response.json().catch(() => ({}));
+      throw new Error(error.detail || 'Export failed');
+    }
+    return response.blob();
+  },
+
   create: (data: EntryCreateData) =>
     fetchAPI<Entry>('/api/entries', { method: 'POST', body: data }),
 
@@ -219,6 +256,9 @@ export const entriesAPI = {
 
   getCategories: () =>
     fetchAPI<Array<{ id: string; name: string; type: string; color?: string | null; icon?: string | null }>>('/api/entries/categories'),
+
+  suggest: (q: string, limit: number = 10) =>
+    fetchAPI<EntrySuggestion[]>(`/api/entries/suggest?q=${encodeURIComponent(q)}&limit=${limit}`),
 };
 
 // Account types
@@ -322,6 +362,7 @@ export interface MonthlySettlementRecord {
 export interface SettlementResponse {
   month: string;
   total_shared_expense: number;
+  unsplit_shared_expense: number;
   settlements: SettlementItem[];
   cumulative_settlements: CumulativeSettlement[];
   monthly_records: MonthlySettlementRecord[];
@@ -343,6 +384,21 @@ export const settlementAPI = {
       method: 'POST',
       body: { month },
     }),
+
+  reopen: (month: string) =>
+    fetchAPI(`/api/settlement/reopen`, {
+      method: 'POST',
+      body: { month },
+    }),
+
+  getRange: (from: string, to: string) =>
+    fetchAPI<SettlementResponse[]>(`/api/settlement/range?from=${from}&to=${to}`),
+
+  finalizeRange: (from_month: string, to_month: string) =>
+    fetchAPI(`/api/settlement/finalize-range`, {
+      method: 'POST',
+      body: { from_month, to_month },
+    }),
 };
 
 // CSV Import types
@@ -441,6 +497,7 @@ export interface ExternalDataSource {
 export interface SyncImportResponse {
   imported_count: number;
   updated_count: number;
+  deleted_count: number;
   skipped_count: number;
   last_synced_row: number;
 }